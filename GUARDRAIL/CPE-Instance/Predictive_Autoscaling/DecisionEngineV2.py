@@ -1,5 +1,9 @@
 import time
 
+import numpy as np
+
+from horizons import value_at
+
 class DecisionEngine:
     def __init__(self, cores_per_node=4.0, max_workers=2, min_workers=1):
         # Configuration
@@ -10,6 +14,7 @@ class DecisionEngine:
         # Cooldown Timers (Seconds)
         self.cooldown_out = 300  # 5 Mins
         self.cooldown_in = 300   # 5 Mins
+        self.provision_lead_time = 180  # join-node.sh รอ Ready ได้ถึง ~150 s + kubelet start -> เครื่องใหม่ใช้งานได้จริงหลัง ~3 Mins
 
         # State tracking
         self.last_scale_out_time = 0
@@ -21,61 +26,84 @@ class DecisionEngine:
         self.safe_cpu_percent = 80.0   # Block scale-in if current cluster CPU > 80%
 
     #  จุดที่ 1: เติม current_cpu_req เข้ามาในวงเล็บ
-    def decide(self, predicted_cores, current_workers, pending_pods, current_cpu_usage, current_cpu_req):
+    # forecaster: ที่มาของ predicted_cores ('lstm' หรือ fallback เช่น 'holt' เมื่อโมเดลไม่ทัน deadline) -> ติดไว้ใน reason
+    # predicted_upper_cores: ขอบบนจาก MC-dropout (ถ้ามี) -> ขาขึ้นใช้ขอบบน (เปิดเครื่องก่อนถ้าไม่แน่ใจ) ขาลงยังใช้ค่าเฉลี่ย
+    # predicted_by_horizon: {นาที: Cores} จากโมเดล multi-horizon -> ขาขึ้นดู demand ตอนเครื่องใหม่พร้อม (lead time) และตอนหมด cooldown
+    #                       ขาลงต้องปลอดภัยทุก horizon จนหมด cooldown_in (ลดเครื่องแล้วเพิ่มกลับไม่ได้ทันที)
+    # in_flight_workers: งาน join / kick ที่ ActuationWorker ยังทำไม่เสร็จ (+ กำลังเข้า, - กำลังออก)
+    #                    -> คิด capacity จากจำนวนเครื่องหลังงานเสร็จ ไม่สั่งซ้ำ และไม่สั่งสวนทิศงานที่ค้างอยู่
+    def decide(self, predicted_cores, current_workers, pending_pods, current_cpu_usage, current_cpu_req, forecaster='lstm',
+               predicted_upper_cores=None, predicted_by_horizon=None, in_flight_workers=0):
         current_time = time.time()
-        current_total_cores = current_workers * self.cores_per_node
+        source = "AI" if forecaster == 'lstm' else f"Fallback:{forecaster}"
+        planned_workers = current_workers + in_flight_workers
+        current_total_cores = planned_workers * self.cores_per_node
         
         intent = "DO_NOTHING"
         reason = "System is stable"
 
         # 1. LOGIC PHASE (ตัดสินใจว่าจะทำอะไร)
 
-        # Guardrail 1: Sanity Check
-        if predicted_cores < 0 or predicted_cores > (self.max_workers * self.cores_per_node * 2):
+        # Guardrail 1: Sanity Check (NaN / inf จาก window ที่มีช่องว่างไม่ผ่านการเปรียบเทียบ < / > ต้องเช็คแยก)
+        if not np.isfinite(predicted_cores) or predicted_cores < 0 or predicted_cores > (self.max_workers * self.cores_per_node * 2):
             return "DO_NOTHING", f"Sanity Check Failed: Abnormal prediction ({predicted_cores:.2f} cores)"
 
         # Guardrail 2: Reactive Emergency
-        if pending_pods > 0:
+        if pending_pods > 0 and in_flight_workers > 0:
+            reason = f"[In-Flight] {in_flight_workers} node(s) joining for {pending_pods} Pending Pods"
+        elif pending_pods > 0:
             intent = "SCALE_OUT"
             reason = f"[Emergency] Detected {pending_pods} Pending Pods"
         else:
             # Predictive Logic
             scale_out_threshold = current_total_cores * self.scale_out_percent
-            cores_after_scale_in = (current_workers - 1) * self.cores_per_node
+            cores_after_scale_in = (planned_workers - 1) * self.cores_per_node
             scale_in_threshold = cores_after_scale_in * self.scale_in_percent
 
+            predicted_in = predicted_cores
+            if predicted_by_horizon:
+                lead_cores = value_at(predicted_by_horizon, self.provision_lead_time / 60)
+                hold_cores = value_at(predicted_by_horizon, self.cooldown_out / 60)
+                until_cooldown = [v for h, v in predicted_by_horizon.items() if h <= self.cooldown_in / 60]
+                predicted_in = max(until_cooldown) if until_cooldown else predicted_cores
+
             # ขาขึ้น: เชื่อ AI อย่างเดียว รีบเปิดเครื่องดักไว้เลย
             if predicted_cores > scale_out_threshold:
                 intent = "SCALE_OUT"
-                reason = f"[AI] Need {predicted_cores:.2f} Cores (> {scale_out_threshold:.2f} limit)"
+                reason = f"[{source}] Need {predicted_cores:.2f} Cores (> {scale_out_threshold:.2f} limit)"
+            elif predicted_upper_cores is not None and predicted_upper_cores > scale_out_threshold:
+                intent = "SCALE_OUT"
+                reason = f"[{source} Upper] Need up to {predicted_upper_cores:.2f} Cores (mean {predicted_cores:.2f}, > {scale_out_threshold:.2f} limit)"
+            elif predicted_by_horizon and max(lead_cores, hold_cores) > scale_out_threshold:
+                intent = "SCALE_OUT"
+                reason = (f"[{source} Horizon] Need {lead_cores:.2f} Cores at lead time (+{self.provision_lead_time // 60}m) / "
+                          f"{hold_cores:.2f} at cooldown (+{self.cooldown_out // 60}m) (> {scale_out_threshold:.2f} limit)")
             
             # จุดที่ 2: ขาลง (เพิ่ม Asymmetric Logic เช็คโลกความเป็นจริง)
-            elif predicted_cores < scale_in_threshold:
+            elif predicted_in < scale_in_threshold:
                 
                 # ถ้าโลกความจริงปัจจุบัน คิวยังแน่นอยู่ (มากกว่า Threshold ที่จะลดเครื่อง)
                 if current_cpu_req >= scale_in_threshold:
                     intent = "DO_NOTHING"
-                    reason = f"[Wait] AI Predicts {predicted_cores:.2f}, but Current Req is still high ({current_cpu_req:.2f} >= {scale_in_threshold:.2f})"
+                    reason = f"[Wait] {source} Predicts {predicted_in:.2f}, but Current Req is still high ({current_cpu_req:.2f} >= {scale_in_threshold:.2f})"
                 
                 # ถ้าปลอดภัยทั้ง AI (อนาคต) และ โลกจริง (ปัจจุบัน)
                 else:
                     intent = "SCALE_IN"
-                    reason = f"[Safe Scale-In] Predict ({predicted_cores:.2f}) & Current ({current_cpu_req:.2f}) are safe for {current_workers-1} nodes"
+                    reason = f"[Safe Scale-In] Predict ({predicted_in:.2f}) & Current ({current_cpu_req:.2f}) are safe for {planned_workers-1} nodes"
 
         # 2. EXECUTION PHASE (ตรวจสอบว่าทำได้จริงไหม)
         
         if intent == "SCALE_OUT":
-            if current_workers >= self.max_workers:
-                return "DO_NOTHING", f"Blocked: Max Workers ({self.max_workers}) Reached"
-            if (current_time - self.last_scale_out_time) < self.cooldown_out:
-                return "DO_NOTHING", f"Wait: Scale-Out Cooldown Active"
-            
-            self.last_scale_out_time = current_time
-            return "SCALE_OUT", reason
+            return self._gate_scale_out(reason, planned_workers, in_flight_workers, current_time)
 
         elif intent == "SCALE_IN":
-            if current_workers <= self.min_workers:
+            if in_flight_workers > 0:
+                return "DO_NOTHING", f"Wait: {in_flight_workers} node(s) still joining"
+            if planned_workers <= self.min_workers:
                 return "DO_NOTHING", f"Blocked: Min Workers ({self.min_workers}) Reached"
+            if current_cpu_usage is None:
+                return "DO_NOTHING", f"Guardrail: Current CPU unknown (metrics unavailable)"
             if current_cpu_usage > self.safe_cpu_percent:
                 return "DO_NOTHING", f"Guardrail: Current CPU too high ({current_cpu_usage:.1f}%)"
             if (current_time - self.last_scale_in_time) < self.cooldown_in:
@@ -87,3 +115,24 @@ class DecisionEngine:
             return "SCALE_IN", reason
 
         return intent, reason
+
+    # ⚡ Fast path: เรียกจาก PendingTrigger ทันทีที่มี Pod ติด Unschedulable (ไม่ต้องรอ tick ถัดไป)
+    # ใช้แค่ Guardrail 2 (Reactive Emergency) ผ่านด่าน max workers / in-flight / cooldown เดียวกับ decide()
+    def decide_reactive(self, current_workers, pending_pods, in_flight_workers=0):
+        if pending_pods <= 0:
+            return "DO_NOTHING", "[Fast Path] No Pending Pods left"
+        if in_flight_workers > 0:
+            return "DO_NOTHING", f"[In-Flight] {in_flight_workers} node(s) joining for {pending_pods} Pending Pods"
+        reason = f"[Emergency Fast Path] Detected {pending_pods} Pending Pods"
+        return self._gate_scale_out(reason, current_workers + in_flight_workers, in_flight_workers, time.time())
+
+    def _gate_scale_out(self, reason, planned_workers, in_flight_workers, current_time):
+        if in_flight_workers < 0:
+            return "DO_NOTHING", f"Wait: {-in_flight_workers} node(s) still draining"
+        if planned_workers >= self.max_workers:
+            return "DO_NOTHING", f"Blocked: Max Workers ({self.max_workers}) Reached"
+        if (current_time - self.last_scale_out_time) < self.cooldown_out:
+            return "DO_NOTHING", f"Wait: Scale-Out Cooldown Active"
+
+        self.last_scale_out_time = current_time
+        return "SCALE_OUT", reason
@@ -1,6 +1,5 @@
 import time
 import datetime
-import subprocess
 import numpy as np
 import joblib
 import warnings  
@@ -9,6 +8,7 @@ from tensorflow.keras.models import load_model
 # นำเข้าคลาสที่เราเขียนไว้
 from DecisionEngineV2 import DecisionEngine
 from node_manager import NodeManager
+from cluster_snapshot import fetch_cluster_snapshot
 
 warnings.filterwarnings("ignore", category=UserWarning, module='sklearn')
 
@@ -19,126 +19,21 @@ MODEL_PATH = 'best_single_var_model.keras'  # โมเดลตัวใหม
 SCALER_PATH = 'scaler.pkl'                  # Scaler ตัวใหม่
 WINDOW_SIZE = 30                            # ต้องตรงกับตอนเทรน (ถ้าเทรน 30 ให้ใส่ 30)
 
-NODES = {
-    'master': 'aj-aung-k8s-master',
-    'worker1': 'aj-aung-k8s-worker1',
-    'worker2': 'aj-aung-k8s-worker2'
-}
-
 AVAILABLE_WORKERS = ["10.35.29.109", "10.35.29.110"] # IP ของ Worker1, Worker2
 
 # ==========================================
 # 2. 🛠️ HELPER FUNCTIONS (ดึงข้อมูล K8s)
 # ==========================================
-def parse_k8s_value(value_str):
-    """ แปลงค่าจาก K8s เป็นหน่วย Cores """
-    if not value_str: return 0.0
-    value_str = str(value_str).strip()
-    try:
-        if value_str.endswith('m'):
-            return float(value_str.replace('m', '')) / 1000.0
-        return float(value_str)
-    except:
-        return 0.0
-
-def run_cmd(cmd):
-    try:
-        return subprocess.check_output(cmd, shell=True, stderr=subprocess.DEVNULL).decode('utf-8').strip()
-    except:
-        return ""
-
 def fetch_realtime_data():
-    total_cpu_req = 0.0
-    
-    # --- ตัวแปรใหม่ เอาไว้คิด % เฉพาะฝั่ง Worker ---
-    worker_cpu_usage = 0.0
-    worker_cpu_cap = 0.0
-    active_workers = 0
-
-    for key, node in NODES.items():
-        status_out = run_cmd(f"kubectl get node {node} --no-headers | awk '{{print $2}}'")
-        if "Ready" in status_out:
-            
-            # 1. ดึง CPU Request รวมทั้งหมด (เอาไว้ส่งให้ AI)
-            out_req = run_cmd(f"kubectl describe node {node} | grep -A 5 'Allocated resources' | tail -n 2")
-            try:
-                cpu_req = parse_k8s_value(out_req.splitlines()[0].split()[1])
-                total_cpu_req += cpu_req
-            except: pass
-
-            # 2. กรองเอาเฉพาะ Worker มาคิด % การใช้งานจริง
-            if key.startswith('worker'):
-                active_workers += 1
-                
-                # เก็บ Capacity ของ Worker
-                out_cap = run_cmd(f"kubectl get node {node} -o jsonpath='{{.status.capacity.cpu}}'")
-                worker_cpu_cap += parse_k8s_value(out_cap)
-
-                # เก็บ Usage ของ Worker
-                out_usage = run_cmd(f"kubectl top node {node} --no-headers | awk '{{print $2}}'")
-                worker_cpu_usage += parse_k8s_value(out_usage)
-
-    # 3. คำนวณ % CPU Usage ปัจจุบัน (Guardrail ขาลง) จาก Worker ล้วนๆ!
-    current_cpu_percent = 0.0
-    if worker_cpu_cap > 0:
-        current_cpu_percent = (worker_cpu_usage / worker_cpu_cap) * 100
-
-    # 4. นับจำนวน Pending Pods
-    pending_count = 0
-    try:
-        pending_cmd = "kubectl get pods -A --field-selector=status.phase=Pending --no-headers | wc -l"
-        pending_count = int(run_cmd(pending_cmd))
-    except: pass
-
-    return total_cpu_req, active_workers, pending_count, current_cpu_percent
     """ 
-    ดึงข้อมูล 4 อย่างที่ระบบต้องการ:
+    ดึงข้อมูล 4 อย่างที่ระบบต้องการ (nodes list + pods list ผ่าน KubeClient):
     1. total_cpu_req (ส่งให้ AI)
     2. current_workers (ส่งให้ DecisionEngine)
     3. pending_pods (ส่งให้ DecisionEngine)
     4. current_cpu_usage (ส่งให้ DecisionEngine)
     """
-    total_cpu_req = 0.0
-    total_cpu_usage = 0.0
-    total_cpu_cap = 0.0
-    active_workers = 0
-
-    # 1. วนลูปเช็คทีละ Node
-    for key, node in NODES.items():
-        # เช็คว่า Node นี้เปิดอยู่ไหม? (ดูจาก Status Ready)
-        status_out = run_cmd(f"kubectl get node {node} --no-headers | awk '{{print $2}}'")
-        if "Ready" in status_out:
-            if key.startswith('worker'):
-                active_workers += 1
-
-            # ดึง Cap (Capacity)
-            out_cap = run_cmd(f"kubectl get node {node} -o jsonpath='{{.status.capacity.cpu}}'")
-            total_cpu_cap += parse_k8s_value(out_cap)
-
-            # ดึง Req (CPU Requests) - ตัวแปรสำคัญสำหรับ AI !
-            out_req = run_cmd(f"kubectl describe node {node} | grep -A 5 'Allocated resources' | tail -n 2")
-            try:
-                cpu_req = parse_k8s_value(out_req.splitlines()[0].split()[1])
-                total_cpu_req += cpu_req
-            except: pass
-
-            # ดึง Usage (CPU ที่ใช้จริงตอนนี้)
-            out_usage = run_cmd(f"kubectl top node {node} --no-headers | awk '{{print $2}}'")
-            total_cpu_usage += parse_k8s_value(out_usage)
-
-    # 2. คำนวณ % CPU Usage ปัจจุบัน (Guardrail ขาลง)
-    current_cpu_percent = 0.0
-    if total_cpu_cap > 0:
-        current_cpu_percent = (total_cpu_usage / total_cpu_cap) * 100
-
-    # 3. นับจำนวน Pending Pods
-    pending_count = 0
-    try:
-        pending_cmd = "kubectl get pods -A --field-selector=status.phase=Pending --no-headers | wc -l"
-        pending_count = int(run_cmd(pending_cmd))
-    except: pass
-
-    return total_cpu_req, active_workers, pending_count, current_cpu_percent
+    snap = fetch_cluster_snapshot()
+    return snap.cpu_req, snap.active_workers, snap.pending, snap.cpu_usage_pct
 
 # ==========================================
 # 3. 🚀 MAIN SYSTEM LOOP
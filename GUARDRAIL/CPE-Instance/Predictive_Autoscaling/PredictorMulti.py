@@ -1,121 +1,74 @@
 import time
+STARTUP_T0 = time.perf_counter()   # จับเวลาตั้งแต่ก่อน import (รายงาน import time / time-to-first-decision)
 import datetime
-import subprocess
-import numpy as np
-import joblib
-import warnings  
 import csv  
 import os   
-from tensorflow.keras.models import load_model
 
 # นำเข้าคลาสสมองกลและระบบจัดการ Node ของคุณ
 from DecisionEngineV2 import DecisionEngine
 from node_manager import NodeManager
+from async_collector import AsyncCollector
+from cluster_informer import ClusterInformer, KubeWatchSource
+from cluster_snapshot import POD_NAMESPACE
+from prometheus_source import PrometheusFeatureSource
+from feature_ring import FeatureRing, RingFeatureSource, RING_PATH
+from history_window import HistoryWindow
+from history_checkpoint import HistoryCheckpoint
+from model_runner import load_runner
+from prediction_cache import PredictionCache
+from fallback_forecaster import DeadlineForecaster
+from model_bundle import load_bundle
+from horizons import load_horizons
+from affine_scaler import load_scaler
+from loop_scheduler import FixedRateScheduler
+from actuation_worker import ActuationWorker
+from pending_trigger import PendingTrigger, PENDING_DEBOUNCE
+from adaptive_sampler import AdaptiveInterval, MinuteResampler, INTERVALS
+from minute_aggregator import MinuteAggregator, BASE_FEATURES, SUB_MINUTE_INTERVAL, is_aggregate, load_feature_columns
 
-warnings.filterwarnings("ignore", category=UserWarning, module='sklearn')
+IMPORT_SECONDS = time.perf_counter() - STARTUP_T0
 
 
 # 1.  CONFIGURATION (MULTI-VARIABLE VERSION)
 
 # ใส่ Path ของ Model และ Scaler ตัวใหม่ของคุณตรงนี้
-MODEL_PATH = 'Multi_Feature_Resource/Best_Multi_Var_Model.keras'
+MODEL_PATH = 'Multi_Feature_Resource/Best_Multi_Var_Model.keras'   # หรือ student จาก distill_model.py เช่น 'Multi_Feature_Resource_Turn_Parameter/students/student_gru32.keras' | multi-horizon จาก train_multi_horizon.py: 'Multi_Feature_Resource_Turn_Parameter/Multi-Horizon_LSTM_Model.keras'
 SCALER_INPUTS_PATH = 'Multi_Feature_Resource/Multi-Var_Scaler_Inputs.pkl'
 SCALER_TARGET_PATH = 'Multi_Feature_Resource/Multi-Var_Scaler_Target.pkl'
+MODEL_BUNDLE = None   # ⚡ fast-start: bundle จาก model_bundle.py (เช่น 'Multi_Feature_Resource/multi_var.bundle') ใช้แทน 3 ไฟล์ข้างบน ไม่ต้อง unpickle / import sklearn (คู่กับ MODEL_BACKEND = 'numpy')
 
 WINDOW_SIZE = 30
 LOG_FILE = 'autoscaler_multi_log.csv' 
-LOOP_INTERVAL = 60 
+HISTORY_CHECKPOINT = 'autoscaler_multi_history.ckpt'   # feature ดิบของแต่ละ tick -> restart แล้วทำนายได้ทันทีไม่ต้องรอสะสม 30 นาทีใหม่
+LOOP_INTERVAL = 60   # คาบคงที่ของ loop (deadline = เริ่ม + n * LOOP_INTERVAL บน monotonic clock ไม่บวกเวลาทำงาน)
+JITTER_REPORT_EVERY = 3600   # วินาที: พิมพ์ jitter histogram ของ loop ทุกชั่วโมง (ไม่ขึ้นกับคาบ tick ที่ adaptive / aggregate เปลี่ยน)
+ADAPTIVE_SAMPLING = True   # CPU Req / Pending ผันผวน -> เก็บข้อมูล+ตัดสินใจถี่ขึ้น (INTERVALS ใน adaptive_sampler.py) | นิ่ง -> กลับเป็น LOOP_INTERVAL
+MODEL_BACKEND = 'keras'   # 'keras' = TensorFlow (traced + warm-up) | 'numpy' = NumPy ล้วน (numpy_lstm.py) | 'onnx' / 'tflite' = ไฟล์จาก convert_model.py | 'tflite-dynamic' / 'tflite-int8' = quantize_model.py
+PREDICTION_CACHE = True   # ช่วงที่ window นิ่ง (COOLDOWN HOLD / กลางคืน) ใช้ผลทำนายเดิม ไม่รันโมเดลซ้ำ
+INFERENCE_DEADLINE = 2.0   # วินาที: โมเดลตอบไม่ทัน (GC / CPU แย่งกัน / build graph รอบแรก) -> ใช้ FALLBACK_FORECASTER แทน
+FALLBACK_FORECASTER = 'holt'   # 'holt' | 'ewma' | 'linear' บน CPU Req ใน window เดียวกัน
+MC_SAMPLES = 0   # >0 = MC-dropout: รัน K forward pass แบบเปิด Dropout ใน batch เดียว ได้ค่าเฉลี่ย + ขอบบน (เฉพาะ backend 'keras' / 'numpy')
+UPPER_QUANTILE = 0.9   # ขอบบนที่ DecisionEngine ใช้ตัดสินใจ scale-out
+CACHE_TOLERANCE = 1e-4   # หน่วย scaled: window ที่ต่างกันไม่เกินนี้ถือว่าเหมือนกัน (0 = ต้องตรงทุก byte)
+FEATURE_SOURCE = 'kubernetes'   # 'kubernetes' = API Server | 'prometheus' = PromQL ชุดเดียวกับตอนเทรน | 'ring' = อ่านจาก collector daemon (feature_ring.py)
+PROMETHEUS_URL = "http://10.35.29.108:31102"
+USE_INFORMER = True   # True = อ่านจาก watch cache (O(1) ต่อรอบ) | False = list ทั้ง Cluster ใหม่ทุกรอบ
+PENDING_FAST_PATH = True   # ⚡ ต้องใช้ Informer: Pod ติด Unschedulable -> ปลุก loop เข้า Reactive Emergency ทันที (~1 วิ) ไม่รอ tick ถัดไป
 
-NODES = {
-    'master': 'aj-aung-k8s-master',
-    'worker1': 'aj-aung-k8s-worker1',
-    'worker2': 'aj-aung-k8s-worker2'
-}
 AVAILABLE_WORKERS = ["10.35.29.109", "10.35.29.110"]
 
 # 2.  HELPER FUNCTIONS
 
-def parse_k8s_value(value_str):
-    if not value_str: return 0.0
-    value_str = str(value_str).strip()
-    try:
-        if value_str.endswith('m'):
-            return float(value_str.replace('m', '')) / 1000.0
-        elif value_str.endswith('Ki'):
-            return float(value_str.replace('Ki', '')) / (1024.0 * 1024.0) # แปลง KiB เป็น GB
-        elif value_str.endswith('Mi'):
-            return float(value_str.replace('Mi', '')) / 1024.0 # แปลง MiB เป็น GB
-        elif value_str.endswith('Gi'):
-            return float(value_str.replace('Gi', ''))
-        return float(value_str)
-    except:
-        return 0.0
-
-def run_cmd(cmd):
-    try: return subprocess.check_output(cmd, shell=True, stderr=subprocess.DEVNULL).decode('utf-8').strip()
-    except: return ""
-
-# 🌟 ฟังก์ชันดึงข้อมูลดัดแปลงใหม่ให้ดึง Memory และดึงเฉพาะ Worker รวมกัน
+# 🌟 ดึงข้อมูลจาก collector (API Server: nodes/pods/metrics พร้อมกันมี deadline | Prometheus: query เดียว)
 def fetch_realtime_data_multivar():
-    cluster_cpu_req = 0.0
-    cluster_cpu_cap = 0.0
-    cluster_mem_req = 0.0
-    cluster_mem_cap = 0.0
-    
-    active_workers = 0
-    worker_cpu_usage = 0.0 # ไว้ใช้คำนวณ % ป้อนให้ Decision Engine
-    
-    for key, node in NODES.items():
-        # กรองเฉพาะ Worker (ตามที่เทรนโมเดลมา)
-        if key.startswith('worker'):
-            status_out = run_cmd(f"kubectl get node {node} --no-headers | awk '{{print $2}}'")
-            if "Ready" in status_out and "NotReady" not in status_out:
-                active_workers += 1
-                
-                # 1. ดึง CPU & Mem Request
-                out_req = run_cmd(f"kubectl describe node {node} | grep -A 5 'Allocated resources'")
-                lines = out_req.splitlines()
-                if len(lines) >= 3:
-                    try:
-                        # สมมติบรรทัดแรกหลัง header คือ CPU, บรรทัดที่สองคือ Memory
-                        cpu_req_str = lines[1].split()[1]
-                        mem_req_str = lines[2].split()[1]
-                        cluster_cpu_req += parse_k8s_value(cpu_req_str)
-                        cluster_mem_req += parse_k8s_value(mem_req_str)
-                    except: pass
-                
-                # 2. ดึง CPU & Mem Capacity
-                out_cap_cpu = run_cmd(f"kubectl get node {node} -o jsonpath='{{.status.capacity.cpu}}'")
-                out_cap_mem = run_cmd(f"kubectl get node {node} -o jsonpath='{{.status.capacity.memory}}'")
-                cluster_cpu_cap += parse_k8s_value(out_cap_cpu)
-                cluster_mem_cap += parse_k8s_value(out_cap_mem)
-                
-                # ดึง CPU Usage จริง (สำหรับ Guardrail)
-                out_usage = run_cmd(f"kubectl top node {node} --no-headers | awk '{{print $2}}'")
-                worker_cpu_usage += parse_k8s_value(out_usage)
-
-    # คำนวณ % CPU รวมของ Worker ทั้งหมด
-    current_cpu_percent = 0.0
-    if cluster_cpu_cap > 0:
-        current_cpu_percent = (worker_cpu_usage / cluster_cpu_cap) * 100
-
-    # 3. ดึง Pending Pods
-    pending_count = 0
-    try:
-        pending_cmd = "kubectl get pods -A --field-selector=status.phase=Pending --no-headers | wc -l"
-        pending_count = int(run_cmd(pending_cmd))
-    except: pass
+    sample = collector.collect_sync()
+    if sample.errors:
+        print(f"\n⚠️ [Collector] {sample.errors} -> ใช้ค่าเก่า: {', '.join(sample.stale_fields())}")
+    snap = sample.snapshot
 
-    # ดึง Running Pods (ไว้ดู Log)
-    running_count = 0
-    try:
-        running_cmd = "kubectl get pods -A --field-selector=status.phase=Running --no-headers | wc -l"
-        running_count = int(run_cmd(running_cmd))
-    except: pass
-
-    # คืนค่า 5 ตัวแปรสำหรับ AI + ตัวแปรสำหรับ Decision Engine
-    return (cluster_cpu_req, cluster_cpu_cap, cluster_mem_req, cluster_mem_cap, pending_count), \
-           active_workers, current_cpu_percent, running_count
+    # คืนค่า 5 ตัวแปรสำหรับ AI (None = ยังไม่เคยดึงได้เลย) + ตัวแปรสำหรับ Decision Engine
+    ai_features = snap.ai_features() if sample.has_ai_features() else None
+    return ai_features, snap.active_workers, snap.cpu_usage_pct, snap.running
 
 #  2.5 ระบบจัดการ LOG
 
@@ -126,7 +79,7 @@ def init_logger():
             writer.writerow([
                 "Timestamp", "Workers", "CPU_Usage_%", "Running_Pods", "Pending_Pods", 
                 "CPU_Req", "CPU_Cap", "Mem_Req", "Mem_Cap",
-                "Predicted_CPU_Req", "Action", "Reason"
+                "Predicted_CPU_Req", "Action", "Reason", "Forecaster", "Predicted_Upper"
             ])
 
 
@@ -138,57 +91,178 @@ print("="*55)
 
 print("⏳ กำลังโหลดโมเดล Multi-Var AI และ Scalers...")
 try:
-    model = load_model(MODEL_PATH, compile=False)
-    scaler_inputs = joblib.load(SCALER_INPUTS_PATH)
-    scaler_target = joblib.load(SCALER_TARGET_PATH)
+    load_started = time.perf_counter()
+    if MODEL_BUNDLE:
+        # WINDOW_SIZE / ลำดับ feature / horizon มาจาก metadata ของ bundle
+        bundle = load_bundle(MODEL_BUNDLE, MODEL_BACKEND)
+        model, scaler_inputs, scaler_target = bundle.model, bundle.scaler_inputs, bundle.scaler_target
+        WINDOW_SIZE = bundle.window_size
+        model_horizons = bundle.horizons
+        feature_columns = bundle.features
+    else:
+        model = load_runner(MODEL_PATH, MODEL_BACKEND)
+        model_horizons = load_horizons(MODEL_PATH)   # (1, 2, 3, 5, 10, 15) ถ้าเป็นโมเดล multi-horizon | None = ทำนาย +5 นาทีค่าเดียว
+        scaler_inputs = load_scaler(SCALER_INPUTS_PATH)   # .affine.json ที่ compile จาก .pkl (ไม่ import sklearn ตอน serving)
+        scaler_target = load_scaler(SCALER_TARGET_PATH)
+        feature_columns = load_feature_columns(MODEL_PATH) or list(BASE_FEATURES)   # โมเดลจาก train_aggregate_model.py มี .features.json
+    # 📈 โมเดลที่มีคอลัมน์ min/mean/max ต่อนาที -> เก็บทุก SUB_MINUTE_INTERVAL วิ แล้วรวมเป็นแถวละนาที (ทำนายยังนาทีละครั้ง)
+    AGGREGATE_MODE = is_aggregate(feature_columns)
+    if AGGREGATE_MODE and FEATURE_SOURCE == 'ring':
+        raise ValueError("โมเดล aggregate ใช้กับ FEATURE_SOURCE = 'ring' ไม่ได้ (collector daemon เก็บแค่ 5 feature ต่อนาที)")
+    if PREDICTION_CACHE:
+        model = PredictionCache(model, tolerance=CACHE_TOLERANCE)
+    load_seconds = time.perf_counter() - load_started
     
     decision_engine = DecisionEngine(cores_per_node=4.0, max_workers=2, min_workers=1)
     node_bot = NodeManager()
+    actuator = ActuationWorker(node_bot)   # join / kick รันเบื้องหลัง loop ไม่หยุดเก็บข้อมูลระหว่าง scale
+    pending_trigger = None
+
+    if FEATURE_SOURCE == 'prometheus':
+        collector = PrometheusFeatureSource(PROMETHEUS_URL)
+    elif FEATURE_SOURCE == 'ring':
+        collector = RingFeatureSource(FeatureRing.open(RING_PATH))
+    else:
+        informer = None
+        if USE_INFORMER:
+            pending_trigger = PendingTrigger(PENDING_DEBOUNCE) if PENDING_FAST_PATH else None
+            informer = ClusterInformer(KubeWatchSource(), namespace=POD_NAMESPACE,
+                                       on_unschedulable=pending_trigger and pending_trigger.notify).start()
+            if not informer.wait_synced(timeout=30):
+                print("⚠️ Informer ยัง sync ไม่เสร็จ (จะอัปเดตต่อเบื้องหลัง)")
+        collector = AsyncCollector(namespace=POD_NAMESPACE, informer=informer)
     
     init_logger() 
-    print("✅ โหลดระบบ 5-Dimension AI สำเร็จ!")
+    forecaster = DeadlineForecaster(model, lambda v: scaler_target.inverse_column(v, 0), FALLBACK_FORECASTER, INFERENCE_DEADLINE,
+                                    mc_samples=MC_SAMPLES, quantile=UPPER_QUANTILE, horizons=model_horizons)
+    print(f"✅ โหลดระบบ {len(feature_columns)}-Dimension AI สำเร็จ!" + (f" (aggregate: เก็บทุก {SUB_MINUTE_INTERVAL} วิ)" if AGGREGATE_MODE else ""))
+    print(f"⏱️ [Startup] import {IMPORT_SECONDS:.2f}s | โหลดโมเดล+scaler {load_seconds:.2f}s ({'bundle' if MODEL_BUNDLE else 'affine scaler'}, backend={MODEL_BACKEND})")
 except Exception as e:
     print(f"❌ Error ตอนโหลดไฟล์: {e}")
     exit()
 
-history_buffer = [] # จะเก็บ List ของ 5 ตัวแปร
-print(f"🚀 เริ่มต้น Monitor... (หน่วงเวลา {LOOP_INTERVAL} วิ)\n")
+history_buffer = HistoryWindow(WINDOW_SIZE, len(feature_columns), scaler=scaler_inputs) # เก็บทุกคอลัมน์ของโมเดลที่ scale แล้ว
+
+# ♻️ โหลดประวัติจาก checkpoint (เฉพาะช่วงต่อเนื่องล่าสุดที่ต่อกับปัจจุบันได้)
+checkpoint = HistoryCheckpoint(HISTORY_CHECKPOINT, n_features=len(feature_columns), window_size=WINDOW_SIZE)
+history_end = None   # เวลาของแถวสุดท้ายในประวัติที่กู้ / backfill มา -> grid ของ sample สดต่อจากจุดนี้ (ห่าง 1 นาทีพอดี)
+if FEATURE_SOURCE != 'ring':
+    restored_times, restored_rows = checkpoint.recent(LOOP_INTERVAL)
+    history_buffer.extend(restored_rows)
+    if len(restored_rows):
+        history_end = restored_times[-1]
+        print(f"♻️ [Checkpoint] กู้ประวัติ {len(restored_rows)}/{WINDOW_SIZE} นาทีจาก {HISTORY_CHECKPOINT}")
+    else:
+        # 🔥 WARM START: ไม่มี checkpoint -> ดึงประวัติจริงย้อนหลังจาก Prometheus (query_range) แทนการรอ 30 นาที
+        try:
+            backfill_source = collector if FEATURE_SOURCE == 'prometheus' else PrometheusFeatureSource(PROMETHEUS_URL)
+            backfill_times, backfill_rows = backfill_source.backfill(WINDOW_SIZE, features=tuple(feature_columns), step=LOOP_INTERVAL)
+            history_buffer.extend(backfill_rows)
+            for ts, row in zip(backfill_times, backfill_rows):
+                checkpoint.append(row, timestamp=ts)
+            if len(backfill_times):
+                history_end = backfill_times[-1]   # ปลายนาทีล่าสุด (now // step * step) -> grid ของ sample สดต่อจากตรงนี้
+            print(f"⚡ [WARM START] ดึงประวัติจาก Prometheus {len(backfill_rows)}/{WINDOW_SIZE} นาที")
+        except Exception as e:
+            print(f"⚠️ Warm Start ล้มเหลว: {e} (จะกลับไปรอสะสมข้อมูลปกติ)")
+first_decision_reported = False
+grid_start = None if history_end is None else history_end + LOOP_INTERVAL
+if AGGREGATE_MODE:
+    scheduler = FixedRateScheduler(SUB_MINUTE_INTERVAL)   # คาบคงที่ ต้องตรงกับ subquery [1m:10s] ตอนเทรน (ไม่ใช้ adaptive sampling)
+    sampler = None
+    resampler = MinuteAggregator(feature_columns, step=LOOP_INTERVAL, start=grid_start)   # min/mean/max ต่อนาทีแบบ streaming ไม่เก็บ sample
+else:
+    scheduler = FixedRateScheduler(LOOP_INTERVAL)
+    sampler = AdaptiveInterval(INTERVALS) if ADAPTIVE_SAMPLING else None
+    resampler = MinuteResampler(step=LOOP_INTERVAL, start=grid_start)   # sample ถี่แค่ไหน history / checkpoint ก็ยัง 1 แถวต่อนาที
+if grid_start is not None:
+    scheduler.align(grid_start)   # tick ลงจุด grid เดียวกับประวัติเดิม (tick แรกยังเริ่มทันที)
+print(f"🚀 เริ่มต้น Monitor... (ทุก {scheduler.interval} วิ แบบ fixed-rate)\n")
+last_jitter_report = time.monotonic()
 
 while True:
     try:
+        tick = scheduler.wait(wake=pending_trigger and pending_trigger.wait)   # ⏱️ รอ deadline ถัดไป (รอบที่ทำงานเกินคาบ -> ข้าม tick ที่พลาด ไม่ยืดคาบ)
+        if tick.skipped or tick.late:
+            print(f"\n⏱️ [Scheduler] tick #{tick.index} ช้า {tick.lateness:.1f}s | ข้าม {tick.skipped} tick")
+        if not tick.woken and time.monotonic() - last_jitter_report >= JITTER_REPORT_EVERY:
+            print(f"\n⏱️ [Jitter] {scheduler.report()}")
+            last_jitter_report = time.monotonic()
+        for op in actuator.completed():
+            print(f"\n{'✅' if op.ok else '❌'} [ACTUATOR] {op.action} {op.target_ip} เสร็จใน {op.finished - op.submitted:.0f}s" + (f" ({op.error})" if op.error else ""))
+
+        if tick.woken:
+            # ⚡ FAST PATH: Pod เพิ่งติด Unschedulable -> Reactive Emergency จาก watch cache ทันที (ไม่เก็บเข้าประวัติ AI, grid 1 นาทีเดิม)
+            snap = informer.snapshot()
+            in_flight_workers = actuator.in_flight_workers()
+            action, reason = decision_engine.decide_reactive(snap.active_workers, snap.pending, in_flight_workers)
+            print(f"\n⚡ [{datetime.datetime.now().strftime('%H:%M:%S')}] Unschedulable +{tick.woken} Pod | Pend: {snap.pending} -> {action} | {reason}")
+            planned_workers = snap.active_workers + in_flight_workers
+            if action == "SCALE_OUT" and planned_workers < len(AVAILABLE_WORKERS):
+                target_ip = AVAILABLE_WORKERS[planned_workers]
+                print(f"🚀 [ACTUATOR] กำลังเรียกเครื่อง {target_ip}...")
+                actuator.submit(action, target_ip)
+            continue
+
         current_dt = datetime.datetime.now()
         timestamp_full = current_dt.strftime("%Y-%m-%d %H:%M:%S")
         timestamp_short = current_dt.strftime("%H:%M:%S")
         
-        # 1. ดึงข้อมูล 5 มิติ
+        # 1. ดึงข้อมูล 5 มิติ (เวลาของ sample = deadline ของ tick ไม่ใช่เวลาที่ดึงเสร็จ)
+        sample_time = time.time() - tick.lateness
         ai_features, current_workers, cpu_usage_pct, running_pods = fetch_realtime_data_multivar()
+        if ai_features is None:
+            print(f"[{timestamp_short}] ⚠️ ยังดึงข้อมูล Cluster ไม่ได้ ข้ามรอบนี้ (ไม่ใส่ 0.0 หลอก AI)")
+            continue
         cpu_req, cpu_cap, mem_req, mem_cap, pending_pods = ai_features
+        cpu_usage_text = f"{cpu_usage_pct:.1f}%" if cpu_usage_pct is not None else "N/A"
         
         # 2. เก็บเข้าประวัติ
-        history_buffer.append(list(ai_features))
-        if len(history_buffer) > WINDOW_SIZE:
-            history_buffer.pop(0)
+        if FEATURE_SOURCE == 'ring':
+            history_buffer.extend(collector.new_rows(len(feature_columns)))   # เฉพาะแถวใหม่จาก collector daemon (NaN เติมด้วยค่าก่อนหน้าแล้ว)
+        else:
+            minute_rows = resampler.add(sample_time, ai_features)
+            for grid_time, row in minute_rows:   # เฉพาะตอนถึงจุด grid 1 นาที
+                history_buffer.append(row)   # scale ครั้งเดียวตอนใส่
+                checkpoint.append(row, timestamp=grid_time)
+            if AGGREGATE_MODE and not minute_rows:
+                continue   # sample กลางนาที: แค่สะสม min/mean/max ทำนาย+ตัดสินใจเฉพาะตอนปิดนาที (Pending ด่วนไปทาง Fast Path)
+        if sampler is not None:
+            scheduler.set_interval(sampler.update(sample_time, cpu_req, pending_pods))
 
         if len(history_buffer) < WINDOW_SIZE:
             print(f"[{timestamp_short}] ⏳ สะสมประวัติให้ AI... ({len(history_buffer)}/{WINDOW_SIZE}) | CPU Req: {cpu_req:.2f}, Mem Req: {mem_req:.2f}GB", end='\r')
-            time.sleep(LOOP_INTERVAL) 
             continue
 
         print(f"\n[{timestamp_short}] " + "━"*50)
-        print(f"📊 [Status] Workers: {current_workers} | CPU Use: {cpu_usage_pct:.1f}% | Run: {running_pods} | Pend: {pending_pods}")
+        print(f"📊 [Status] Workers: {current_workers} | CPU Use: {cpu_usage_text} | Run: {running_pods} | Pend: {pending_pods}")
         print(f"    [Metrics] CPU Req/Cap: {cpu_req:.2f}/{cpu_cap:.2f} | Mem Req/Cap: {mem_req:.2f}/{mem_cap:.2f} GB")
 
         # 3. เตรียมข้อมูลเข้า AI แบบ Multi-Variable
-        raw_array = np.array(history_buffer) # Shape: (30, 5)
-        scaled_array = scaler_inputs.transform(raw_array) # Scale ด้วย scaler_inputs
-        X_input = scaled_array.reshape(1, WINDOW_SIZE, 5) # Reshape เป็น (1, 30, 5)
+        X_input = history_buffer.input_view() # (1, 30, n_features) float32 ที่ scale แล้ว ไม่ต้อง transform ทั้ง window ใหม่
         
-        # 4. ทำนายผลและแปลงกลับ
-        pred_scaled = model.predict(X_input, verbose=0)
+        # 4. ทำนายผลและแปลงกลับ (ภายใน INFERENCE_DEADLINE ไม่งั้นใช้ fallback บน CPU Req ดิบของ window เดียวกัน)
         # 🚨 จุดสำคัญ: แปลงค่าเป้าหมายกลับด้วย scaler_target
-        predicted_cores = scaler_target.inverse_transform(pred_scaled)[0][0]
+        cpu_req_history = scaler_inputs.inverse_column(history_buffer.scaled_rows()[:, 0], 0)
+        forecast = forecaster.forecast(X_input, cpu_req_history)
+        predicted_cores = forecast.cores
         
-        print(f"🔮 [AI Predict] อนาคต 5 นาที ➡️ CPU Req จะอยู่ที่: {predicted_cores:.2f} Cores")
+        if forecast.source == 'lstm':
+            print(f"🔮 [AI Predict] อนาคต 5 นาที ➡️ CPU Req จะอยู่ที่: {predicted_cores:.2f} Cores ({forecast.latency_ms:.0f} ms)")
+        else:
+            print(f"🛟 [Fallback:{forecast.source}] {forecast.error} ➡️ CPU Req จะอยู่ที่: {predicted_cores:.2f} Cores")
+        if forecast.by_horizon:
+            print("    [Horizons] " + " | ".join(f"+{h}m {cores:.2f}" for h, cores in forecast.by_horizon.items()))
+        if forecast.upper_cores is not None:
+            print(f"    [MC-Dropout] {MC_SAMPLES} samples -> ขอบบน (q{UPPER_QUANTILE:.2f}) {forecast.upper_cores:.2f} Cores")
+        if PREDICTION_CACHE:
+            print(f"    [Cache] hit {model.hits} / miss {model.misses} ({model.hit_rate:.0%}) -> โมเดลรันจริง {model.misses} ครั้ง")
+
+        # เครื่องที่กำลัง join / kick อยู่เบื้องหลัง -> นับเป็น capacity ที่จะมี/จะหาย
+        in_flight_workers = actuator.in_flight_workers()
+        planned_workers = current_workers + in_flight_workers
+        for op in actuator.in_flight():
+            print(f"    [In-Flight] {op.action} {op.target_ip} ({time.monotonic() - op.submitted:.0f}s)")
 
         # 5. ส่งให้ DecisionEngine ตัดสินใจ (ใช้ Logic เดิมได้เลย!)
         action, reason = decision_engine.decide(
@@ -196,41 +270,53 @@ while True:
             current_workers=current_workers,
             pending_pods=pending_pods,
             current_cpu_usage=cpu_usage_pct,
-            current_cpu_req=cpu_req
+            current_cpu_req=cpu_req,
+            forecaster=forecast.source,
+            predicted_upper_cores=forecast.upper_cores,
+            predicted_by_horizon=forecast.by_horizon,
+            in_flight_workers=in_flight_workers
         )
         
         print(f"🤖 [Decision] : {action}")
         print(f"     [Reason] : {reason}")
+        if not first_decision_reported:
+            print(f"⏱️ [Startup] time-to-first-decision: {time.perf_counter() - STARTUP_T0:.2f}s")
+            first_decision_reported = True
         
         # 6. บันทึก Log 
         try:
             with open(LOG_FILE, mode='a', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 writer.writerow([
-                    timestamp_full, current_workers, round(cpu_usage_pct, 2), running_pods, pending_pods,
+                    timestamp_full, current_workers, round(cpu_usage_pct, 2) if cpu_usage_pct is not None else "", running_pods, pending_pods,
                     round(cpu_req, 2), round(cpu_cap, 2), round(mem_req, 2), round(mem_cap, 2),
-                    round(predicted_cores, 2), action, reason
+                    round(predicted_cores, 2), action, reason, forecast.source,
+                    round(forecast.upper_cores, 2) if forecast.upper_cores is not None else ""
                 ])
         except Exception as log_err: pass
 
         # 7. ลงมือทำ
         if action == "SCALE_OUT":
-            if current_workers < len(AVAILABLE_WORKERS):
-                target_ip = AVAILABLE_WORKERS[current_workers]
+            if planned_workers < len(AVAILABLE_WORKERS):
+                target_ip = AVAILABLE_WORKERS[planned_workers]
                 print(f"🚀 [ACTUATOR] กำลังเรียกเครื่อง {target_ip}...")
-                node_bot.scale_up(target_ip)
+                actuator.submit(action, target_ip)
         elif action == "SCALE_IN":
-            if current_workers > 0:
-                target_ip = AVAILABLE_WORKERS[current_workers - 1]
+            if planned_workers > 0:
+                target_ip = AVAILABLE_WORKERS[planned_workers - 1]
                 print(f"🔻 [ACTUATOR] กำลังปิดเครื่อง {target_ip}...")
-                node_bot.scale_down(target_ip)
+                actuator.submit(action, target_ip)
 
         print("━"*56)
-        time.sleep(LOOP_INTERVAL)
 
     except KeyboardInterrupt:
         print("\n\n🛑 ปิดระบบ (Ctrl+C)")
+        print(f"⏱️ [Jitter] {scheduler.report()}")
+        if actuator.in_flight():
+            print(f"⏳ รอ {', '.join(f'{op.action} {op.target_ip}' for op in actuator.in_flight())} ให้จบก่อนปิด")
+        actuator.shutdown()
+        checkpoint.close()
+        forecaster.close()
         break
     except Exception as e:
-        print(f"\n❌ Error: {e}")
-        time.sleep(5)
+        print(f"\n❌ Error: {e}")   # ลองใหม่ที่ tick ถัดไป
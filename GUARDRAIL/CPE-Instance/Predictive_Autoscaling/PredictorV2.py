@@ -1,18 +1,25 @@
 import time
 import datetime
-import subprocess
-import numpy as np
-import joblib
-import warnings  
 import csv  
 import os   
-from tensorflow.keras.models import load_model
 
 # นำเข้าคลาสสมองกลเวอร์ชันพูดมาก (V2) และระบบจัดการ Node
 from DecisionEngineV2 import DecisionEngine
 from node_manager import NodeManager
-
-warnings.filterwarnings("ignore", category=UserWarning, module='sklearn')
+from cluster_snapshot import POD_NAMESPACE, fetch_cluster_snapshot, fetch_node_metrics
+from cluster_informer import ClusterInformer, KubeWatchSource
+from feature_ring import FeatureRing, RingFeatureSource, RING_PATH
+from history_window import HistoryWindow
+from history_checkpoint import HistoryCheckpoint
+from prometheus_source import PrometheusFeatureSource
+from model_runner import load_runner
+from prediction_cache import PredictionCache
+from fallback_forecaster import DeadlineForecaster
+from affine_scaler import load_scaler
+from loop_scheduler import FixedRateScheduler
+from actuation_worker import ActuationWorker
+from pending_trigger import PendingTrigger, PENDING_DEBOUNCE
+from adaptive_sampler import AdaptiveInterval, MinuteResampler, INTERVALS
 
 # ==========================================
 # 1. ⚙️ CONFIGURATION (ตั้งค่าระบบ)
@@ -21,85 +28,40 @@ MODEL_PATH = 'best_single_var_model.keras'
 SCALER_PATH = 'scaler.pkl'
 WINDOW_SIZE = 30
 LOG_FILE = 'autoscaler_log.csv' 
+HISTORY_CHECKPOINT = 'autoscaler_history.ckpt'   # feature ดิบของแต่ละ tick -> restart แล้วทำนายได้ทันทีไม่ต้องรอสะสม 30 นาทีใหม่
 
 # ⏱️ เวลาในการหน่วงแต่ละรอบ (วินาที)
 # แนะนำ: ตอนพรีเซนต์/เทสระบบ = 1 | รันบนเซิร์ฟเวอร์จริง = 60
-LOOP_INTERVAL = 60
-
-NODES = {
-    'master': 'aj-aung-k8s-master',
-    'worker1': 'aj-aung-k8s-worker1',
-    'worker2': 'aj-aung-k8s-worker2'
-}
+LOOP_INTERVAL = 60   # คาบคงที่: deadline = เริ่ม + n * LOOP_INTERVAL (ไม่บวกเวลาทำงานของแต่ละรอบ)
+JITTER_REPORT_EVERY = 3600   # วินาที: พิมพ์ jitter histogram ของ loop ทุกชั่วโมง (ไม่ขึ้นกับคาบ tick ที่ adaptive / aggregate เปลี่ยน)
+ADAPTIVE_SAMPLING = True   # CPU Req / Pending ผันผวน -> เก็บข้อมูล+ตัดสินใจถี่ขึ้น (INTERVALS ใน adaptive_sampler.py) | นิ่ง -> กลับเป็น LOOP_INTERVAL
+MODEL_BACKEND = 'keras'   # 'keras' = TensorFlow (traced + warm-up) | 'numpy' = NumPy ล้วน (numpy_lstm.py) | 'onnx' / 'tflite' = ไฟล์จาก convert_model.py
+PREDICTION_CACHE = True   # ช่วงที่ window นิ่ง (COOLDOWN HOLD / กลางคืน) ใช้ผลทำนายเดิม ไม่รันโมเดลซ้ำ
+INFERENCE_DEADLINE = 2.0   # วินาที: โมเดลตอบไม่ทัน (GC / CPU แย่งกัน / build graph รอบแรก) -> ใช้ FALLBACK_FORECASTER แทน
+FALLBACK_FORECASTER = 'holt'   # 'holt' | 'ewma' | 'linear' บน CPU Req ใน window เดียวกัน
+MC_SAMPLES = 0   # >0 = MC-dropout: รัน K forward pass แบบเปิด Dropout ใน batch เดียว ได้ค่าเฉลี่ย + ขอบบน (เฉพาะ backend 'keras' / 'numpy')
+UPPER_QUANTILE = 0.9   # ขอบบนที่ DecisionEngine ใช้ตัดสินใจ scale-out
+CACHE_TOLERANCE = 1e-4   # หน่วย scaled: window ที่ต่างกันไม่เกินนี้ถือว่าเหมือนกัน (0 = ต้องตรงทุก byte)
+FEATURE_SOURCE = 'kubernetes'   # 'kubernetes' = API Server | 'ring' = อ่านจาก collector daemon (feature_ring.py)
+PROMETHEUS_URL = "http://10.35.29.108:31102"   # ใช้ดึงประวัติย้อนหลังตอนเริ่ม (WARM START) เมื่อยังไม่มี checkpoint
+USE_INFORMER = True   # True = อ่านจาก watch cache (O(1) ต่อรอบ) | False = list ทั้ง Cluster ใหม่ทุกรอบ
+PENDING_FAST_PATH = True   # ⚡ ต้องใช้ Informer: Pod ติด Unschedulable -> ปลุก loop เข้า Reactive Emergency ทันที (~1 วิ) ไม่รอ tick ถัดไป
 
 AVAILABLE_WORKERS = ["10.35.29.109", "10.35.29.110"]
 
 # ==========================================
 # 2. 🛠️ HELPER FUNCTIONS
 # ==========================================
-def parse_k8s_value(value_str):
-    if not value_str: return 0.0
-    value_str = str(value_str).strip()
-    try:
-        if value_str.endswith('m'):
-            return float(value_str.replace('m', '')) / 1000.0
-        return float(value_str)
-    except:
-        return 0.0
-
-def run_cmd(cmd):
-    try:
-        return subprocess.check_output(cmd, shell=True, stderr=subprocess.DEVNULL).decode('utf-8').strip()
-    except:
-        return ""
-
 def fetch_realtime_data():
-    total_cpu_req = 0.0
-    worker_cpu_usage = 0.0
-    worker_cpu_cap = 0.0
-    active_workers = 0
-
-    for key, node in NODES.items():
-        status_out = run_cmd(f"kubectl get node {node} --no-headers | awk '{{print $2}}'")
-        if "Ready" in status_out and "NotReady" not in status_out:
-            
-            # 🚨 จุดที่แก้: กรองเอาเฉพาะ Worker มาคิด "ทุกอย่าง" รวมถึง Req ด้วย!
-            if key.startswith('worker'):
-                active_workers += 1
-                
-                # 1. ดึง Req (ย้ายเข้ามาอยู่ใน if นึ้แล้ว จะได้ไม่รวม Master)
-                out_req = run_cmd(f"kubectl describe node {node} | grep -A 5 'Allocated resources' | tail -n 2")
-                try:
-                    cpu_req = parse_k8s_value(out_req.splitlines()[0].split()[1])
-                    total_cpu_req += cpu_req
-                except: pass
-
-                # 2. ดึง Cap & Usage
-                out_cap = run_cmd(f"kubectl get node {node} -o jsonpath='{{.status.capacity.cpu}}'")
-                worker_cpu_cap += parse_k8s_value(out_cap)
-
-                out_usage = run_cmd(f"kubectl top node {node} --no-headers | awk '{{print $2}}'")
-                worker_cpu_usage += parse_k8s_value(out_usage)
-
-    # คำนวณ % การใช้งาน (ส่วนนี้เหมือนเดิม)
-    current_cpu_percent = 0.0
-    if worker_cpu_cap > 0:
-        current_cpu_percent = (worker_cpu_usage / worker_cpu_cap) * 100
-
-    # ดึงจำนวน Pod ใน namespace default (ส่วนนี้เหมือนเดิม ถูกต้องแล้ว)
-    running_count = 0
-    try:
-        running_cmd = "kubectl get pods -n default --field-selector=status.phase=Running --no-headers | wc -l"
-        running_count = int(run_cmd(running_cmd))
-    except: pass
+    # อ่านจาก watch cache ถ้าเปิด Informer ไว้ ไม่งั้น list ทั้ง Cluster ใหม่ (Pod นับเฉพาะ POD_NAMESPACE)
+    if ring_source is not None:
+        snap = ring_source.collect_sync().snapshot
+    elif informer is not None:
+        snap = informer.snapshot(fetch_node_metrics())
+    else:
+        snap = fetch_cluster_snapshot(namespace=POD_NAMESPACE)
 
-    pending_count = 0
-    try:
-        pending_cmd = "kubectl get pods -n default --field-selector=status.phase=Pending --no-headers | wc -l"
-        pending_count = int(run_cmd(pending_cmd))
-    except: pass
-
-    return total_cpu_req, active_workers, pending_count, current_cpu_percent, running_count
+    return snap.cpu_req, snap.active_workers, snap.pending, snap.cpu_usage_pct, snap.running
 
 # ==========================================
 # 📝 2.5 ระบบจัดการ LOG (สร้างไฟล์และหัวตาราง)
@@ -117,7 +79,9 @@ def init_logger():
                 "Current_Req_Cores", 
                 "Predicted_Req_Cores", 
                 "Action", 
-                "Reason"
+                "Reason",
+                "Forecaster",
+                "Predicted_Upper"
             ])
         print(f"📁 สร้างไฟล์ Log ใหม่: {LOG_FILE}")
 
@@ -130,56 +94,116 @@ print("="*50)
 
 print("⏳ กำลังโหลดโมเดล AI และตั้งค่าสมองกล...")
 try:
-    model = load_model(MODEL_PATH, compile=False)
-    scaler = joblib.load(SCALER_PATH)
+    model = load_runner(MODEL_PATH, MODEL_BACKEND)
+    if PREDICTION_CACHE:
+        model = PredictionCache(model, tolerance=CACHE_TOLERANCE)
+    scaler = load_scaler(SCALER_PATH)   # scaler.affine.json (ไม่ import sklearn ตอน serving)
     
     # 🌟 เรียกใช้ DecisionEngineV2 ที่เราอัปเกรด Reason มาใหม่
     decision_engine = DecisionEngine(cores_per_node=4.0, max_workers=2, min_workers=1)
     node_bot = NodeManager()
+    actuator = ActuationWorker(node_bot)   # join / kick รันเบื้องหลัง loop ไม่หยุดเก็บข้อมูลระหว่าง scale
+
+    informer = ring_source = pending_trigger = None
+    if FEATURE_SOURCE == 'ring':
+        ring_source = RingFeatureSource(FeatureRing.open(RING_PATH))
+    elif USE_INFORMER:
+        pending_trigger = PendingTrigger(PENDING_DEBOUNCE) if PENDING_FAST_PATH else None
+        informer = ClusterInformer(KubeWatchSource(), namespace=POD_NAMESPACE,
+                                   on_unschedulable=pending_trigger and pending_trigger.notify).start()
+        if not informer.wait_synced(timeout=30):
+            print("⚠️ Informer ยัง sync ไม่เสร็จ (จะอัปเดตต่อเบื้องหลัง)")
     
     init_logger() 
     
+    forecaster = DeadlineForecaster(model, lambda v: scaler.inverse_column(v, 0), FALLBACK_FORECASTER, INFERENCE_DEADLINE,
+                                    mc_samples=MC_SAMPLES, quantile=UPPER_QUANTILE)
     print("✅ โหลดระบบสำเร็จ! พร้อมปกป้อง K8s Cluster ของคุณแล้ว")
 except Exception as e:
     print(f"❌ Error ตอนโหลดไฟล์: {e}")
     exit()
 
-history_buffer = []
-print(f"🚀 เริ่มต้น Monitor... (ความถี่: ดึงข้อมูลทุกๆ {LOOP_INTERVAL} วินาที)\n")
+history_buffer = HistoryWindow(WINDOW_SIZE, 1, scaler=scaler)
 
-# ==========================================
-# 🔥 WARM START: โคลนข้อมูลหลอก AI ไม่ต้องรอ 30 นาที
-# ==========================================
-# print("⚡ [WARM START] กำลังโคลนข้อมูลเริ่มต้น 30 นาที เพื่อให้ AI รันได้ทันที...")
-# try:
-#     # 1. ดึงข้อมูลของวินาทีนี้มา 1 ครั้ง (Single Var เราสนใจแค่ cpu_req ตัวแรก)
-#     initial_cpu_req, _, _, _, _ = fetch_realtime_data()
-    
-#     # 2. ก๊อปปี้ค่า cpu_req ปัจจุบันใส่ประวัติให้เต็ม 30 ช่อง (จำลองว่าระบบนิ่งมา 30 นาทีแล้ว)
-#     # รูปแบบ [initial_cpu_req] เพราะ Single-Var ใช้ array 1 มิติ
-#     history_buffer = [[initial_cpu_req] for _ in range(WINDOW_SIZE)]
-#     print("✅ โหลดข้อมูลหลอกสำเร็จ! AI พร้อมทำงานวินาทีนี้เลย!")
-# except Exception as e:
-#     print(f"⚠️ Warm Start ล้มเหลว: {e} (จะกลับไปรอสะสมข้อมูลปกติ)")
-# ==========================================
+# ♻️ โหลดประวัติจาก checkpoint (เฉพาะช่วงต่อเนื่องล่าสุดที่ต่อกับปัจจุบันได้)
+checkpoint = HistoryCheckpoint(HISTORY_CHECKPOINT, n_features=1, window_size=WINDOW_SIZE)
+history_end = None   # เวลาของแถวสุดท้ายในประวัติที่กู้ / backfill มา -> grid ของ sample สดต่อจากจุดนี้ (ห่าง 1 นาทีพอดี)
+if ring_source is None:
+    restored_times, restored_rows = checkpoint.recent(LOOP_INTERVAL)
+    history_buffer.extend(restored_rows)
+    if len(restored_rows):
+        history_end = restored_times[-1]
+        print(f"♻️ [Checkpoint] กู้ประวัติ {len(restored_rows)}/{WINDOW_SIZE} นาทีจาก {HISTORY_CHECKPOINT}")
+    else:
+        # ==========================================
+        # 🔥 WARM START: ไม่มี checkpoint -> ดึง CPU Req จริงย้อนหลัง 30 นาทีจาก Prometheus (ไม่โคลนข้อมูลหลอก)
+        # ==========================================
+        try:
+            backfill_source = PrometheusFeatureSource(PROMETHEUS_URL)
+            backfill_times, backfill_rows = backfill_source.backfill(WINDOW_SIZE, features=('cluster_cpu_req',), step=LOOP_INTERVAL)
+            backfill_source.close()
+            history_buffer.extend(backfill_rows)
+            for ts, row in zip(backfill_times, backfill_rows):
+                checkpoint.append(row, timestamp=ts)
+            if len(backfill_times):
+                history_end = backfill_times[-1]   # ปลายนาทีล่าสุด (now // step * step) -> grid ของ sample สดต่อจากตรงนี้
+            print(f"⚡ [WARM START] ดึงประวัติจาก Prometheus {len(backfill_rows)}/{WINDOW_SIZE} นาที AI พร้อมทำงานทันที")
+        except Exception as e:
+            print(f"⚠️ Warm Start ล้มเหลว: {e} (จะกลับไปรอสะสมข้อมูลปกติ)")
+grid_start = None if history_end is None else history_end + LOOP_INTERVAL
+scheduler = FixedRateScheduler(LOOP_INTERVAL)
+sampler = AdaptiveInterval(INTERVALS) if ADAPTIVE_SAMPLING else None
+resampler = MinuteResampler(step=LOOP_INTERVAL, start=grid_start)   # sample ถี่แค่ไหน history / checkpoint ก็ยัง 1 แถวต่อนาที
+if grid_start is not None:
+    scheduler.align(grid_start)   # tick ลงจุด grid เดียวกับประวัติเดิม (tick แรกยังเริ่มทันที)
+print(f"🚀 เริ่มต้น Monitor... (ความถี่: ดึงข้อมูลทุกๆ {LOOP_INTERVAL} วินาที แบบ fixed-rate)\n")
+last_jitter_report = time.monotonic()
 
 while True:
     try:
+        # พักระบบจนถึง deadline ถัดไป (รอบที่ทำงานเกินคาบ -> ข้าม tick ที่พลาด ไม่ยืดคาบ)
+        tick = scheduler.wait(wake=pending_trigger and pending_trigger.wait)   # PendingTrigger ปลุกก่อนได้ (fast path)
+        if tick.skipped or tick.late:
+            print(f"\n⏱️ [Scheduler] tick #{tick.index} ช้า {tick.lateness:.1f}s | ข้าม {tick.skipped} tick")
+        if not tick.woken and time.monotonic() - last_jitter_report >= JITTER_REPORT_EVERY:
+            print(f"\n⏱️ [Jitter] {scheduler.report()}")
+            last_jitter_report = time.monotonic()
+        for op in actuator.completed():
+            print(f"\n{'✅' if op.ok else '❌'} [ACTUATOR] {op.action} {op.target_ip} เสร็จใน {op.finished - op.submitted:.0f}s" + (f" ({op.error})" if op.error else ""))
+
+        if tick.woken:
+            # ⚡ FAST PATH: Pod เพิ่งติด Unschedulable -> Reactive Emergency จาก watch cache ทันที (ไม่เก็บเข้าประวัติ AI, grid 1 นาทีเดิม)
+            snap = informer.snapshot()
+            in_flight_workers = actuator.in_flight_workers()
+            action, reason = decision_engine.decide_reactive(snap.active_workers, snap.pending, in_flight_workers)
+            print(f"\n⚡ [{datetime.datetime.now().strftime('%H:%M:%S')}] Unschedulable +{tick.woken} Pod | Pend: {snap.pending} -> {action} | {reason}")
+            planned_workers = snap.active_workers + in_flight_workers
+            if action == "SCALE_OUT" and planned_workers < len(AVAILABLE_WORKERS):
+                target_ip = AVAILABLE_WORKERS[planned_workers]
+                print(f"🚀 [ACTUATOR] กำลังเรียกเครื่อง {target_ip}...")
+                actuator.submit(action, target_ip)
+            continue
+
         current_dt = datetime.datetime.now()
         timestamp_full = current_dt.strftime("%Y-%m-%d %H:%M:%S")
         timestamp_short = current_dt.strftime("%H:%M:%S")
         
-        # 1. ดึงข้อมูล
+        # 1. ดึงข้อมูล (เวลาของ sample = deadline ของ tick ไม่ใช่เวลาที่ดึงเสร็จ)
+        sample_time = time.time() - tick.lateness
         cpu_req, current_workers, pending_pods, cpu_usage_pct, running_pods = fetch_realtime_data()
         
-        history_buffer.append([cpu_req])
-        if len(history_buffer) > WINDOW_SIZE:
-            history_buffer.pop(0)
+        if ring_source is not None:
+            history_buffer.extend(ring_source.new_rows(columns=1))   # เฉพาะ CPU Req ที่ collector daemon เขียนเพิ่ม (NaN เติมด้วยค่าก่อนหน้าแล้ว)
+        else:
+            for grid_time, row in resampler.add(sample_time, [cpu_req]):   # เฉพาะตอนถึงจุด grid 1 นาที
+                history_buffer.append(row)
+                checkpoint.append(row, timestamp=grid_time)
+        if sampler is not None:
+            scheduler.set_interval(sampler.update(sample_time, cpu_req, pending_pods))
 
         # 2. รอสะสมข้อมูลให้ครบก่อน AI เริ่มทำงาน
         if len(history_buffer) < WINDOW_SIZE:
             print(f"[{timestamp_short}] ⏳ กำลังสะสมประวัติให้ AI... ({len(history_buffer)}/{WINDOW_SIZE}) | CPU Req: {cpu_req:.2f} Cores", end='\r')
-            time.sleep(LOOP_INTERVAL) 
             continue
 
         # 3. เริ่มวิเคราะห์และแสดงผล Dashboard
@@ -187,15 +211,27 @@ while True:
         print(f"📊 [K8s Status] Worker Active: {current_workers} | CPU Usage: {cpu_usage_pct:.1f}% |Running Pods: {running_pods} |Pending Pods: {pending_pods}")
 
         # เตรียมข้อมูลเข้า AI
-        raw_array = np.array(history_buffer) 
-        scaled_array = scaler.transform(raw_array)
-        X_input = scaled_array.reshape(1, WINDOW_SIZE, 1)
+        X_input = history_buffer.input_view()   # (1, 30, 1) float32 ที่ scale แล้ว
         
-        # ทำนายผล
-        pred_scaled = model.predict(X_input, verbose=0)
-        predicted_cores = scaler.inverse_transform(pred_scaled)[0][0]
+        # ทำนายผล (ภายใน INFERENCE_DEADLINE ไม่งั้นใช้ fallback บน CPU Req ดิบของ window เดียวกัน)
+        cpu_req_history = scaler.inverse_column(history_buffer.scaled_rows()[:, 0], 0)
+        forecast = forecaster.forecast(X_input, cpu_req_history)
+        predicted_cores = forecast.cores
         
-        print(f"🔮 [AI Predict] CPU Request ปัจจุบัน {cpu_req:.2f} ➡️  แนวโน้มในอนาคต {predicted_cores:.2f} Cores")
+        if forecast.source == 'lstm':
+            print(f"🔮 [AI Predict] CPU Request ปัจจุบัน {cpu_req:.2f} ➡️  แนวโน้มในอนาคต {predicted_cores:.2f} Cores")
+        else:
+            print(f"🛟 [Fallback:{forecast.source}] {forecast.error} | CPU Request ปัจจุบัน {cpu_req:.2f} ➡️  แนวโน้มในอนาคต {predicted_cores:.2f} Cores")
+        if forecast.upper_cores is not None:
+            print(f"    [MC-Dropout] {MC_SAMPLES} samples -> ขอบบน (q{UPPER_QUANTILE:.2f}) {forecast.upper_cores:.2f} Cores")
+        if PREDICTION_CACHE:
+            print(f"    [Cache] hit {model.hits} / miss {model.misses} ({model.hit_rate:.0%}) -> โมเดลรันจริง {model.misses} ครั้ง")
+
+        # เครื่องที่กำลัง join / kick อยู่เบื้องหลัง -> นับเป็น capacity ที่จะมี/จะหาย
+        in_flight_workers = actuator.in_flight_workers()
+        planned_workers = current_workers + in_flight_workers
+        for op in actuator.in_flight():
+            print(f"    [In-Flight] {op.action} {op.target_ip} ({time.monotonic() - op.submitted:.0f}s)")
 
         # 4. ส่งให้ DecisionEngineV2 ตัดสินใจ
         action, reason = decision_engine.decide(
@@ -203,7 +239,10 @@ while True:
             current_workers=current_workers,
             pending_pods=pending_pods,
             current_cpu_usage=cpu_usage_pct,
-            current_cpu_req=cpu_req
+            current_cpu_req=cpu_req,
+            forecaster=forecast.source,
+            predicted_upper_cores=forecast.upper_cores,
+            in_flight_workers=in_flight_workers
         )
         
         print(f"🤖 [Decision] : {action}")
@@ -222,32 +261,36 @@ while True:
                     round(cpu_req, 2),
                     round(predicted_cores, 2),
                     action,
-                    reason
+                    reason,
+                    forecast.source,
+                    round(forecast.upper_cores, 2) if forecast.upper_cores is not None else ""
                 ])
         except Exception as log_err:
             print(f"⚠️ ไม่สามารถบันทึก Log ลงไฟล์ได้ ({log_err})")
 
         # 6. สั่งลงมือทำกับ K8s จริง
         if action == "SCALE_OUT":
-            if current_workers < len(AVAILABLE_WORKERS):
-                target_ip = AVAILABLE_WORKERS[current_workers]
+            if planned_workers < len(AVAILABLE_WORKERS):
+                target_ip = AVAILABLE_WORKERS[planned_workers]
                 print(f"🚀 [ACTUATOR] กำลังเรียกเครื่อง {target_ip} เข้ามาช่วยงาน...")
-                node_bot.scale_up(target_ip)
+                actuator.submit(action, target_ip)
             
         elif action == "SCALE_IN":
-            if current_workers > 0:
-                target_ip = AVAILABLE_WORKERS[current_workers - 1]
+            if planned_workers > 0:
+                target_ip = AVAILABLE_WORKERS[planned_workers - 1]
                 print(f"🔻 [ACTUATOR] กำลังปิดเครื่อง {target_ip} เพื่อประหยัดทรัพยากร...")
-                node_bot.scale_down(target_ip)
+                actuator.submit(action, target_ip)
 
         print("━"*58)
-        
-        # พักระบบตามรอบเวลาที่ตั้งไว้
-        time.sleep(LOOP_INTERVAL)
 
     except KeyboardInterrupt:
         print("\n\n🛑 ปิดระบบ Predictive Autoscaler อย่างปลอดภัย (Ctrl+C)")
+        print(f"⏱️ [Jitter] {scheduler.report()}")
+        if actuator.in_flight():
+            print(f"⏳ รอ {', '.join(f'{op.action} {op.target_ip}' for op in actuator.in_flight())} ให้จบก่อนปิด")
+        actuator.shutdown()
+        checkpoint.close()
+        forecaster.close()
         break
     except Exception as e:
-        print(f"\n❌ Error ระหว่างรันลูป: {e}")
-        time.sleep(5)
+        print(f"\n❌ Error ระหว่างรันลูป: {e}")   # ลองใหม่ที่ tick ถัดไป
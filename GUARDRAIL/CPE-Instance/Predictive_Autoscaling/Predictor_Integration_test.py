@@ -1,33 +1,20 @@
 import time
-import subprocess
 from DecisionEngineV2 import DecisionEngine
 from node_manager import NodeManager
+from cluster_snapshot import is_node_ready, is_worker_node
+from kube_client import get_client
 
 # ==========================================
 # ⚙️ CONFIGURATION
 # ==========================================
-NODES = {
-    'master': 'aj-aung-k8s-master',
-    'worker1': 'aj-aung-k8s-worker1',
-    'worker2': 'aj-aung-k8s-worker2'
-}
 AVAILABLE_WORKERS = ["10.35.29.109", "10.35.29.110"]
 
 # ==========================================
 # 🛠️ K8S HELPER FUNCTIONS
 # ==========================================
-def run_cmd(cmd):
-    try: return subprocess.check_output(cmd, shell=True, stderr=subprocess.DEVNULL).decode('utf-8').strip()
-    except: return ""
-
 def get_real_active_workers():
-    active_workers = 0
-    for key, node in NODES.items():
-        if key.startswith('worker'):
-            status = run_cmd(f"kubectl get node {node} --no-headers | awk '{{print $2}}'")
-            if "Ready" in status and "NotReady" not in status:
-                active_workers += 1
-    return active_workers
+    nodes = get_client().list_nodes()['items']
+    return sum(1 for node in nodes if is_worker_node(node) and is_node_ready(node))
 
 def wait_for_k8s_sync(target_count, timeout_sec=180):
     print(f"   ⏳ [K8s] กำลังรอให้ K8s อัปเดตเครื่องเป็น {target_count} เครื่อง...")
@@ -0,0 +1,69 @@
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# ทิศของแต่ละ action ต่อจำนวน worker (+1 = กำลัง join, -1 = กำลัง drain/kick)
+ACTION_DELTA = {'SCALE_OUT': +1, 'SCALE_IN': -1}
+
+Operation = namedtuple('Operation', ['action', 'target_ip', 'submitted', 'finished', 'ok', 'error'])
+Operation.__doc__ = """การสั่ง join / kick 1 ครั้ง: เวลา submitted / finished (monotonic), ok = ผลจาก NodeManager (None = ยังไม่เสร็จ)"""
+
+
+class ActuationWorker:
+    """
+    รัน node_bot.scale_up / scale_down (join-node.sh รอ Ready ได้ ~150 s, kick-node.sh drain ได้ถึง 3 นาที) บน thread เบื้องหลัง
+    main loop จึงยังเก็บข้อมูล / ทำนายทุก tick ระหว่าง scale และรู้ว่ามีเครื่องกำลังเข้า/ออกกี่เครื่อง (in_flight_workers)
+    - สั่งทีละงานตามลำดับ (executor 1 thread) สคริปต์ kubeadm ไม่ทับกัน
+    - target เดิมที่ยังทำไม่เสร็จจะไม่ถูกสั่งซ้ำ
+    """
+
+    def __init__(self, node_manager, clock=time.monotonic):
+        self.node_manager = node_manager
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._in_flight = {}       # target_ip -> Operation
+        self._completed = []       # งานที่เสร็จแล้วแต่ main loop ยังไม่ได้อ่าน
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='actuator')
+
+    def submit(self, action, target_ip):
+        """ ส่งงานเข้าคิว คืน False ถ้า target นี้ยังมีงานค้างอยู่ """
+        if action not in ACTION_DELTA:
+            raise ValueError(f"unknown action {action!r} (expected one of {sorted(ACTION_DELTA)})")
+        with self._lock:
+            if target_ip in self._in_flight:
+                return False
+            self._in_flight[target_ip] = Operation(action, target_ip, self.clock(), None, None, None)
+        self._executor.submit(self._run, action, target_ip)
+        return True
+
+    def _run(self, action, target_ip):
+        ok, error = False, None
+        try:
+            run = self.node_manager.scale_up if action == 'SCALE_OUT' else self.node_manager.scale_down
+            ok = bool(run(target_ip))
+        except Exception as e:
+            error = str(e)
+        with self._lock:
+            op = self._in_flight.pop(target_ip)
+            self._completed.append(op._replace(finished=self.clock(), ok=ok, error=error))
+
+    def in_flight(self):
+        """ งานที่ยังไม่เสร็จ (รวมที่รอคิว) """
+        with self._lock:
+            return list(self._in_flight.values())
+
+    def in_flight_workers(self):
+        """ จำนวน worker ที่จะเปลี่ยนไปเมื่องานค้างเสร็จ (+ กำลัง join, - กำลัง kick) """
+        with self._lock:
+            return sum(ACTION_DELTA[op.action] for op in self._in_flight.values())
+
+    def completed(self):
+        """ คืนงานที่เสร็จตั้งแต่เรียกครั้งก่อน (ให้ main loop พิมพ์ / log) """
+        with self._lock:
+            done, self._completed = self._completed, []
+        return done
+
+    def shutdown(self, wait=True):
+        """ ยกเลิกงานที่ยังไม่เริ่ม แล้วรอสคริปต์ที่กำลังรันให้จบ (join / drain ค้างครึ่งทางอันตรายกว่า) """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
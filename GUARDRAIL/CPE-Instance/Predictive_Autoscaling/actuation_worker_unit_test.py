@@ -0,0 +1,82 @@
+import threading
+import time
+
+from DecisionEngineV2 import DecisionEngine
+from actuation_worker import ActuationWorker
+
+
+class SlowNodeManager:
+    """ NodeManager จำลอง: สคริปต์ค้างจนกว่า release() (แทน join-node.sh ที่รอ Ready หลายนาที) """
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.calls = []
+
+    def scale_up(self, node_ip):
+        self.calls.append(('up', node_ip))
+        self.gate.wait(5)
+        return True
+
+    def scale_down(self, node_ip):
+        self.calls.append(('down', node_ip))
+        raise RuntimeError("kubectl drain timed out")
+
+    def release(self):
+        self.gate.set()
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Actuation Worker (Unit Testing)\n" + "="*50)
+
+    print("▶️ TEST 1: submit คืนทันทีแม้สคริปต์ยังรันอยู่ + นับเครื่องที่กำลัง join")
+    bot = SlowNodeManager()
+    actuator = ActuationWorker(bot)
+    started = time.perf_counter()
+    assert actuator.submit('SCALE_OUT', '10.35.29.109')
+    elapsed = time.perf_counter() - started
+    print(f"ผลลัพธ์ 🤖: submit ใช้ {elapsed * 1000:.1f} ms | in-flight {actuator.in_flight_workers():+d}")
+    assert elapsed < 0.1 and actuator.in_flight_workers() == 1
+    assert not actuator.submit('SCALE_OUT', '10.35.29.109')      # target เดิมยังไม่เสร็จ -> ไม่สั่งซ้ำ
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: DecisionEngine คิด capacity รวมเครื่องที่กำลัง join")
+    engine = DecisionEngine(cores_per_node=4.0, max_workers=3, min_workers=1)
+    action, reason = engine.decide(predicted_cores=1.0, current_workers=1, pending_pods=4, current_cpu_usage=90.0,
+                                   current_cpu_req=3.9, in_flight_workers=1)
+    print(f"ผลลัพธ์ 🤖: Pending 4 ระหว่าง join -> {action} | {reason}")
+    assert action == "DO_NOTHING" and "In-Flight" in reason
+    # 1 เครื่อง + 1 กำลังเข้า = 8 Cores -> limit 6.4 | ต้องการ 5.0 ยังพอ
+    action, _ = engine.decide(predicted_cores=5.0, current_workers=1, pending_pods=0, current_cpu_usage=90.0,
+                              current_cpu_req=3.9, in_flight_workers=1)
+    assert action == "DO_NOTHING"
+    action, reason = engine.decide(predicted_cores=0.5, current_workers=2, pending_pods=0, current_cpu_usage=10.0,
+                                   current_cpu_req=0.5, in_flight_workers=1)
+    print(f"ผลลัพธ์ 🤖: โหลดต่ำระหว่าง join -> {action} | {reason}")
+    assert action == "DO_NOTHING" and "joining" in reason
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: งานเสร็จ -> ออกจาก in-flight และส่งผลให้ main loop อ่าน (error ไม่ทำให้ worker ตาย)")
+    assert actuator.submit('SCALE_IN', '10.35.29.110')
+    assert actuator.in_flight_workers() == 0                         # +1 join, -1 kick (รอคิว)
+    bot.release()
+    assert wait_until(lambda: not actuator.in_flight())
+    done = actuator.completed()
+    print(f"ผลลัพธ์ 🤖: {[(op.action, op.ok, op.error) for op in done]}")
+    assert [(op.action, op.ok) for op in done] == [('SCALE_OUT', True), ('SCALE_IN', False)]
+    assert done[1].error == "kubectl drain timed out" and done[0].finished >= done[0].submitted
+    assert actuator.completed() == [] and bot.calls == [('up', '10.35.29.109'), ('down', '10.35.29.110')]
+    actuator.shutdown()
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,66 @@
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+INTERVALS = (10, 20, 30, 60)   # วินาที: ถี่สุด (RAMP UP / DOWN ของ load_gen_latest.py) -> ช้าสุด (COOLDOWN HOLD) ทุกค่าหาร 60 ลงตัว = ทุกจุด grid มี tick
+CPU_REQ_SLOPE = 0.5       # Cores/นาที: CPU Req เปลี่ยนเร็วกว่านี้ = ผันผวน -> ถี่ขึ้นทันที
+GRID_STEP = 60            # วินาที: grid ของ window ที่โมเดลเทรนมา (Prometheus step 1 นาที)
+GRID_TOLERANCE = 6        # วินาที: sample ที่ช้ากว่าจุด grid ไม่เกินนี้ (tick ช้านิดหน่อย) นับเป็นค่าของจุดนั้นเลย
+CLOCK_SLACK = 0.5         # วินาที: sample ที่เร็วกว่าจุด grid ไม่เกินนี้ (wall clock vs monotonic / float) ถือว่าตรงจุด
+
+
+class AdaptiveInterval:
+    """
+    เลือกคาบการเก็บข้อมูลจากความผันผวนล่าสุดของ cluster_cpu_req และจำนวน Pending
+    - ผันผวน (|dReq/dt| >= CPU_REQ_SLOPE หรือ Pending เปลี่ยน / ค้างอยู่) -> คาบถี่สุดทันที
+    - นิ่ง -> คลายทีละขั้นของ INTERVALS จนถึงคาบช้าสุด (ไม่เด้งไปมาระหว่าง 10 กับ 60)
+    """
+
+    def __init__(self, intervals=INTERVALS, slope_threshold=CPU_REQ_SLOPE):
+        self.intervals = tuple(sorted(intervals))
+        self.slope_threshold = slope_threshold
+        self._level = len(self.intervals) - 1
+        self._last = None          # (t, cpu_req, pending) ของ sample ก่อนหน้า
+        self.slope = 0.0           # Cores/นาที ล่าสุด
+
+    def update(self, t, cpu_req, pending):
+        """ ใส่ sample ใหม่ (t = วินาที) คืนคาบถัดไป (วินาที) """
+        volatile = pending > 0
+        if self._last is not None and t > self._last[0]:
+            last_t, last_req, last_pending = self._last
+            self.slope = (cpu_req - last_req) / (t - last_t) * 60
+            volatile = volatile or abs(self.slope) >= self.slope_threshold or pending != last_pending
+        self._last = (t, cpu_req, pending)
+
+        self._level = 0 if volatile else min(self._level + 1, len(self.intervals) - 1)
+        return self.interval
+
+    @property
+    def interval(self):
+        return self.intervals[self._level]
+
+
+class MinuteResampler:
+    """
+    แปลง sample ที่เวลาไม่สม่ำเสมอ (10-60 วิ) กลับเป็น grid ทุก GRID_STEP วินาที ให้ HistoryWindow / checkpoint
+    ค่า ณ จุด grid = sample แรกใน [จุดนั้น, จุดนั้น + tolerance] ไม่งั้น sample ล่าสุดก่อนหน้า (hold แบบ instant query ของ Prometheus ตอนเทรน)
+    -> input ของโมเดลยังเป็น 1 แถวต่อนาทีเหมือนเดิม ไม่ว่าจะเก็บถี่แค่ไหน และปล่อยทันทีไม่ต้องรอ sample ถัดไป
+    start: จุด grid แรก (เช่น แถวสุดท้ายที่กู้จาก checkpoint + step) -> แถวสดต่อจากประวัติเดิมห่างกัน step พอดี | None = sample แรก
+    """
+
+    def __init__(self, step=GRID_STEP, tolerance=GRID_TOLERANCE, start=None):
+        self.step = step
+        self.tolerance = tolerance
+        self._next = start         # เวลาของจุด grid ถัดไปที่ยังไม่ได้ปล่อย
+        self._last = None          # แถวล่าสุดที่เห็น
+
+    def add(self, t, row):
+        """ ใส่ sample (t = epoch วินาที) คืน [(grid_time, row), ...] ของจุด grid ที่ผ่านไปแล้ว (มักเป็น 0 หรือ 1 จุด) """
+        if self._next is None:
+            self._next = t           # จุด grid แรก = sample แรก
+        out = []
+        while self._next <= t + CLOCK_SLACK:
+            on_grid = t - self._next <= self.tolerance or self._last is None
+            out.append((self._next, row if on_grid else self._last))
+            self._next += self.step
+        self._last = row
+        return out
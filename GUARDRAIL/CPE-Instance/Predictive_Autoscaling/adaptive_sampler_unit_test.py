@@ -0,0 +1,76 @@
+from adaptive_sampler import AdaptiveInterval, MinuteResampler
+from loop_scheduler import FixedRateScheduler
+from loop_scheduler_unit_test import FakeClock
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Adaptive Sampling (Unit Testing)\n" + "="*50)
+
+    print("▶️ TEST 1: นิ่ง = 60 วิ | RAMP UP = 10 วิทันที | กลับมานิ่ง = คลายทีละขั้น")
+    sampler = AdaptiveInterval(intervals=(10, 20, 30, 60), slope_threshold=0.5)
+    intervals = [sampler.update(0, 2.0, 0), sampler.update(60, 2.1, 0)]          # 0.1 Cores/นาที
+    intervals.append(sampler.update(120, 3.0, 0))                                # +0.9 Cores/นาที
+    intervals.append(sampler.update(130, 3.0, 2))                                # Pending เพิ่ม
+    intervals += [sampler.update(t, 3.0, 0) for t in (140, 150, 170, 210, 270)]
+    print(f"ผลลัพธ์ 🤖: {intervals}")
+    assert intervals == [60, 60, 10, 10, 10, 20, 30, 60, 60]
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: เก็บทุก 60 วิ (tick ช้าไม่กี่ ms) -> grid เหมือนเดิม 1 แถวต่อ sample ไม่มี lag")
+    resampler = MinuteResampler(step=60, tolerance=6)
+    grid = []
+    for k, jitter in enumerate([0.0, 0.004, 0.002, 1.5, 0.001]):
+        grid += resampler.add(1000 + 60 * k + jitter, [float(k)])
+    print(f"ผลลัพธ์ 🤖: {grid}")
+    assert [t for t, _ in grid] == [1000, 1060, 1120, 1180, 1240] and [r[0] for _, r in grid] == [0, 1, 2, 3, 4]
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: เก็บทุก 10 วิ -> ยังได้ 1 แถวต่อนาที (ค่าที่จุด grid)")
+    resampler = MinuteResampler(step=60, tolerance=6)
+    grid = []
+    for t in range(0, 181, 10):
+        grid += resampler.add(t, [t / 10])
+    print(f"ผลลัพธ์ 🤖: {grid}")
+    assert grid == [(0, [0.0]), (60, [6.0]), (120, [12.0]), (180, [18.0])]
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: คาบที่ไม่ลง grid (40 วิ) / ข้อมูลขาด -> hold ค่าล่าสุดก่อนจุด grid")
+    resampler = MinuteResampler(step=60, tolerance=6)
+    grid = []
+    for t in (0, 40, 80, 120, 300):
+        grid += resampler.add(t, [t])
+    print(f"ผลลัพธ์ 🤖: {grid}")
+    assert grid == [(0, [0]), (60, [40]), (120, [120]), (180, [120]), (240, [120]), (300, [300])]
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 5: FixedRateScheduler.set_interval -> deadline ใหม่ยังลงจุด grid 1 นาทีเดิม")
+    clock = FakeClock()
+    scheduler = FixedRateScheduler(60, clock=clock, sleep=clock.sleep)
+    starts = [scheduler.wait().deadline]
+    scheduler.set_interval(10)
+    starts += [scheduler.wait().deadline for _ in range(3)]
+    scheduler.set_interval(20)
+    starts.append(scheduler.wait().deadline)                    # 40
+    scheduler.set_interval(30)
+    starts.append(scheduler.wait().deadline)                    # 60 (ไม่ใช่ 70)
+    scheduler.set_interval(60)
+    starts += [scheduler.wait().deadline for _ in range(2)]     # 120, 180
+    starts = [round(t - 1000.0, 6) for t in starts]
+    print(f"ผลลัพธ์ 🤖: {starts}")
+    assert starts == [0.0, 10.0, 20.0, 30.0, 40.0, 60.0, 120.0, 180.0] and scheduler.late_ticks == 0
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 6: ต่อจากประวัติที่กู้มา (แถวสุดท้าย 940) -> แถวสดแรก 1000 ไม่ใช่เวลาของ sample แรก")
+    resampler = MinuteResampler(step=60, tolerance=6, start=940 + 60)
+    grid = []
+    for t in (975, 1000, 1060.2):                               # sample แรกก่อนจุด grid / tick ที่ align แล้ว
+        grid += resampler.add(t, [t])
+    print(f"ผลลัพธ์ 🤖: {grid}")
+    assert grid == [(1000, [1000]), (1060, [1060.2])]
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+COMPILED_SUFFIX = '.affine.json'    # scaler.pkl -> scaler.affine.json (min_ / scale_ ต่อคอลัมน์)
+
+
+class AffineScaler:
+    """
+    MinMaxScaler ที่เหลือแค่ X * scale + min (ไม่ต้อง import sklearn / unpickle ตอน serving)
+    ไม่มี input validation / dtype check / UserWarning ทุก tick แบบ sklearn
+    """
+
+    def __init__(self, min_, scale):
+        self.min_ = np.asarray(min_, dtype=np.float64)
+        self.scale_ = np.asarray(scale, dtype=np.float64)
+
+    @classmethod
+    def from_sklearn(cls, scaler):
+        name = type(scaler).__name__
+        if name == 'MinMaxScaler' and not getattr(scaler, 'clip', False):
+            return cls(scaler.min_, scaler.scale_)
+        if name == 'StandardScaler':
+            n = scaler.n_features_in_
+            scale = scaler.scale_ if scaler.scale_ is not None else np.ones(n)
+            mean = scaler.mean_ if scaler.mean_ is not None else np.zeros(n)
+            return cls(-mean / scale, 1.0 / scale)
+        raise ValueError(f"cannot compile {name} into an affine transform")
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['min'], data['scale'])
+
+    def to_dict(self):
+        return {'min': self.min_.tolist(), 'scale': self.scale_.tolist()}
+
+    @property
+    def n_features(self):
+        return len(self.scale_)
+
+    def transform(self, X):
+        return np.asarray(X, dtype=np.float64) * self.scale_ + self.min_
+
+    def inverse_transform(self, X):
+        return (np.asarray(X, dtype=np.float64) - self.min_) / self.scale_
+
+    def transform_into(self, row, out):
+        """ scale 1 แถวแล้วเขียนลง out (เช่นช่องใน HistoryWindow) โดยตรง ไม่สร้าง array ชั่วคราว """
+        np.multiply(row, self.scale_, out=out, casting='unsafe')
+        out += self.min_.astype(out.dtype, copy=False)
+        return out
+
+    def inverse_column(self, value, column):
+        """ แปลงกลับเฉพาะคอลัมน์เดียว (แทนการสร้าง dummy array เต็มความกว้างเพื่อหลอก inverse_transform) """
+        return (value - self.min_[column]) / self.scale_[column]
+
+
+def compiled_path(path):
+    return os.path.splitext(path)[0] + COMPILED_SUFFIX
+
+
+def file_sha256(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def compile_scaler(path, out_path=None):
+    """ แปลง scaler .pkl เป็นไฟล์ .affine.json (ใช้ตอน build: ต้องมี joblib + sklearn) """
+    import joblib
+
+    scaler = AffineScaler.from_sklearn(joblib.load(path))
+    out_path = out_path or compiled_path(path)
+    tmp_path = f"{out_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(dict(scaler.to_dict(), source_sha256=file_sha256(path)), f)
+    os.replace(tmp_path, out_path)
+    return scaler
+
+
+def load_scaler(path):
+    """
+    โหลด scaler สำหรับ serving: ใช้ไฟล์ .affine.json ที่ compile ไว้ (ไม่ import sklearn)
+    ถ้ายังไม่มี หรือ .pkl ถูกเปลี่ยน (sha256 ไม่ตรง) จะ compile ให้ใหม่ (ต้องมี sklearn เฉพาะรอบนั้น)
+    """
+    if path.endswith(COMPILED_SUFFIX):
+        with open(path, encoding='utf-8') as f:
+            return AffineScaler.from_dict(json.load(f))
+
+    compiled = compiled_path(path)
+    if os.path.exists(compiled):
+        with open(compiled, encoding='utf-8') as f:
+            data = json.load(f)
+        if not os.path.exists(path) or data.get('source_sha256') == file_sha256(path):
+            return AffineScaler.from_dict(data)
+    try:
+        return compile_scaler(path, compiled)
+    except PermissionError:
+        import joblib
+        return AffineScaler.from_sklearn(joblib.load(path))    # เขียนไฟล์ไม่ได้ (เช่น read-only) ก็ใช้ในหน่วยความจำไป
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile pickled sklearn scalers into framework-free affine coefficients")
+    parser.add_argument('paths', nargs='+')
+    args = parser.parse_args()
+
+    for path in args.paths:
+        scaler = compile_scaler(path)
+        print(f"✅ {path} -> {compiled_path(path)} ({scaler.n_features} columns)")
@@ -0,0 +1,76 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import warnings
+
+import joblib
+import numpy as np
+
+from affine_scaler import AffineScaler, compiled_path, load_scaler
+from history_window import HistoryWindow
+
+warnings.filterwarnings("ignore")
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ AffineScaler (Unit Testing)\n" + "="*50)
+
+    print("▶️ TEST 1: ผล transform / inverse_transform ตรงกับ sklearn ทุก scaler ที่ใช้จริง")
+    for path in ['scaler.pkl', '../scaler.pkl', 'Multi_Feature_Resource/Multi-Var_Scaler_Inputs.pkl',
+                 'Multi_Feature_Resource/Multi-Var_Scaler_Target.pkl']:
+        sk, affine = joblib.load(path), load_scaler(path)
+        X = np.random.default_rng(0).uniform(0, 20, size=(30, sk.n_features_in_))
+        assert np.allclose(affine.transform(X), sk.transform(X))
+        assert np.allclose(affine.inverse_transform(X), sk.inverse_transform(X))
+        print(f"ผลลัพธ์ 🤖: {path} ({affine.n_features} คอลัมน์) ตรงกัน")
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: inverse_column แทน dummy 22 ช่องของ Predictor.py")
+    sk, affine = joblib.load('../scaler.pkl'), load_scaler('../scaler.pkl')
+    dummy = np.zeros((1, 22))
+    dummy[0, -1] = 0.42
+    expected = sk.inverse_transform(dummy)[0, -1]
+    got = affine.inverse_column(0.42, -1)
+    print(f"ผลลัพธ์ 🤖: dummy {expected:.6f} | inverse_column {got:.6f} Cores")
+    assert np.isclose(got, expected)
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: HistoryWindow scale ลง buffer โดยตรง ได้ค่าเท่ากับผ่าน sklearn")
+    sk, affine = joblib.load('Multi_Feature_Resource/Multi-Var_Scaler_Inputs.pkl'), load_scaler('Multi_Feature_Resource/Multi-Var_Scaler_Inputs.pkl')
+    rows = np.random.default_rng(1).uniform(0, 16, size=(35, 5))
+    fused, reference = HistoryWindow(30, 5, scaler=affine), HistoryWindow(30, 5, scaler=sk)
+    for r in rows:
+        fused.append(r)
+        reference.append(r)
+    assert np.allclose(fused.input_view(), reference.input_view(), atol=1e-6)
+    print(f"ผลลัพธ์ 🤖: max |diff| = {np.abs(fused.input_view() - reference.input_view()).max():.2e}")
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: โหลดจาก .affine.json โดยไม่ import sklearn / joblib, และ compile ใหม่เมื่อ .pkl เปลี่ยน")
+    code = ("import sys; from affine_scaler import load_scaler; load_scaler(sys.argv[1]); "
+            "print(','.join(m for m in ('sklearn', 'joblib') if m in sys.modules))")
+    loaded = subprocess.run([sys.executable, '-c', code, 'scaler.pkl'], capture_output=True, text=True, check=True).stdout.strip()
+    print(f"ผลลัพธ์ 🤖: heavy modules ที่ถูก import = [{loaded}]")
+    assert loaded == ""
+    with tempfile.TemporaryDirectory() as tmp:
+        pkl = os.path.join(tmp, 'scaler.pkl')
+        shutil.copy('scaler.pkl', pkl)
+        with open(compiled_path(pkl), 'w', encoding='utf-8') as f:
+            f.write('{"min": [0.0], "scale": [1.0], "source_sha256": "stale"}')
+        assert np.allclose(load_scaler(pkl).scale_, joblib.load('scaler.pkl').scale_)
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 5: scaler ที่แปลงเป็น affine ไม่ได้ -> ValueError")
+    try:
+        AffineScaler.from_sklearn(object())
+        assert False, "should raise"
+    except ValueError as e:
+        print(f"ผลลัพธ์ 🤖: {e}\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,121 @@
+import asyncio
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from cluster_snapshot import ClusterSnapshot, build_snapshot
+from kube_client import get_client
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+# เวลาสูงสุดที่รอแต่ละแหล่งข้อมูล (วินาที) - แหล่งไหนช้า ไม่ดึงแหล่งอื่นช้าตาม
+SOURCE_TIMEOUTS = {
+    'nodes': 2.0,      # Node status + capacity
+    'pods': 3.0,       # allocated requests + pod phases
+    'metrics': 1.5,    # CPU usage จาก metrics-server (ตัวที่ชอบ hiccup)
+}
+INFORMER_MAX_AGE = 30.0   # วินาที: watch ของ Informer หลุดนานกว่านี้ -> nodes / pods จาก cache ถือว่า stale (ลองต่อใหม่ทุก 5 วิ)
+
+# feature แต่ละตัวพึ่งข้อมูลจากแหล่งไหนบ้าง (ใช้ตัดสินว่า field ไหน stale)
+FIELD_SOURCES = {
+    'cpu_req': ('nodes', 'pods'),
+    'cpu_cap': ('nodes',),
+    'mem_req': ('nodes', 'pods'),
+    'mem_cap': ('nodes',),
+    'pending': ('pods',),
+    'active_workers': ('nodes',),
+    'cpu_usage_pct': ('nodes', 'metrics'),
+    'running': ('pods',),
+}
+AI_FIELDS = ('cpu_req', 'cpu_cap', 'mem_req', 'mem_cap', 'pending')
+
+
+class CollectedSample(namedtuple('CollectedSample', ['snapshot', 'stale', 'errors'])):
+    """
+    ผลการเก็บข้อมูล 1 รอบ:
+    - snapshot: ClusterSnapshot (field ที่ไม่เคยดึงสำเร็จเลยจะเป็น None)
+    - stale: {field: True/False} True = ใช้ค่าเก่าจากรอบก่อนหน้า (แหล่งข้อมูลช้า/ล่ม)
+    - errors: {source: ข้อความ error} ของแหล่งที่รอบนี้ดึงไม่สำเร็จ
+    """
+
+    def has_ai_features(self):
+        return all(getattr(self.snapshot, f) is not None for f in AI_FIELDS)
+
+    def stale_fields(self):
+        return [f for f, is_stale in self.stale.items() if is_stale]
+
+
+class AsyncCollector:
+    """
+    ดึง nodes / pods / metrics พร้อมกันด้วย asyncio โดยแต่ละแหล่งมี deadline ของตัวเอง
+    แหล่งที่ไม่ทันจะใช้ค่าล่าสุดที่เคยได้ และติดธง stale แทนการรอหรือแทนด้วย 0.0
+    ถ้าส่ง informer มา จะอ่าน nodes/pods จาก cache และดึงแค่ metrics
+    """
+
+    def __init__(self, client=None, timeouts=None, namespace=None, informer=None, informer_max_age=INFORMER_MAX_AGE):
+        self.client = client or get_client()
+        self.timeouts = dict(SOURCE_TIMEOUTS, **(timeouts or {}))
+        self.namespace = namespace
+        self.informer = informer
+        self.informer_max_age = informer_max_age
+        self._last = {}      # source -> (value, monotonic time ที่ได้มา)
+        # executor ของตัวเอง: request ที่เกิน deadline วิ่งต่อเบื้องหลังได้โดยไม่ขวาง asyncio.run() รอบนี้
+        self._executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix='collector')
+
+    def _sources(self):
+        sources = {'metrics': lambda: self.client.node_metrics()['items']}
+        if self.informer is None:
+            sources['nodes'] = lambda: self.client.list_nodes()['items']
+            sources['pods'] = lambda: self.client.list_pods()['items']
+        return sources
+
+    async def _fetch(self, name, func):
+        try:
+            loop = asyncio.get_running_loop()
+            value = await asyncio.wait_for(loop.run_in_executor(self._executor, func), self.timeouts[name])
+            return name, value, None
+        except asyncio.TimeoutError:
+            return name, None, f"timeout > {self.timeouts[name]}s"
+        except Exception as e:
+            return name, None, str(e)
+
+    async def collect(self):
+        results = await asyncio.gather(*(self._fetch(n, f) for n, f in self._sources().items()))
+
+        now = time.monotonic()
+        values, fresh, errors = {}, {}, {}
+        for name, value, error in results:
+            if error is None:
+                self._last[name] = (value, now)
+            else:
+                errors[name] = error
+            fresh[name] = error is None
+            values[name] = self._last.get(name, (None, None))[0]
+
+        if self.informer is not None:
+            synced = self.informer.wait_synced(0)
+            for kind in ('nodes', 'pods'):
+                age = self.informer.age(kind)
+                fresh[kind] = synced and age <= self.informer_max_age
+                if synced and not fresh[kind]:
+                    errors[kind] = f"informer watch down for {age:.0f}s"
+            snapshot = self.informer.snapshot(values['metrics'])
+            if not synced:
+                snapshot = snapshot._replace(**{f: None for f in FIELD_SOURCES if f != 'cpu_usage_pct'})
+        elif values['nodes'] is None:
+            snapshot = ClusterSnapshot(*([None] * len(ClusterSnapshot._fields)))
+        else:
+            snapshot = build_snapshot(values['nodes'], values['pods'] or [], values['metrics'],
+                                      namespace=self.namespace)
+            if values['pods'] is None:
+                snapshot = snapshot._replace(cpu_req=None, mem_req=None, pending=None, running=None)
+
+        if values['metrics'] is None:
+            snapshot = snapshot._replace(cpu_usage_pct=None)
+
+        stale = {f: not all(fresh[s] for s in srcs) for f, srcs in FIELD_SOURCES.items()}
+        return CollectedSample(snapshot, stale, errors)
+
+    def collect_sync(self):
+        return asyncio.run(self.collect())
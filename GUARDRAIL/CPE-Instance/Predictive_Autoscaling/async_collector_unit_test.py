@@ -0,0 +1,95 @@
+import threading
+import time
+
+from async_collector import AsyncCollector
+from cluster_informer import ClusterInformer
+from cluster_informer_unit_test import FakeWatchSource
+from cluster_snapshot_unit_test import make_node, make_pod
+from kube_client import KubeConnectionError
+
+
+class FakeClient:
+    """ Client จำลอง: กำหนดได้ว่าแหล่งไหนช้า (วินาที) หรือพัง """
+
+    def __init__(self):
+        self.delay = {'nodes': 0.0, 'pods': 0.0, 'metrics': 0.0}
+        self.broken = set()
+
+    def _serve(self, name, items):
+        time.sleep(self.delay[name])
+        if name in self.broken:
+            raise KubeConnectionError(f"{name} down")
+        return {'items': items}
+
+    def list_nodes(self):
+        return self._serve('nodes', [make_node('w1')])
+
+    def list_pods(self):
+        return self._serve('pods', [make_pod('a', 'w1', containers=[{'cpu': '1'}])])
+
+    def node_metrics(self):
+        return self._serve('metrics', [{'metadata': {'name': 'w1'}, 'usage': {'cpu': '1'}}])
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Async Collector (Unit Testing)\n" + "="*50)
+
+    client = FakeClient()
+    collector = AsyncCollector(client, timeouts={'nodes': 0.5, 'pods': 0.5, 'metrics': 0.2})
+
+    print("▶️ TEST 1: ทุกแหล่งตอบทัน -> ไม่มี field stale")
+    sample = collector.collect_sync()
+    assert sample.has_ai_features() and not sample.stale_fields() and not sample.errors
+    assert sample.snapshot.cpu_usage_pct == 25.0
+    print(f"ผลลัพธ์ 🤖: {sample.snapshot}\n")
+
+    print("▶️ TEST 2: metrics-server ช้า -> ไม่รอ ใช้ค่าเก่าและติดธง stale")
+    client.delay['metrics'] = 2.0
+    start = time.monotonic()
+    sample = collector.collect_sync()
+    elapsed = time.monotonic() - start
+    print(f"ผลลัพธ์ 🤖: ใช้เวลา {elapsed:.2f}s | stale={sample.stale_fields()} | errors={sample.errors}")
+    assert elapsed < 1.0
+    assert sample.stale_fields() == ['cpu_usage_pct'] and sample.snapshot.cpu_usage_pct == 25.0
+    client.delay['metrics'] = 0.0
+    print()
+
+    print("▶️ TEST 3: แหล่งที่ไม่เคยดึงได้เลย -> เป็น None ไม่ใช่ 0.0")
+    fresh = AsyncCollector(client, timeouts={'nodes': 0.5, 'pods': 0.5, 'metrics': 0.2})
+    client.broken.add('pods')
+    sample = fresh.collect_sync()
+    print(f"ผลลัพธ์ 🤖: {sample.snapshot}")
+    assert not sample.has_ai_features()
+    assert sample.snapshot.pending is None and sample.snapshot.cpu_cap == 4.0
+    client.broken.clear()
+    print()
+
+    print("▶️ TEST 4: watch ของ Informer หลุดค้าง -> nodes/pods จาก cache ติดธง stale (ไม่ใช่แค่ดู sync ครั้งแรก)")
+    source = FakeWatchSource([make_node('w1')], [make_pod('a', 'w1', containers=[{'cpu': '1'}])])
+    informer = ClusterInformer(source)
+    informer.sync_once('nodes')
+    informer.sync_once('pods')
+    cached = AsyncCollector(client, timeouts={'metrics': 0.2}, informer=informer, informer_max_age=0.1)
+    assert not cached.collect_sync().stale_fields()
+
+    def broken_watch(kind, resource_version, timeout_seconds):
+        raise KubeConnectionError(f"watch {kind}: connection reset")
+        yield
+
+    source.watch = broken_watch
+    watcher = threading.Thread(target=informer._run, args=('pods',), daemon=True)
+    watcher.start()
+    time.sleep(0.3)
+    sample = cached.collect_sync()
+    informer.stop()
+    watcher.join()
+    print(f"ผลลัพธ์ 🤖: stale={sample.stale_fields()} | errors={sample.errors}")
+    assert sample.stale_fields() == ['cpu_req', 'mem_req', 'pending', 'running'] and 'pods' in sample.errors
+    assert sample.snapshot.cpu_req == 1.0            # ยังใช้ค่าจาก cache ได้ แต่รู้ว่าค้าง
+    print()
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,96 @@
+import argparse
+import multiprocessing
+import os
+import resource
+import time
+
+import numpy as np
+
+from model_runner import BACKENDS
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+MODEL_PATHS = [
+    'best_single_var_model.keras',
+    'Multi_Feature_Resource_Turn_Parameter/Multi-Variable_LSTM_Model.keras',
+]
+RUNS = 500
+
+
+def measure(fn, X_input, runs):
+    """ เวลาที่ใช้ต่อการเรียก 1 ครั้ง (ms) """
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(X_input)
+        samples.append((time.perf_counter() - start) * 1000)
+    return np.array(samples)
+
+
+def run_backend(path, backend, runs):
+    """
+    วัด 1 backend ใน process ใหม่ (spawn) -> cold start กับ memory ไม่ปนกับ backend อื่น
+    คืน dict ของผลวัด หรือ {'error': ...}
+    """
+    started = time.perf_counter()
+    try:
+        from model_runner import load_runner
+        runner = load_runner(path, backend)
+    except (ImportError, OSError) as e:
+        return {'error': str(e)}
+    load_s = time.perf_counter() - started
+
+    X_input = np.random.default_rng(0).random(runner.input_shape, dtype=np.float32)
+    result = {
+        'load_s': load_s,
+        'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'output': runner.predict(X_input),
+        'latency': measure(runner.predict, X_input, runs),
+    }
+    if backend == 'keras':
+        # model.predict แบบเดิม (ค่าอ้างอิงของทุก backend)
+        result['output'] = runner.model.predict(X_input, verbose=0)
+        result['baseline_latency'] = measure(lambda x: runner.model.predict(x, verbose=0), X_input, runs)
+    return result
+
+
+def report(name, result, reference=None):
+    p50, p99 = np.percentile(result['latency'], [50, 99])
+    line = (f"    {name:<22} p50 {p50:8.3f} ms | p99 {p99:8.3f} ms"
+            f" | load {result['load_s']:6.2f} s | peak RSS {result['rss_mb']:7.1f} MB")
+    if reference is not None:
+        line += f" | max |diff| {float(np.max(np.abs(result['output'] - reference))):.2e}"
+    print(line)
+
+
+def benchmark(path, backends=BACKENDS, runs=RUNS):
+    print(f"\n📦 {path}")
+    if not os.path.exists(path):
+        print("    ⚠️ ไม่พบไฟล์โมเดล ข้าม")
+        return
+
+    ctx = multiprocessing.get_context('spawn')
+    reference = None
+    for backend in backends:
+        with ctx.Pool(1) as pool:
+            result = pool.apply(run_backend, (path, backend, runs))
+        if 'error' in result:
+            print(f"    ⚠️ [{backend}] โหลดไม่ได้ ({result['error']}) ข้าม")
+            continue
+        if 'baseline_latency' in result:
+            reference = result['output']
+            report("keras model.predict", dict(result, latency=result['baseline_latency']))
+        report(backend, result, reference)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Single-window inference latency (p50/p99), cold start and memory per backend")
+    parser.add_argument('models', nargs='*', default=MODEL_PATHS)
+    parser.add_argument('--runs', type=int, default=RUNS)
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=list(BACKENDS))
+    args = parser.parse_args()
+
+    print(f"⏱️ วัด latency ทำนายทีละ 1 window ({args.runs} ครั้งต่อโมเดล) แต่ละ backend แยก process")
+    for path in args.models:
+        benchmark(path, args.backends, args.runs)
@@ -0,0 +1,290 @@
+import threading
+import time
+
+from cluster_snapshot import (
+    BYTES_PER_GB, TERMINATED_PHASES, ClusterSnapshot,
+    is_node_ready, is_pod_unschedulable, is_worker_node, parse_quantity, pod_requests,
+)
+from kube_client import KubeApiError, get_client
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+RESYNC_PERIOD = 300      # list ใหม่ทั้งก้อนทุก 5 นาที กันกรณี event หล่นหาย
+WATCH_TIMEOUT = 240      # ให้ API Server ตัด watch เองก่อนถึงรอบ resync
+RETRY_DELAY = 5
+KINDS = ('nodes', 'pods')
+
+
+class WatchExpired(Exception):
+    """ resourceVersion เก่าเกินไป (HTTP 410 Gone) ต้อง list ใหม่ """
+
+
+# ==========================================
+# 📡 WATCH SOURCE (Kubernetes API ผ่าน kube_client)
+# ==========================================
+class KubeWatchSource:
+    """
+    ต่อ watch stream ของ API Server ผ่าน KubeClient (connection pool เดียวกับส่วนอื่น)
+    interface: list(kind) -> (items, resourceVersion), watch(kind, rv, timeout) -> iter ของ event
+    """
+
+    PATHS = {'nodes': '/api/v1/nodes', 'pods': '/api/v1/pods'}
+
+    def __init__(self, client=None):
+        self.client = client or get_client()
+
+    def list(self, kind):
+        data = self.client.get(self.PATHS[kind])
+        return data['items'], data['metadata']['resourceVersion']
+
+    def watch(self, kind, resource_version, timeout_seconds):
+        try:
+            yield from self.client.watch(self.PATHS[kind], resource_version, timeout_seconds)
+        except KubeApiError as e:
+            if e.status == 410:
+                raise WatchExpired(e.message) from e
+            raise
+
+
+# ==========================================
+# 🧠 INFORMER CACHE
+# ==========================================
+class ClusterInformer:
+    """
+    Cache ของ nodes/pods ที่อัปเดตจาก watch stream และเก็บผลรวมแบบ running total
+    ทำให้ snapshot() แต่ละรอบเป็นแค่การอ่านค่า O(1) ไม่ต้อง scan ทั้ง Cluster ใหม่
+    on_unschedulable(n): เรียกจาก watch thread ทันทีที่มี Pod (ใน namespace) เพิ่งกลายเป็น Unschedulable n ตัว
+    """
+
+    def __init__(self, source, namespace=None, resync_period=RESYNC_PERIOD, watch_timeout=WATCH_TIMEOUT,
+                 on_unschedulable=None):
+        self.source = source
+        self.namespace = namespace          # namespace ที่ใช้นับ Pending/Running (None = ทุก namespace)
+        self.on_unschedulable = on_unschedulable
+        self.resync_period = resync_period
+        self.watch_timeout = watch_timeout
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._synced = {kind: threading.Event() for kind in KINDS}
+        self._resource_version = {kind: None for kind in KINDS}
+        self._last_list = {kind: 0.0 for kind in KINDS}
+        self._last_contact = {kind: None for kind in KINDS}   # monotonic ล่าสุดที่ list / event / watch จบปกติ
+        self._failing = {kind: False for kind in KINDS}       # watch หลุดและยังต่อกลับไม่สำเร็จ
+
+        self._nodes = {}      # name -> (active, cpu_cap, mem_cap)   active = Worker ที่ Ready
+        self._pods = {}       # ns/name -> (node, cpu, mem, phase, counted)
+        self._node_req = {}   # name -> [cpu, mem] ของ Pod ที่ยังไม่จบบน Node นั้น
+        self._unschedulable = set()   # ns/name ของ Pod ที่ scheduler หาที่ลงไม่ได้ (แจ้งเฉพาะตอนเพิ่งเข้า set)
+        self._reset_totals()
+
+    # ---------- aggregates ----------
+    def _reset_totals(self):
+        self._cpu_req = self._mem_req = 0.0
+        self._cpu_cap = self._mem_cap = 0.0
+        self._active_workers = 0
+        self._pending = self._running = 0
+
+    def _recompute(self):
+        """ คำนวณผลรวมใหม่ทั้งหมดหลัง list (ล้าง float drift จาก +/- สะสม) """
+        self._reset_totals()
+        self._node_req = {}
+        for node, cpu, mem, phase, counted in self._pods.values():
+            self._count_phase(phase, counted, +1)
+            if node and phase not in TERMINATED_PHASES:
+                req = self._node_req.setdefault(node, [0.0, 0.0])
+                req[0] += cpu
+                req[1] += mem
+        for name, (active, cpu_cap, mem_cap) in self._nodes.items():
+            if active:
+                self._add_node(name, cpu_cap, mem_cap, +1)
+
+    def _count_phase(self, phase, counted, sign):
+        if not counted:
+            return
+        if phase == 'Pending':
+            self._pending += sign
+        elif phase == 'Running':
+            self._running += sign
+
+    def _add_node(self, name, cpu_cap, mem_cap, sign):
+        req = self._node_req.get(name, (0.0, 0.0))
+        self._active_workers += sign
+        self._cpu_cap += sign * cpu_cap
+        self._mem_cap += sign * mem_cap
+        self._cpu_req += sign * req[0]
+        self._mem_req += sign * req[1]
+
+    def _node_entry(self, node):
+        capacity = (node.get('status') or {}).get('capacity') or {}
+        return (is_worker_node(node) and is_node_ready(node),
+                parse_quantity(capacity.get('cpu')),
+                parse_quantity(capacity.get('memory')))
+
+    def _pod_entry(self, pod):
+        meta = pod['metadata']
+        cpu, mem = pod_requests(pod)
+        counted = self.namespace is None or meta.get('namespace') == self.namespace
+        return ((pod.get('spec') or {}).get('nodeName'), cpu, mem,
+                (pod.get('status') or {}).get('phase'), counted)
+
+    def _is_unschedulable(self, pod):
+        return ((self.namespace is None or pod['metadata'].get('namespace') == self.namespace)
+                and is_pod_unschedulable(pod))
+
+    @staticmethod
+    def _pod_key(pod):
+        meta = pod['metadata']
+        return f"{meta.get('namespace')}/{meta['name']}"
+
+    def _set_node(self, name, entry):
+        old = self._nodes.pop(name, None)
+        if old is not None and old[0]:
+            self._add_node(name, old[1], old[2], -1)
+        if entry is not None:
+            self._nodes[name] = entry
+            if entry[0]:
+                self._add_node(name, entry[1], entry[2], +1)
+
+    def _set_pod(self, key, entry):
+        for e, sign in ((self._pods.pop(key, None), -1), (entry, +1)):
+            if e is None:
+                continue
+            node, cpu, mem, phase, counted = e
+            self._count_phase(phase, counted, sign)
+            if node and phase not in TERMINATED_PHASES:
+                req = self._node_req.setdefault(node, [0.0, 0.0])
+                req[0] += sign * cpu
+                req[1] += sign * mem
+                if self._nodes.get(node, (False,))[0]:
+                    self._cpu_req += sign * cpu
+                    self._mem_req += sign * mem
+        if entry is not None:
+            self._pods[key] = entry
+
+    # ---------- event handling ----------
+    def replace(self, kind, items, resource_version):
+        """ แทนที่ state ทั้งหมดของ kind นั้นด้วยผลจากการ list """
+        new_unschedulable = 0
+        with self._lock:
+            if kind == 'nodes':
+                self._nodes = {n['metadata']['name']: self._node_entry(n) for n in items}
+            else:
+                self._pods = {self._pod_key(p): self._pod_entry(p) for p in items}
+                unschedulable = {self._pod_key(p) for p in items if self._is_unschedulable(p)}
+                new_unschedulable = len(unschedulable - self._unschedulable)
+                self._unschedulable = unschedulable
+            self._recompute()
+            self._resource_version[kind] = resource_version
+            self._last_list[kind] = time.monotonic()
+            self._mark_contact(kind)
+        self._synced[kind].set()
+        self._notify_unschedulable(new_unschedulable)
+
+    def _mark_contact(self, kind):
+        self._last_contact[kind] = time.monotonic()
+        self._failing[kind] = False
+
+    def _notify_unschedulable(self, count):
+        if count and self.on_unschedulable is not None:
+            self.on_unschedulable(count)
+
+    def apply_event(self, kind, event):
+        """ อัปเดต cache จาก watch event 1 ตัว (ADDED / MODIFIED / DELETED / BOOKMARK / ERROR) """
+        etype = event.get('type')
+        obj = event.get('object') or {}
+        if etype == 'ERROR':
+            if obj.get('code') == 410:
+                raise WatchExpired(obj.get('message', 'resourceVersion too old'))
+            raise RuntimeError(f"watch {kind} error: {obj.get('message')}")
+
+        new_unschedulable = 0
+        with self._lock:
+            if etype in ('ADDED', 'MODIFIED', 'DELETED'):
+                if kind == 'nodes':
+                    entry = None if etype == 'DELETED' else self._node_entry(obj)
+                    self._set_node(obj['metadata']['name'], entry)
+                else:
+                    key = self._pod_key(obj)
+                    entry = None if etype == 'DELETED' else self._pod_entry(obj)
+                    self._set_pod(key, entry)
+                    if etype != 'DELETED' and self._is_unschedulable(obj):
+                        new_unschedulable = int(key not in self._unschedulable)
+                        self._unschedulable.add(key)
+                    else:
+                        self._unschedulable.discard(key)
+            rv = (obj.get('metadata') or {}).get('resourceVersion')
+            if rv:
+                self._resource_version[kind] = rv
+            self._mark_contact(kind)
+        self._notify_unschedulable(new_unschedulable)
+
+    def sync_once(self, kind):
+        """ list (ถ้ายังไม่มี resourceVersion หรือถึงรอบ resync) แล้วตาม watch จน stream ปิด """
+        if (self._resource_version[kind] is None
+                or time.monotonic() - self._last_list[kind] >= self.resync_period):
+            items, rv = self.source.list(kind)
+            self.replace(kind, items, rv)
+
+        for event in self.source.watch(kind, self._resource_version[kind], self.watch_timeout):
+            self.apply_event(kind, event)
+            if self._stop.is_set() or time.monotonic() - self._last_list[kind] >= self.resync_period:
+                break
+        with self._lock:
+            self._mark_contact(kind)   # stream ปิดตาม timeout ปกติ = ยังต่อ API Server ได้
+
+    # ---------- background threads ----------
+    def _run(self, kind):
+        while not self._stop.is_set():
+            try:
+                self.sync_once(kind)
+            except WatchExpired:
+                self._resource_version[kind] = None   # resume ไม่ได้ -> list ใหม่
+            except Exception as e:
+                with self._lock:
+                    self._failing[kind] = True
+                print(f"⚠️ [Informer] watch {kind} หลุด: {e} (ลองใหม่ใน {RETRY_DELAY} วิ)")
+                self._stop.wait(RETRY_DELAY)
+
+    def start(self):
+        for kind in KINDS:
+            t = threading.Thread(target=self._run, args=(kind,), name=f"informer-{kind}", daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def wait_synced(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for event in self._synced.values():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not event.wait(remaining):
+                return False
+        return True
+
+    def age(self, kind):
+        """ วินาทีที่ cache ของ kind นี้ค้างอยู่เพราะ watch หลุด (0 = watch ปกติ | inf = ยังไม่เคย sync) """
+        with self._lock:
+            if self._last_contact[kind] is None:
+                return float('inf')
+            return time.monotonic() - self._last_contact[kind] if self._failing[kind] else 0.0
+
+    def snapshot(self, node_metrics=None):
+        """ อ่านผลรวมปัจจุบัน (O(1)) + คิด CPU Usage % จาก metrics-server ถ้าส่งมา """
+        with self._lock:
+            cpu_usage = 0.0
+            for item in node_metrics or []:
+                if self._nodes.get(item['metadata']['name'], (False,))[0]:
+                    cpu_usage += parse_quantity(item['usage'].get('cpu'))
+            cpu_cap = self._cpu_cap
+            return ClusterSnapshot(
+                cpu_req=max(self._cpu_req, 0.0), cpu_cap=cpu_cap,
+                mem_req=max(self._mem_req, 0.0) / BYTES_PER_GB, mem_cap=self._mem_cap / BYTES_PER_GB,
+                pending=self._pending, active_workers=self._active_workers,
+                cpu_usage_pct=(cpu_usage / cpu_cap) * 100 if cpu_cap > 0 else 0.0,
+                running=self._running,
+            )
@@ -0,0 +1,87 @@
+from cluster_informer import ClusterInformer, WatchExpired
+from cluster_snapshot import build_snapshot
+from cluster_snapshot_unit_test import make_node, make_pod
+
+
+class FakeWatchSource:
+    """ แหล่ง watch จำลอง: list คืนค่าจาก dict, watch คืน event ตามคิวที่เตรียมไว้ """
+
+    def __init__(self, nodes, pods):
+        self.items = {'nodes': list(nodes), 'pods': list(pods)}
+        self.streams = {'nodes': [], 'pods': []}
+        self.list_calls = 0
+        self.watch_from = []
+
+    def list(self, kind):
+        self.list_calls += 1
+        return list(self.items[kind]), '100'
+
+    def watch(self, kind, resource_version, timeout_seconds):
+        self.watch_from.append((kind, resource_version))
+        events = self.streams[kind].pop(0) if self.streams[kind] else []
+        for e in events:
+            yield e
+
+
+def event(etype, obj, rv):
+    obj['metadata']['resourceVersion'] = rv
+    return {'type': etype, 'object': obj}
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Cluster Informer (Unit Testing)\n" + "="*50)
+
+    nodes = [make_node('master', control_plane=True), make_node('w1'), make_node('w2', ready=False)]
+    pods = [make_pod('a', 'w1', containers=[{'cpu': '1', 'memory': '1Gi'}])]
+    source = FakeWatchSource(nodes, pods)
+    informer = ClusterInformer(source)
+
+    print("▶️ TEST 1: list ครั้งแรกต้องตรงกับ build_snapshot")
+    informer.sync_once('nodes')
+    informer.sync_once('pods')
+    assert informer.wait_synced(0)
+    assert informer.snapshot() == build_snapshot(nodes, pods)
+    print(f"ผลลัพธ์ 🤖: {informer.snapshot()}\n")
+
+    print("▶️ TEST 2: watch event อัปเดตผลรวมแบบ incremental และ resume จาก resourceVersion")
+    source.streams['pods'].append([
+        event('ADDED', make_pod('b', 'w2', containers=[{'cpu': '2'}]), '101'),
+        event('ADDED', make_pod('c', None, phase='Pending', containers=[{'cpu': '1'}]), '102'),
+    ])
+    source.streams['nodes'].append([event('MODIFIED', make_node('w2'), '103')])
+    informer.sync_once('pods')
+    assert informer.snapshot().cpu_req == 1.0      # w2 ยังไม่ Ready -> ไม่นับ
+    informer.sync_once('nodes')
+    snap = informer.snapshot()
+    assert snap.cpu_req == 3.0 and snap.cpu_cap == 8.0 and snap.active_workers == 2 and snap.pending == 1
+    assert ('pods', '100') in source.watch_from and source.list_calls == 2
+
+    source.streams['pods'].append([
+        event('MODIFIED', make_pod('c', 'w1', containers=[{'cpu': '1'}]), '104'),
+        event('DELETED', make_pod('a', 'w1', containers=[{'cpu': '1', 'memory': '1Gi'}]), '105'),
+    ])
+    informer.sync_once('pods')
+    final_pods = [make_pod('b', 'w2', containers=[{'cpu': '2'}]), make_pod('c', 'w1', containers=[{'cpu': '1'}])]
+    final_nodes = [make_node('master', control_plane=True), make_node('w1'), make_node('w2')]
+    assert informer.snapshot() == build_snapshot(final_nodes, final_pods)
+    assert source.watch_from[-1] == ('pods', '102')
+    print(f"ผลลัพธ์ 🤖: {informer.snapshot()}\n")
+
+    print("▶️ TEST 3: 410 Gone ต้องทำให้ list ใหม่")
+    source.streams['pods'].append([{'type': 'ERROR', 'object': {'code': 410, 'message': 'too old'}}])
+    try:
+        informer.sync_once('pods')
+        assert False, "ควร raise WatchExpired"
+    except WatchExpired:
+        informer._resource_version['pods'] = None
+    source.items['pods'] = final_pods
+    informer.sync_once('pods')
+    assert source.list_calls == 3
+    assert informer.snapshot() == build_snapshot(final_nodes, final_pods)
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
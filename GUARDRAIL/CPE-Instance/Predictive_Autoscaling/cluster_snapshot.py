@@ -0,0 +1,217 @@
+from collections import namedtuple
+
+from kube_client import KubeError, get_client
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+BYTES_PER_GB = 1024.0 * 1024.0 * 1024.0   # PromQL ตอนเทรนหารด้วย (1024*1024*1024)
+CONTROL_PLANE_LABELS = (
+    'node-role.kubernetes.io/control-plane',
+    'node-role.kubernetes.io/master',
+)
+TERMINATED_PHASES = ('Succeeded', 'Failed')
+POD_NAMESPACE = 'default'   # namespace ที่นับ Pending/Running ให้โมเดล (ตรงกับ PromQL ตอนเทรน) ทุกแหล่งข้อมูลต้องใช้ค่าเดียวกัน
+
+_BINARY_SUFFIXES = {
+    'Ki': 1024.0, 'Mi': 1024.0 ** 2, 'Gi': 1024.0 ** 3,
+    'Ti': 1024.0 ** 4, 'Pi': 1024.0 ** 5, 'Ei': 1024.0 ** 6,
+}
+_DECIMAL_SUFFIXES = {
+    'n': 1e-9, 'u': 1e-6, 'm': 1e-3, 'k': 1e3,
+    'M': 1e6, 'G': 1e9, 'T': 1e12, 'P': 1e15, 'E': 1e18,
+}
+
+
+class ClusterSnapshot(namedtuple('ClusterSnapshot', [
+        'cpu_req', 'cpu_cap', 'mem_req', 'mem_cap', 'pending',
+        'active_workers', 'cpu_usage_pct', 'running'])):
+    """ภาพรวม Cluster 1 จังหวะ: 5 ตัวแปรของ AI + ค่าที่ DecisionEngine ใช้"""
+
+    def ai_features(self):
+        return (self.cpu_req, self.cpu_cap, self.mem_req, self.mem_cap, self.pending)
+
+
+# ==========================================
+# 🛠️ QUANTITY & REQUEST HELPERS
+# ==========================================
+def parse_quantity(value):
+    """ แปลง Kubernetes quantity (เช่น 250m, 512Mi, 1.5Gi, 2e3) เป็นหน่วยฐาน (cores / bytes) """
+    if value is None:
+        return 0.0
+    value = str(value).strip()
+    if not value:
+        return 0.0
+    try:
+        for suffix, factor in _BINARY_SUFFIXES.items():
+            if value.endswith(suffix):
+                return float(value[:-2]) * factor
+        if value[-1] in _DECIMAL_SUFFIXES:
+            return float(value[:-1]) * _DECIMAL_SUFFIXES[value[-1]]
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def _container_requests(container):
+    requests = (container.get('resources') or {}).get('requests') or {}
+    return parse_quantity(requests.get('cpu')), parse_quantity(requests.get('memory'))
+
+
+def pod_requests(pod):
+    """
+    คำนวณ Request ที่ Pod จองไว้บน Node ตามกฎของ kubelet/scheduler:
+    - container ปกติ + sidecar (init ที่ restartPolicy=Always) รวมกัน
+    - init container ธรรมดารันทีละตัว จึงคิดค่า max (บวก sidecar ที่เริ่มไปก่อนหน้า)
+    - เอาค่าที่มากกว่าระหว่างสองฝั่ง แล้วบวก pod overhead
+    """
+    spec = pod.get('spec') or {}
+
+    cpu_sum, mem_sum = 0.0, 0.0
+    for c in spec.get('containers') or []:
+        cpu, mem = _container_requests(c)
+        cpu_sum += cpu
+        mem_sum += mem
+
+    sidecar_cpu, sidecar_mem = 0.0, 0.0
+    init_cpu, init_mem = 0.0, 0.0
+    for c in spec.get('initContainers') or []:
+        cpu, mem = _container_requests(c)
+        if c.get('restartPolicy') == 'Always':
+            cpu_sum += cpu
+            mem_sum += mem
+            sidecar_cpu += cpu
+            sidecar_mem += mem
+            cpu, mem = sidecar_cpu, sidecar_mem
+        else:
+            cpu += sidecar_cpu
+            mem += sidecar_mem
+        init_cpu = max(init_cpu, cpu)
+        init_mem = max(init_mem, mem)
+
+    overhead = spec.get('overhead') or {}
+    return (max(cpu_sum, init_cpu) + parse_quantity(overhead.get('cpu')),
+            max(mem_sum, init_mem) + parse_quantity(overhead.get('memory')))
+
+
+def is_node_ready(node):
+    for cond in (node.get('status') or {}).get('conditions') or []:
+        if cond.get('type') == 'Ready':
+            return cond.get('status') == 'True'
+    return False
+
+
+def is_pod_unschedulable(pod):
+    """ Pod ที่ scheduler หาที่ลงไม่ได้ (PodScheduled=False, reason Unschedulable) ไม่ใช่แค่ Pending ชั่วครู่ก่อนถูก schedule """
+    status = pod.get('status') or {}
+    if status.get('phase') != 'Pending':
+        return False
+    for cond in status.get('conditions') or []:
+        if cond.get('type') == 'PodScheduled':
+            return cond.get('status') == 'False' and cond.get('reason') == 'Unschedulable'
+    return False
+
+
+def is_worker_node(node):
+    labels = (node.get('metadata') or {}).get('labels') or {}
+    return not any(label in labels for label in CONTROL_PLANE_LABELS)
+
+
+# ==========================================
+# 📊 SNAPSHOT (คำนวณในเครื่องจาก nodes + pods list)
+# ==========================================
+def build_snapshot(nodes, pods, node_metrics=None, namespace=None):
+    """
+    รวม feature vector ทั้งหมดจาก list ของ nodes และ pods (dict แบบเดียวกับ `kubectl get -o json`)
+    - Req/Cap/Usage นับเฉพาะ Worker ที่ Ready (ตามที่เทรนโมเดลมา)
+    - Pending/Running นับเฉพาะ namespace ที่กำหนด (None = ทุก namespace)
+    """
+    workers = {}
+    for node in nodes:
+        if is_worker_node(node) and is_node_ready(node):
+            workers[node['metadata']['name']] = node
+
+    cpu_cap, mem_cap = 0.0, 0.0
+    for node in workers.values():
+        capacity = (node.get('status') or {}).get('capacity') or {}
+        cpu_cap += parse_quantity(capacity.get('cpu'))
+        mem_cap += parse_quantity(capacity.get('memory'))
+
+    cpu_req, mem_req = 0.0, 0.0
+    pending, running = 0, 0
+    for pod in pods:
+        phase = (pod.get('status') or {}).get('phase')
+        if namespace is None or pod['metadata'].get('namespace') == namespace:
+            if phase == 'Pending':
+                pending += 1
+            elif phase == 'Running':
+                running += 1
+        if phase in TERMINATED_PHASES:
+            continue
+        if (pod.get('spec') or {}).get('nodeName') in workers:
+            cpu, mem = pod_requests(pod)
+            cpu_req += cpu
+            mem_req += mem
+
+    cpu_usage = 0.0
+    for item in node_metrics or []:
+        if item['metadata']['name'] in workers:
+            cpu_usage += parse_quantity(item['usage'].get('cpu'))
+
+    cpu_usage_pct = (cpu_usage / cpu_cap) * 100 if cpu_cap > 0 else 0.0
+
+    return ClusterSnapshot(
+        cpu_req=cpu_req, cpu_cap=cpu_cap,
+        mem_req=mem_req / BYTES_PER_GB, mem_cap=mem_cap / BYTES_PER_GB,
+        pending=pending, active_workers=len(workers),
+        cpu_usage_pct=cpu_usage_pct, running=running,
+    )
+
+
+def per_node_resources(nodes, pods, node_metrics=None):
+    """
+    ค่ารายเครื่อง (ทุก Node รวม Master) หน่วยฐาน cores / bytes:
+    {name: {'cpu_req', 'mem_req', 'cpu_cap', 'mem_cap', 'cpu_usage', 'mem_usage'}}
+    """
+    data = {}
+    for node in nodes:
+        capacity = (node.get('status') or {}).get('capacity') or {}
+        data[node['metadata']['name']] = {
+            'cpu_req': 0.0, 'mem_req': 0.0,
+            'cpu_cap': parse_quantity(capacity.get('cpu')),
+            'mem_cap': parse_quantity(capacity.get('memory')),
+            'cpu_usage': 0.0, 'mem_usage': 0.0,
+        }
+    for pod in pods:
+        node = data.get((pod.get('spec') or {}).get('nodeName'))
+        if node is None or (pod.get('status') or {}).get('phase') in TERMINATED_PHASES:
+            continue
+        cpu, mem = pod_requests(pod)
+        node['cpu_req'] += cpu
+        node['mem_req'] += mem
+    for item in node_metrics or []:
+        node = data.get(item['metadata']['name'])
+        if node is not None:
+            node['cpu_usage'] = parse_quantity(item['usage'].get('cpu'))
+            node['mem_usage'] = parse_quantity(item['usage'].get('memory'))
+    return data
+
+
+def fetch_node_metrics(client=None):
+    """ CPU/Mem Usage ทุก Node จาก metrics-server (คืน [] ถ้า Metrics Server มีปัญหา) """
+    client = client or get_client()
+    try:
+        return client.node_metrics()['items']
+    except KubeError:
+        return []   # Usage = 0 แต่ feature ของ AI ยังครบ
+
+
+def fetch_cluster_snapshot(namespace=None, client=None):
+    """
+    ดึงข้อมูลทั้ง Cluster ด้วย 3 request คงที่ (ไม่ขึ้นกับจำนวน Node) ผ่าน connection pool เดียว:
+    nodes list, pods list และ metrics-server (สำหรับ CPU Usage %)
+    """
+    client = client or get_client()
+    nodes = client.list_nodes()['items']
+    pods = client.list_pods()['items']
+    return build_snapshot(nodes, pods, fetch_node_metrics(client), namespace=namespace)
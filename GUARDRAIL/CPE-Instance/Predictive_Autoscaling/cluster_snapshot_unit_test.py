@@ -0,0 +1,75 @@
+from cluster_snapshot import build_snapshot, parse_quantity, pod_requests, BYTES_PER_GB
+
+
+def make_node(name, cpu='4', memory='8Gi', ready=True, control_plane=False):
+    labels = {'node-role.kubernetes.io/control-plane': ''} if control_plane else {}
+    return {
+        'metadata': {'name': name, 'labels': labels},
+        'status': {
+            'capacity': {'cpu': cpu, 'memory': memory},
+            'conditions': [{'type': 'Ready', 'status': 'True' if ready else 'False'}],
+        },
+    }
+
+
+def make_pod(name, node=None, phase='Running', namespace='default', containers=(), init_containers=()):
+    return {
+        'metadata': {'name': name, 'namespace': namespace},
+        'spec': {
+            'nodeName': node,
+            'containers': [{'resources': {'requests': r}} for r in containers],
+            'initContainers': list(init_containers),
+        },
+        'status': {'phase': phase},
+    }
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Cluster Snapshot (Unit Testing)\n" + "="*50)
+
+    print("▶️ TEST 1: แปลง Kubernetes quantity")
+    assert parse_quantity('250m') == 0.25
+    assert parse_quantity('2') == 2.0
+    assert parse_quantity('512Mi') == 512 * 1024 ** 2
+    assert parse_quantity('1G') == 1e9
+    assert parse_quantity('') == 0.0
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: init container คิดแบบ max, sidecar คิดแบบบวก")
+    pod = make_pod('p', 'w1', containers=[{'cpu': '100m', 'memory': '100Mi'}, {'cpu': '200m'}],
+                   init_containers=[{'resources': {'requests': {'cpu': '1'}}}])
+    cpu, mem = pod_requests(pod)
+    assert abs(cpu - 1.0) < 1e-9 and mem == 100 * 1024 ** 2
+    pod = make_pod('s', 'w1', containers=[{'cpu': '500m'}],
+                   init_containers=[{'restartPolicy': 'Always', 'resources': {'requests': {'cpu': '250m'}}},
+                                    {'resources': {'requests': {'cpu': '600m'}}}])
+    cpu, _ = pod_requests(pod)
+    assert abs(cpu - 0.85) < 1e-9  # max(500m+250m, 600m+250m)
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: รวม feature 5 มิติ เฉพาะ Worker ที่ Ready")
+    nodes = [
+        make_node('master', control_plane=True),
+        make_node('w1'),
+        make_node('w2', ready=False),
+    ]
+    pods = [
+        make_pod('a', 'w1', containers=[{'cpu': '1', 'memory': '1Gi'}]),
+        make_pod('b', 'master', containers=[{'cpu': '2'}], namespace='kube-system'),
+        make_pod('c', 'w1', phase='Succeeded', containers=[{'cpu': '3'}]),
+        make_pod('d', None, phase='Pending', containers=[{'cpu': '1'}]),
+    ]
+    metrics = [{'metadata': {'name': 'w1'}, 'usage': {'cpu': '2000m'}}]
+    snap = build_snapshot(nodes, pods, metrics)
+    print(f"ผลลัพธ์ 🤖: {snap}")
+    assert snap.ai_features() == (1.0, 4.0, 1.0, 8.0, 1)
+    assert snap.active_workers == 1 and snap.running == 2 and snap.cpu_usage_pct == 50.0
+    assert build_snapshot(nodes, pods, namespace='kube-system').running == 1
+    assert snap.mem_cap == 8 * 1024 ** 3 / BYTES_PER_GB
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
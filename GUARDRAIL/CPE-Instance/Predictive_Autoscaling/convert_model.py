@@ -0,0 +1,126 @@
+import argparse
+import os
+import warnings
+
+import joblib
+import numpy as np
+
+from model_runner import artifact_path, load_runner
+
+warnings.filterwarnings("ignore", category=UserWarning, module='sklearn')
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+DATASET_PATH = '../../../LSTM/PromQL/training_data_prometheus.csv'
+FEATURE_COLUMNS = ['cluster_cpu_req', 'cluster_cpu_cap', 'cluster_mem_req', 'cluster_mem_cap', 'cluster_pods_pending']
+
+# โมเดล -> scaler + คอลัมน์ใน training_data_prometheus.csv ที่ใช้สร้าง window ตรวจผล
+MODELS = {
+    'best_single_var_model.keras': {
+        'scaler': 'scaler.pkl', 'columns': ['cluster_cpu_req']},
+    'Multi_Feature_Resource_Turn_Parameter/Multi-Variable_LSTM_Model.keras': {
+        'scaler': 'Multi_Feature_Resource_Turn_Parameter/Multi-Var_Scaler_Inputs.pkl', 'columns': FEATURE_COLUMNS},
+    '../My_LSTM_Model.h5': {
+        'scaler': None, 'columns': None},     # 22 feature ไม่มีใน CSV -> ใช้ window สุ่มในช่วงหลัง scale [0, 1]
+}
+FORMATS = ('onnx', 'tflite')
+VERIFY_WINDOWS = 256
+TOLERANCE = 1e-4        # |diff| สูงสุดที่ยอมได้ (หน่วยหลัง scale)
+ONNX_OPSET = 17
+
+
+# ==========================================
+# 🔁 CONVERTERS
+# ==========================================
+def fixed_signature(model):
+    """ input shape คงที่ (1, window, features) -> ได้ graph ที่ไม่ต้องรองรับ batch แบบ dynamic """
+    import tensorflow as tf
+    _, window_size, n_features = model.input_shape
+    return tf.TensorSpec((1, window_size, n_features), tf.float32, name='input')
+
+
+def to_onnx(model, out_path):
+    import tf2onnx
+    tf2onnx.convert.from_keras(model, input_signature=(fixed_signature(model),),
+                               opset=ONNX_OPSET, output_path=out_path)
+
+
+def tflite_converter(model):
+    """ TFLiteConverter ของ forward pass input shape คงที่ (quantize_model.py ตั้งค่า quantization ต่อจากนี้) """
+    import tensorflow as tf
+    forward = tf.function(lambda x: model(x, training=False), input_signature=[fixed_signature(model)])
+    return tf.lite.TFLiteConverter.from_concrete_functions([forward.get_concrete_function()], model)
+
+
+def to_tflite(model, out_path, converter=None):
+    converter = converter or tflite_converter(model)
+    with open(out_path, 'wb') as f:
+        f.write(converter.convert())
+
+
+CONVERTERS = {'onnx': to_onnx, 'tflite': to_tflite}
+
+
+# ==========================================
+# ✅ VERIFY
+# ==========================================
+def load_windows(spec, input_shape, n=VERIFY_WINDOWS, dataset_path=DATASET_PATH):
+    """ window ขนาด input_shape[1:] จาก training_data_prometheus.csv (scale แล้ว) กระจายทั่วทั้งไฟล์ """
+    _, window_size, n_features = input_shape
+    if spec.get('columns') is None or not os.path.exists(dataset_path):
+        return np.random.default_rng(0).random((n, window_size, n_features), dtype=np.float32)
+
+    data = np.genfromtxt(dataset_path, delimiter=',', names=True, usecols=spec['columns'])
+    rows = np.column_stack([data[c] for c in spec['columns']])
+    if spec.get('scaler'):
+        rows = joblib.load(spec['scaler']).transform(rows)
+    starts = np.linspace(0, len(rows) - window_size, num=min(n, len(rows) - window_size + 1)).astype(int)
+    return np.stack([rows[s:s + window_size] for s in starts]).astype(np.float32)
+
+
+def max_abs_diff(runner, reference, windows):
+    preds = np.concatenate([runner.predict(w[np.newaxis]) for w in windows])
+    return float(np.max(np.abs(preds - reference)))
+
+
+def convert(path, formats=FORMATS, tolerance=TOLERANCE):
+    from tensorflow.keras.models import load_model
+
+    print(f"\n📦 {path}")
+    if not os.path.exists(path):
+        print("    ⚠️ ไม่พบไฟล์โมเดล ข้าม")
+        return True
+
+    model = load_model(path, compile=False)
+    windows = load_windows(MODELS.get(path, {}), model.input_shape)
+    reference = np.concatenate([model.predict(w[np.newaxis], verbose=0) for w in windows])
+
+    ok = True
+    for fmt in formats:
+        out_path = artifact_path(path, fmt)
+        try:
+            CONVERTERS[fmt](model, out_path)
+            diff = max_abs_diff(load_runner(path, fmt), reference, windows)
+        except Exception as e:
+            print(f"    ❌ [{fmt}] {e}")
+            ok = False
+            continue
+        passed = diff <= tolerance
+        ok = ok and passed
+        size_kb = os.path.getsize(out_path) / 1024
+        print(f"    {'✅' if passed else '❌'} [{fmt}] {out_path} ({size_kb:.0f} KB) | "
+              f"{len(windows)} windows max |diff| = {diff:.2e} (tolerance {tolerance:.0e})")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert Keras models to ONNX / TFLite and check outputs against Keras")
+    parser.add_argument('models', nargs='*', default=list(MODELS))
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=list(FORMATS))
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    args = parser.parse_args()
+
+    results = [convert(path, args.formats, args.tolerance) for path in args.models]
+    print("\n" + ("✅ ทุกไฟล์ผ่านการตรวจ" if all(results) else "❌ มีไฟล์ที่ผลไม่ตรงกับ Keras (ห้ามใช้ใน production)"))
+    raise SystemExit(0 if all(results) else 1)
@@ -0,0 +1,134 @@
+import argparse
+import os
+
+import joblib
+
+from model_evaluation import median_latency_ms, predict_windows, regression_metrics, split_windows
+from model_runner import load_runner
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+TEACHER_PATH = 'Multi_Feature_Resource_Turn_Parameter/Multi-Variable_LSTM_Model.keras'
+SCALER_INPUTS_PATH = 'Multi_Feature_Resource_Turn_Parameter/Multi-Var_Scaler_Inputs.pkl'
+SCALER_TARGET_PATH = 'Multi_Feature_Resource_Turn_Parameter/Multi-Var_Scaler_Target.pkl'
+STUDENT_DIR = 'Multi_Feature_Resource_Turn_Parameter/students'
+
+ALPHA = 0.5              # target = ALPHA * ค่าจริง + (1 - ALPHA) * คำทำนายของ teacher
+EPOCHS = 100             # เท่ากับ notebook (มี EarlyStopping)
+BATCH_SIZE = 32
+PATIENCE = 10
+BENCH_BACKENDS = ('keras', 'numpy')
+
+
+# ==========================================
+# 🎓 STUDENTS
+# ==========================================
+def student_layers(name):
+    from tensorflow.keras import layers
+
+    if name == 'lstm32':
+        return [layers.LSTM(32)]
+    if name == 'gru32':
+        return [layers.GRU(32)]
+    if name == 'cnn1d':
+        return [layers.Conv1D(16, 3, padding='causal', activation='relu'),
+                layers.Conv1D(16, 3, padding='causal', activation='relu'),
+                layers.GlobalAveragePooling1D()]
+    if name == 'linear_lags':
+        return [layers.Flatten()]      # Dense(1) บน lag ทั้ง 30 x 5 = linear autoregression
+    raise ValueError(f"unknown student '{name}'")
+
+
+STUDENTS = ('lstm32', 'gru32', 'cnn1d', 'linear_lags')
+
+
+def build_student(name, window_size, n_features):
+    from tensorflow.keras import Sequential, layers
+
+    model = Sequential([layers.Input((window_size, n_features)), *student_layers(name), layers.Dense(1)], name=name)
+    model.compile(loss='mae', optimizer='adam')
+    return model
+
+
+def student_path(name):
+    return os.path.join(STUDENT_DIR, f"student_{name}.keras")
+
+
+def distill(name, splits, teacher, alpha=ALPHA, epochs=EPOCHS):
+    """ เทรน student ด้วย target ผสมระหว่างค่าจริงกับ soft label ของ teacher แล้วบันทึก .keras """
+    from tensorflow.keras.callbacks import EarlyStopping
+
+    (X_train, y_train), (X_val, y_val) = splits['train'], splits['val']
+    soft_train = teacher.model.predict(X_train, batch_size=256, verbose=0)
+    soft_val = teacher.model.predict(X_val, batch_size=256, verbose=0)
+
+    student = build_student(name, X_train.shape[1], X_train.shape[2])
+    student.fit(X_train, alpha * y_train + (1 - alpha) * soft_train,
+                validation_data=(X_val, alpha * y_val + (1 - alpha) * soft_val),
+                epochs=epochs, batch_size=BATCH_SIZE, verbose=0,
+                callbacks=[EarlyStopping(patience=PATIENCE, restore_best_weights=True)])
+    os.makedirs(STUDENT_DIR, exist_ok=True)
+    student.save(student_path(name))
+    return student
+
+
+# ==========================================
+# 📊 PARETO TABLE
+# ==========================================
+def pareto_front(rows):
+    """ แถวที่ไม่มีแถวอื่นดีกว่าหรือเท่ากันทุกด้าน (latency, size, MAE) และดีกว่าอย่างน้อย 1 ด้าน """
+    keys = ('latency_ms', 'size_kb', 'mae')
+    front = []
+    for r in rows:
+        dominated = any(all(o[k] <= r[k] for k in keys) and any(o[k] < r[k] for k in keys)
+                        for o in rows if o is not r)
+        front.append(not dominated)
+    return front
+
+
+def evaluate(name, path, splits, scaler_target, backends=BENCH_BACKENDS):
+    X_test, y_test = splits['test']
+    rows = []
+    for backend in backends:
+        try:
+            runner = load_runner(path, backend)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"    ⚠️ [{name} / {backend}] ข้าม: {e}")
+            continue
+        metrics = regression_metrics(y_test, predict_windows(runner, X_test), scaler_target)
+        rows.append(dict(metrics, name=name, backend=backend, path=path,
+                         size_kb=os.path.getsize(path) / 1024, latency_ms=median_latency_ms(runner, X_test)))
+    return rows
+
+
+def print_table(rows):
+    print(f"\n{'model':<14}{'backend':<9}{'p50 ms':>9}{'size KB':>10}{'MAE vCores':>12}{'within 10%':>12}  pareto")
+    print("-" * 74)
+    for r, on_front in sorted(zip(rows, pareto_front(rows)), key=lambda p: p[0]['mae']):
+        print(f"{r['name']:<14}{r['backend']:<9}{r['latency_ms']:>9.3f}{r['size_kb']:>10.0f}"
+              f"{r['mae']:>12.3f}{r['threshold_acc']:>11.2f}%  {'★' if on_front else ''}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Distill small students from the multi-variable LSTM teacher and report a Pareto table")
+    parser.add_argument('--students', nargs='+', choices=STUDENTS, default=list(STUDENTS))
+    parser.add_argument('--alpha', type=float, default=ALPHA)
+    parser.add_argument('--epochs', type=int, default=EPOCHS)
+    parser.add_argument('--report-only', action='store_true', help="ไม่เทรนใหม่ ใช้ student ที่บันทึกไว้แล้ว")
+    args = parser.parse_args()
+
+    splits = split_windows(SCALER_INPUTS_PATH, SCALER_TARGET_PATH)
+    scaler_target = joblib.load(SCALER_TARGET_PATH)
+    teacher = load_runner(TEACHER_PATH, 'keras')
+
+    rows = evaluate('teacher', TEACHER_PATH, splits, scaler_target)
+    for name in args.students:
+        if not args.report_only:
+            print(f"🎓 กำลังเทรน student: {name} (alpha={args.alpha})")
+            distill(name, splits, teacher, args.alpha, args.epochs)
+        if os.path.exists(student_path(name)):
+            rows += evaluate(name, student_path(name), splits, scaler_target)
+
+    print_table(rows)
+    print(f"\nใช้ student ใน PredictorMulti.py: MODEL_PATH = '{student_path('<name>')}' (MODEL_BACKEND ใดก็ได้)")
@@ -0,0 +1,124 @@
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+import numpy as np
+
+from mc_dropout import UPPER_QUANTILE, mc_predict, supports_mc
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+INFERENCE_DEADLINE = 2.0    # วินาทีต่อ tick: เกินนี้ใช้ fallback แทน ไม่รอโมเดล
+FORECAST_HORIZON = 5        # นาทีข้างหน้า (ตรงกับ label ของโมเดล)
+HOLT_ALPHA = 0.5            # น้ำหนักของระดับ (level)
+HOLT_BETA = 0.3             # น้ำหนักของแนวโน้ม (trend)
+
+Forecast = namedtuple('Forecast', ['cores', 'source', 'latency_ms', 'error', 'upper_cores', 'by_horizon'], defaults=(None, None))
+Forecast.__doc__ = """ผลทำนาย 1 tick: source = 'lstm' หรือชื่อ fallback ('holt' / 'ewma' / 'linear'), error = เหตุที่ต้อง fallback,
+upper_cores = ขอบบนจาก MC-dropout (None ถ้าไม่ได้เปิด / ใช้ fallback),
+by_horizon = {นาที: Cores} ของโมเดล multi-horizon (None = โมเดล output เดียว) / cores = ค่าที่ horizon หลัก"""
+
+
+# ==========================================
+# 📈 STATISTICAL FORECASTERS (ค่าดิบ หน่วย Cores)
+# ==========================================
+def holt_forecast(series, horizon=FORECAST_HORIZON, alpha=HOLT_ALPHA, beta=HOLT_BETA):
+    """ Holt's linear trend (double exponential smoothing) """
+    series = np.asarray(series, dtype=np.float64)
+    if len(series) < 2:
+        return float(series[-1])
+    level, trend = series[0], series[1] - series[0]
+    for value in series[1:]:
+        prev_level = level
+        level = alpha * value + (1 - alpha) * (level + trend)
+        trend = beta * (level - prev_level) + (1 - beta) * trend
+    return float(level + horizon * trend)
+
+
+def ewma_forecast(series, horizon=FORECAST_HORIZON, alpha=HOLT_ALPHA):
+    """ EWMA: ค่าคาดการณ์คงที่ = ระดับล่าสุด (ไม่สนแนวโน้ม) """
+    level = float(series[0])
+    for value in series[1:]:
+        level = alpha * float(value) + (1 - alpha) * level
+    return level
+
+
+def linear_forecast(series, horizon=FORECAST_HORIZON):
+    """ linear regression บน window แล้วยืดเส้นไปอีก horizon step """
+    series = np.asarray(series, dtype=np.float64)
+    if len(series) < 2:
+        return float(series[-1])
+    slope, intercept = np.polyfit(np.arange(len(series)), series, 1)
+    return float(intercept + slope * (len(series) - 1 + horizon))
+
+
+FALLBACKS = {'holt': holt_forecast, 'ewma': ewma_forecast, 'linear': linear_forecast}
+
+
+# ==========================================
+# ⏱️ DEADLINE
+# ==========================================
+class DeadlineForecaster:
+    """
+    รันโมเดลใน worker thread แยกแล้วรอไม่เกิน deadline ต่อ tick
+    - ทันเวลา: ใช้ผล LSTM (inverse_target แปลงค่า scaled -> Cores)
+    - ไม่ทัน / exception / รอบก่อนยังค้างอยู่: ใช้ fallback บน window เดิม (ค่าดิบของ target) ทันที
+    รอบที่ค้างจะไม่ถูกต่อคิวเพิ่ม (thread เดียว) -> loop ไม่ช้าลงตามโมเดล
+    mc_samples > 0: ใช้ MC-dropout (mc_dropout.py) -> cores = ค่าเฉลี่ย, upper_cores = quantile บน
+    horizons (horizons.py): โมเดลที่มี 1 output ต่อ horizon -> by_horizon ครบทุก horizon, cores = ค่าที่ horizon (หลัก)
+    """
+
+    def __init__(self, runner, inverse_target, fallback='holt', deadline=INFERENCE_DEADLINE, horizon=FORECAST_HORIZON,
+                 mc_samples=0, quantile=UPPER_QUANTILE, horizons=None):
+        if fallback not in FALLBACKS:
+            raise ValueError(f"unknown fallback '{fallback}' (choose from {', '.join(FALLBACKS)})")
+        if mc_samples and not supports_mc(runner):
+            raise ValueError(f"{type(runner).__name__} has no dropout at inference (use MODEL_BACKEND 'keras' or 'numpy')")
+        self.mc_samples = mc_samples
+        self.quantile = quantile
+        self.horizons = tuple(horizons) if horizons else None
+        self._primary = self.horizons.index(horizon) if self.horizons and horizon in self.horizons else 0
+        self.runner = runner
+        self.inverse_target = inverse_target
+        self.fallback = fallback
+        self.deadline = deadline
+        self.horizon = horizon
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='inference')
+        self._pending = None
+        self.fallback_count = 0
+
+    def _fallback(self, target_history, started, error):
+        self.fallback_count += 1
+        forecast_fn = FALLBACKS[self.fallback]
+        cores = forecast_fn(target_history, self.horizon)
+        by_horizon = {h: forecast_fn(target_history, h) for h in self.horizons} if self.horizons else None
+        return Forecast(cores, self.fallback, (time.perf_counter() - started) * 1000, error, None, by_horizon)
+
+    def forecast(self, X, target_history):
+        """ X = window ที่ scale แล้ว (เข้าโมเดล), target_history = ค่าดิบของ target ใน window เดียวกัน (เข้า fallback) """
+        started = time.perf_counter()
+        if self._pending is not None and not self._pending.done():
+            return self._fallback(target_history, started, "previous inference still running")
+
+        X = np.array(X, copy=True)
+        if self.mc_samples:
+            self._pending = self._pool.submit(mc_predict, self.runner, X, self.mc_samples, self.quantile)
+        else:
+            self._pending = self._pool.submit(self.runner.predict, X)
+        try:
+            result = self._pending.result(timeout=self.deadline)
+        except FutureTimeout:
+            return self._fallback(target_history, started, f"deadline {self.deadline:.1f}s exceeded")
+        except Exception as e:
+            return self._fallback(target_history, started, f"{type(e).__name__}: {e}")
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        outputs = result.mean if self.mc_samples else np.asarray(result).reshape(-1)
+        cores = [float(self.inverse_target(v)) for v in outputs]
+        upper = float(self.inverse_target(result.upper[self._primary])) if self.mc_samples else None
+        by_horizon = dict(zip(self.horizons, cores)) if self.horizons else None
+        return Forecast(cores[self._primary], 'lstm', latency_ms, None, upper, by_horizon)
+
+    def close(self):
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,74 @@
+import time
+
+import numpy as np
+
+from DecisionEngineV2 import DecisionEngine
+from fallback_forecaster import DeadlineForecaster, ewma_forecast, holt_forecast, linear_forecast
+
+
+class SlowRunner:
+    """ runner จำลอง: หน่วง delay วินาที (เหมือน TensorFlow ค้าง) แล้วคืนค่า scaled คงที่ """
+
+    def __init__(self, delay=0.0, value=0.5, error=None):
+        self.delay, self.value, self.error = delay, value, error
+
+    def predict(self, X):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return np.array([[self.value]], dtype=np.float32)
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ DeadlineForecaster (Unit Testing)\n" + "="*50)
+    X = np.zeros((1, 30, 1), dtype=np.float32)
+    ramp = 2.0 + 0.1 * np.arange(30)            # CPU Req เพิ่มขึ้นนาทีละ 0.1 Core
+    flat = np.full(30, 3.0)
+
+    print("▶️ TEST 1: fallback แต่ละแบบบน series เส้นตรง / คงที่")
+    print(f"ผลลัพธ์ 🤖: holt={holt_forecast(ramp):.3f} linear={linear_forecast(ramp):.3f} ewma={ewma_forecast(ramp):.3f}")
+    assert np.isclose(linear_forecast(ramp), 2.0 + 0.1 * 34)
+    assert np.isclose(holt_forecast(ramp), 2.0 + 0.1 * 34)
+    assert all(np.isclose(f(flat), 3.0) for f in (holt_forecast, linear_forecast, ewma_forecast))
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: โมเดลทันเวลา -> ใช้ผล LSTM (แปลงกลับด้วย inverse_target)")
+    forecaster = DeadlineForecaster(SlowRunner(value=0.5), lambda v: v * 10, deadline=0.5)
+    result = forecaster.forecast(X, ramp)
+    print(f"ผลลัพธ์ 🤖: {result}")
+    assert result.source == 'lstm' and np.isclose(result.cores, 5.0) and result.error is None
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: โมเดลค้างเกิน deadline -> ได้ค่าจาก holt ภายในเวลา, รอบถัดไปไม่ต่อคิวเพิ่ม")
+    forecaster = DeadlineForecaster(SlowRunner(delay=0.6), lambda v: v * 10, deadline=0.1)
+    started = time.perf_counter()
+    first = forecaster.forecast(X, ramp)
+    second = forecaster.forecast(X, ramp)
+    elapsed = time.perf_counter() - started
+    print(f"ผลลัพธ์ 🤖: {first.source} ({first.error}) | {second.source} ({second.error}) | {elapsed:.2f}s")
+    assert first.source == 'holt' and second.source == 'holt' and elapsed < 0.3
+    assert 'still running' in second.error and forecaster.fallback_count == 2
+    time.sleep(0.6)
+    forecaster.close()
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: model.predict พัง -> fallback แทนการข้าม tick")
+    forecaster = DeadlineForecaster(SlowRunner(error=RuntimeError("graph build failed")), lambda v: v, fallback='linear')
+    result = forecaster.forecast(X, ramp)
+    print(f"ผลลัพธ์ 🤖: {result.source} ({result.error}) -> {result.cores:.2f} Cores")
+    assert result.source == 'linear' and 'graph build failed' in result.error
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 5: DecisionEngine บันทึกว่าใช้ forecaster ตัวไหน")
+    engine = DecisionEngine(cores_per_node=4.0, max_workers=2, min_workers=1)
+    action, reason = engine.decide(predicted_cores=3.9, current_workers=1, pending_pods=0,
+                                   current_cpu_usage=50.0, current_cpu_req=3.0, forecaster='holt')
+    print(f"ผลลัพธ์ 🤖: {action} | {reason}")
+    assert action == "SCALE_OUT" and reason.startswith("[Fallback:holt]")
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
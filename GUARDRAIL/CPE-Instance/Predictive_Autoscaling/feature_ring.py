@@ -0,0 +1,220 @@
+import mmap
+import os
+import struct
+import time
+
+import numpy as np
+
+from async_collector import CollectedSample
+from loop_scheduler import FixedRateScheduler
+from cluster_snapshot import POD_NAMESPACE, ClusterSnapshot
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+RING_PATH = '/dev/shm/autoscaler_features.ring'
+RING_CAPACITY = 1440          # 1 วัน ถ้าเก็บทุก 60 วินาที
+COLLECT_INTERVAL = 60         # ความถี่ของ collector daemon (ต้องตรงกับ grid 1 นาทีที่โมเดลเทรนมา)
+MAX_ROW_AGE = 2 * COLLECT_INTERVAL
+
+COLUMNS = ClusterSnapshot._fields      # cpu_req, cpu_cap, mem_req, mem_cap, pending, active_workers, cpu_usage_pct, running
+
+_MAGIC = b'FEATRING'
+_HEADER = struct.Struct('<8sIII')       # magic, version, n_features, capacity
+_HEADER_SIZE = 64                       # จองไว้ 64 bytes ให้ข้อมูลเริ่มตรง cache line
+_COUNT_OFFSET = 32                      # uint64 จำนวนแถวที่เขียนแล้ว (publish หลังเขียนแถวเสร็จ)
+_VERSION = 1
+
+
+class FeatureRing:
+    """
+    Ring buffer ขนาดคงที่บน memory-mapped file (ปกติอยู่ใน /dev/shm) ให้ collector 1 ตัวเขียน
+    และ predictor / logger / shadow model หลายตัวอ่านพร้อมกันโดยไม่ต้อง query Cluster ซ้ำ
+
+    แต่ละแถวถูกเขียน 2 ตำแหน่ง (i และ i + capacity) ทำให้หน้าต่าง n แถวล่าสุด (n <= capacity)
+    ต่อกันเป็นชิ้นเดียวเสมอ -> latest() คืน NumPy view ได้โดยไม่ต้อง copy
+    view จะถูกเขียนทับหลังจากมีแถวใหม่อีก capacity - n แถว ถ้าจะเก็บไว้นานให้ .copy()
+    """
+
+    def __init__(self, path, mm, n_features, capacity, writable, inode=None):
+        self.path = path
+        self.inode = inode                # inode ของไฟล์ที่ map ไว้ (daemon สร้าง ring ใหม่ = inode ใหม่)
+        self.n_features = n_features
+        self.capacity = capacity
+        self.writable = writable
+        self._mm = mm
+        self._count = np.ndarray((1,), np.uint64, buffer=mm, offset=_COUNT_OFFSET)
+        ts_offset = _HEADER_SIZE
+        data_offset = ts_offset + 2 * capacity * 8
+        self._ts = np.ndarray((2 * capacity,), np.float64, buffer=mm, offset=ts_offset)
+        self._data = np.ndarray((2 * capacity, n_features), np.float64, buffer=mm, offset=data_offset)
+        if not writable:
+            self._ts.flags.writeable = False
+            self._data.flags.writeable = False
+
+    @staticmethod
+    def _size(n_features, capacity):
+        return _HEADER_SIZE + 2 * capacity * 8 * (1 + n_features)
+
+    @classmethod
+    def create(cls, path=RING_PATH, n_features=len(COLUMNS), capacity=RING_CAPACITY):
+        """ สร้าง (หรือสร้างทับ) ring file สำหรับ collector ที่เป็นผู้เขียน """
+        size = cls._size(n_features, capacity)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.truncate(size)
+            f.write(_HEADER.pack(_MAGIC, _VERSION, n_features, capacity))
+        os.replace(tmp_path, path)        # reader ไม่มีทางเห็นไฟล์ที่ header ยังไม่ครบ
+        with open(path, 'r+b') as f:
+            mm = mmap.mmap(f.fileno(), size)
+            inode = os.fstat(f.fileno()).st_ino
+        return cls(path, mm, n_features, capacity, writable=True, inode=inode)
+
+    @classmethod
+    def open(cls, path=RING_PATH):
+        """ เปิดแบบอ่านอย่างเดียว (predictor / logger / shadow model) """
+        with open(path, 'rb') as f:
+            magic, version, n_features, capacity = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"{path} is not a feature ring (v{_VERSION})")
+            mm = mmap.mmap(f.fileno(), cls._size(n_features, capacity), access=mmap.ACCESS_READ)
+            inode = os.fstat(f.fileno()).st_ino
+        return cls(path, mm, n_features, capacity, writable=False, inode=inode)
+
+    def replaced(self):
+        """ True = ไฟล์ที่ path ตอนนี้ไม่ใช่ตัวที่ map ไว้ (collector ถูก restart แล้วสร้าง ring ใหม่ทับ) """
+        try:
+            return os.stat(self.path).st_ino != self.inode
+        except FileNotFoundError:
+            return False                  # daemon ยังสร้างไม่เสร็จ -> อ่านตัวเดิมไปก่อน
+
+    def __len__(self):
+        return int(min(self._count[0], self.capacity))
+
+    @property
+    def total_written(self):
+        return int(self._count[0])
+
+    def append(self, row, timestamp=None):
+        count = int(self._count[0])
+        i = count % self.capacity
+        ts = time.time() if timestamp is None else timestamp
+        self._data[i] = row
+        self._data[i + self.capacity] = row
+        self._ts[i] = ts
+        self._ts[i + self.capacity] = ts
+        self._count[0] = count + 1        # publish หลังเขียนแถวครบแล้ว
+
+    def latest(self, n, count=None):
+        """ คืน (timestamps, rows) ของ n แถวล่าสุด (หรือเท่าที่มี) เป็น view เรียงจากเก่าไปใหม่
+            count: อ่าน ณ จำนวนแถวที่กำหนด (ค่าจาก total_written) แทนค่าปัจจุบัน """
+        count = int(self._count[0]) if count is None else count
+        n = min(n, count, self.capacity)
+        start = (count - n) % self.capacity
+        return self._ts[start:start + n], self._data[start:start + n]
+
+    def close(self):
+        self._ts = self._data = self._count = None
+        self._mm.close()
+
+
+class RingFeatureSource:
+    """ ให้ predictor อ่านแถวล่าสุดใน ring แบบเดียวกับ collector อื่น (คืน CollectedSample) """
+
+    def __init__(self, ring, max_age=MAX_ROW_AGE):
+        self.ring = ring
+        self.max_age = max_age
+        self._seen = 0
+        self._last_row = None      # แถวล่าสุดที่ส่งให้ HistoryWindow (ใช้เติมช่อง NaN)
+
+    def _reopen_if_replaced(self):
+        if self.ring.replaced():
+            old, self.ring = self.ring, FeatureRing.open(self.ring.path)
+            old.close()
+            self._seen = 0
+            print(f"♻️ [Ring] collector สร้าง {self.ring.path} ใหม่ -> เปิดใหม่")
+
+    def new_rows(self, columns=len(COLUMNS)):
+        """
+        แถวที่ collector เขียนเพิ่มตั้งแต่เรียกครั้งก่อน (ครั้งแรก = ทั้ง ring, พลาดเกิน capacity = เท่าที่ยังอยู่ใน ring)
+        เฉพาะ `columns` คอลัมน์แรก สำหรับป้อน HistoryWindow ทีละส่วน
+        field ที่ collector ดึงไม่ได้ (NaN) ใช้ค่าของแถวก่อนหน้า แถวที่ยังไม่มีค่าก่อนหน้าให้เติมถูกทิ้ง -> ไม่มี NaN เข้าโมเดล
+        """
+        self._reopen_if_replaced()
+        total = self.ring.total_written
+        n = min(total - self._seen, self.ring.capacity)
+        self._seen = total
+        rows = self.ring.latest(n, count=total)[1][:, :columns].copy()
+        keep = np.ones(len(rows), dtype=bool)
+        for i, row in enumerate(rows):
+            missing = np.isnan(row)
+            if missing.any():
+                if self._last_row is None:
+                    keep[i] = False
+                    continue
+                row[missing] = self._last_row[missing]
+            self._last_row = row
+        return rows[keep]
+
+    def collect_sync(self):
+        self._reopen_if_replaced()
+        ts, rows = self.ring.latest(1)
+        if len(rows) == 0:
+            empty = ClusterSnapshot(*([None] * len(COLUMNS)))
+            return CollectedSample(empty, {f: True for f in COLUMNS}, {'ring': 'no rows yet'})
+        values = [None if np.isnan(v) else v.item() for v in rows[0]]
+        for f in ('pending', 'active_workers', 'running'):
+            idx = COLUMNS.index(f)
+            if values[idx] is not None:
+                values[idx] = int(values[idx])
+        age = time.time() - float(ts[0])
+        is_stale = age > self.max_age
+        errors = {'ring': f"latest row is {age:.0f}s old"} if is_stale else {}
+        return CollectedSample(ClusterSnapshot(*values), {f: is_stale for f in COLUMNS}, errors)
+
+
+# ==========================================
+# 🛰️ COLLECTOR DAEMON
+# ==========================================
+def run_collector(collector, ring, interval=COLLECT_INTERVAL):
+    """ ดึงข้อมูลตาม interval แล้วเขียนลง ring (field ที่ไม่มีข้อมูล = NaN) """
+    print(f"🛰️ [Collector] เขียน feature ลง {ring.path} ทุก {interval} วินาที (capacity {ring.capacity} แถว)")
+    for tick in FixedRateScheduler(interval):   # deadline คงที่บน monotonic clock ไม่ drift ตามเวลาที่ใช้ดึงข้อมูล
+        if tick.skipped:
+            print(f"⏱️ [Collector] ช้า {tick.lateness:.1f}s | ข้าม {tick.skipped} รอบ")
+        started = time.time() - tick.lateness
+        try:
+            sample = collector.collect_sync()
+            row = [np.nan if v is None else v for v in sample.snapshot]
+            ring.append(row, timestamp=started)
+            if sample.errors:
+                print(f"⚠️ [Collector] {sample.errors} -> stale: {', '.join(sample.stale_fields())}")
+        except Exception as e:
+            print(f"❌ [Collector] {e}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Feature collector daemon -> shared-memory ring buffer")
+    parser.add_argument('--path', default=RING_PATH)
+    parser.add_argument('--capacity', type=int, default=RING_CAPACITY)
+    parser.add_argument('--interval', type=float, default=COLLECT_INTERVAL)
+    parser.add_argument('--source', choices=['kubernetes', 'prometheus'], default='kubernetes')
+    parser.add_argument('--prometheus-url', default=None)
+    args = parser.parse_args()
+
+    if args.source == 'prometheus':
+        from prometheus_source import PROMETHEUS_URL, PrometheusFeatureSource
+        source = PrometheusFeatureSource(args.prometheus_url or PROMETHEUS_URL)
+    else:
+        from async_collector import AsyncCollector
+        from cluster_informer import ClusterInformer, KubeWatchSource
+        informer = ClusterInformer(KubeWatchSource(), namespace=POD_NAMESPACE).start()
+        informer.wait_synced(timeout=30)
+        source = AsyncCollector(namespace=POD_NAMESPACE, informer=informer)
+
+    try:
+        run_collector(source, FeatureRing.create(args.path, capacity=args.capacity), args.interval)
+    except KeyboardInterrupt:
+        print("\n🛑 ปิด Collector (Ctrl+C)")
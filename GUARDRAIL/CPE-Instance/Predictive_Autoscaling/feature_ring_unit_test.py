@@ -0,0 +1,126 @@
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from DecisionEngineV2 import DecisionEngine
+from async_collector import CollectedSample
+from cluster_snapshot import ClusterSnapshot
+from feature_ring import COLUMNS, FeatureRing, RingFeatureSource, run_collector
+
+
+def row(value, n=len(COLUMNS)):
+    return [float(value)] * n
+
+
+class StopCollector(KeyboardInterrupt):
+    """ ให้ run_collector ออกจาก loop หลังเก็บครบตามจำนวน """
+
+
+class CountingCollector:
+    def __init__(self, limit):
+        self.limit = limit
+        self.calls = 0
+
+    def collect_sync(self):
+        self.calls += 1
+        if self.calls > self.limit:
+            raise StopCollector()
+        snap = ClusterSnapshot(2.0, 8.0, None, 16.0, 0, 2, 25.0, 5)
+        return CollectedSample(snap, {f: f == 'mem_req' for f in COLUMNS}, {'pods': 'timeout'})
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Feature Ring (Unit Testing)\n" + "="*50)
+    tmp = tempfile.TemporaryDirectory()
+    path = os.path.join(tmp.name, 'features.ring')
+
+    print("▶️ TEST 1: เขียนเกิน capacity -> วนทับ, latest() ต่อกันเป็นชิ้นเดียวข้ามจุดวน (view ไม่ copy)")
+    writer = FeatureRing.create(path, capacity=4)
+    reader = FeatureRing.open(path)
+    for i in range(6):
+        writer.append(row(i), timestamp=1000 + 60 * i)
+    ts, rows = reader.latest(4)
+    print(f"ผลลัพธ์ 🤖: ts {ts.tolist()} | cpu_req {rows[:, 0].tolist()}")
+    assert len(reader) == 4 and reader.total_written == 6
+    assert rows[:, 0].tolist() == [2, 3, 4, 5] and ts.tolist() == [1120, 1180, 1240, 1300]
+    assert np.shares_memory(rows, reader._data) and not rows.flags.writeable
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: new_rows คืนเฉพาะแถวที่ยังไม่เคยเห็น (พลาดเกิน capacity = เท่าที่ยังอยู่ใน ring)")
+    source = RingFeatureSource(reader)
+    first = source.new_rows(columns=5)
+    writer.append(row(6), timestamp=1360)
+    second = source.new_rows(columns=5)
+    empty = source.new_rows(columns=5)
+    for i in range(7, 17):
+        writer.append(row(i), timestamp=1000 + 60 * i)
+    missed = source.new_rows(columns=1)
+    print(f"ผลลัพธ์ 🤖: {first[:, 0].tolist()} | {second[:, 0].tolist()} | {len(empty)} | {missed[:, 0].tolist()}")
+    assert first.shape == (4, 5) and first[:, 0].tolist() == [2, 3, 4, 5]
+    assert second[:, 0].tolist() == [6] and len(empty) == 0
+    assert missed.shape == (4, 1) and missed[:, 0].tolist() == [13, 14, 15, 16]
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: field ที่ collector ดึงไม่ได้ (NaN) ไม่เข้าโมเดล + DecisionEngine ไม่รับผลทำนาย NaN")
+    nan_path = os.path.join(tmp.name, 'nan.ring')
+    nan_writer = FeatureRing.create(nan_path, capacity=8)
+    nan_writer.append([np.nan] + row(1, len(COLUMNS) - 1), timestamp=1000)   # ยังไม่มีค่าก่อนหน้า -> ทิ้ง
+    nan_writer.append(row(2), timestamp=1060)
+    nan_writer.append([3.0, np.nan] + row(3, len(COLUMNS) - 2), timestamp=1120)
+    filled = RingFeatureSource(FeatureRing.open(nan_path)).new_rows(columns=5)
+    print(f"ผลลัพธ์ 🤖: {filled.tolist()}")
+    assert filled.tolist() == [row(2, 5), [3.0, 2.0, 3.0, 3.0, 3.0]] and np.isfinite(filled).all()
+    engine = DecisionEngine(cores_per_node=4.0, max_workers=2, min_workers=1)
+    action, reason = engine.decide(predicted_cores=float('nan'), current_workers=1, pending_pods=0,
+                                   current_cpu_usage=50.0, current_cpu_req=2.0)
+    print(f"ผลลัพธ์ 🤖: {action} | {reason}")
+    assert action == "DO_NOTHING" and "Sanity Check" in reason
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: collect_sync -> ring ว่าง = ทุก field stale | แถวเก่าเกิน max_age = stale | NaN = None")
+    empty_path = os.path.join(tmp.name, 'empty.ring')
+    FeatureRing.create(empty_path, capacity=4)
+    sample = RingFeatureSource(FeatureRing.open(empty_path)).collect_sync()
+    assert not sample.has_ai_features() and len(sample.stale_fields()) == len(COLUMNS) and 'ring' in sample.errors
+    live = FeatureRing.create(empty_path, capacity=4)
+    live.append([2.5, 8.0, np.nan, 16.0, 3, 2, 40.0, 7])
+    live_source = RingFeatureSource(FeatureRing.open(empty_path), max_age=60)
+    sample = live_source.collect_sync()
+    print(f"ผลลัพธ์ 🤖: {sample.snapshot} | stale {sample.stale_fields()}")
+    assert sample.snapshot.mem_req is None and sample.snapshot.pending == 3 and isinstance(sample.snapshot.running, int)
+    assert not sample.stale_fields() and not sample.errors
+    live.append(row(1), timestamp=time.time() - 300)
+    sample = live_source.collect_sync()
+    assert len(sample.stale_fields()) == len(COLUMNS) and 'old' in sample.errors['ring']
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 5: collector daemon restart แล้วสร้าง ring ใหม่ทับ -> reader เปิดไฟล์ใหม่เอง")
+    source = RingFeatureSource(FeatureRing.open(path))
+    source.new_rows()
+    restarted = FeatureRing.create(path, capacity=4)
+    restarted.append(row(99), timestamp=2000)
+    fresh = source.new_rows(columns=1)
+    print(f"ผลลัพธ์ 🤖: {fresh[:, 0].tolist()} | inode {source.ring.inode == restarted.inode}")
+    assert fresh[:, 0].tolist() == [99] and source.ring.inode == restarted.inode and not source.ring.replaced()
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 6: run_collector เขียนตาม FixedRateScheduler (timestamp = deadline ไม่ drift) field ที่ขาด = NaN")
+    daemon_ring = FeatureRing.create(os.path.join(tmp.name, 'daemon.ring'), capacity=8)
+    try:
+        run_collector(CountingCollector(limit=4), daemon_ring, interval=0.05)
+    except StopCollector:
+        pass
+    ts, rows = daemon_ring.latest(8)
+    gaps = np.diff(ts)
+    print(f"ผลลัพธ์ 🤖: {len(rows)} แถว | ระยะห่าง {np.round(gaps, 3).tolist()} | mem_req {rows[:, 2].tolist()}")
+    assert len(rows) == 4 and np.allclose(gaps, 0.05, atol=0.01) and np.isnan(rows[:, 2]).all()
+    print("ผลลัพธ์ ✅\n")
+
+    tmp.cleanup()
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
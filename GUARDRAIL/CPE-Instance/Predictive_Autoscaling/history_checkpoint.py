@@ -0,0 +1,132 @@
+import os
+import struct
+import time
+import zlib
+
+import numpy as np
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+MAX_GAP_FACTOR = 1.5        # ช่องว่างระหว่าง sample เกิน 1.5 x interval = ประวัติขาดตอน
+COMPACT_FACTOR = 4          # มีเกิน 4 x window แถว -> เขียนไฟล์ใหม่เหลือแค่ window ล่าสุด
+
+_MAGIC = b'HISTCKPT'
+_HEADER = struct.Struct('<8sII')        # magic, version, n_features
+_VERSION = 1
+
+
+class HistoryCheckpoint:
+    """
+    เก็บ feature ดิบ (ยังไม่ scale) ของแต่ละ tick ลงไฟล์เล็ก ๆ เพื่อให้ restart แล้วทำนายได้ทันทีโดยไม่ต้องรอ 30 นาที
+    - append ทีละ record: timestamp + features + CRC32 (เขียนแล้ว fsync)
+    - record สุดท้ายที่เขียนไม่ครบตอนเครื่องดับ (CRC ไม่ตรง / ขาด byte) จะถูกข้ามตอนโหลด
+    - compaction เขียนไฟล์ใหม่ที่ .tmp แล้ว os.replace -> ไม่มีจังหวะที่ไฟล์หายหรือครึ่ง ๆ
+    """
+
+    def __init__(self, path, n_features, window_size, compact_factor=COMPACT_FACTOR):
+        self.path = path
+        self.n_features = n_features
+        self.window_size = window_size
+        self.compact_after = compact_factor * window_size
+        self._record = struct.Struct(f'<d{n_features}d')
+        self._record_size = self._record.size + 4
+        self._timestamps, self._rows = self._read()
+        self._file = None
+
+    # ---------- อ่าน ----------
+    def _read(self):
+        self._header_ok = False     # False = ต้องเขียน header ใหม่ก่อน append (ไม่มีไฟล์ / header ขาด / รูปแบบไม่ตรง)
+        if not os.path.exists(self.path):
+            return [], []
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            return [], []
+        magic, version, n_features = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION or n_features != self.n_features:
+            print(f"⚠️ [Checkpoint] {self.path} ไม่ตรงรูปแบบ (n_features={n_features}) ไม่ใช้ประวัติเดิม")
+            return [], []
+        self._header_ok = True
+
+        timestamps, rows = [], []
+        for offset in range(_HEADER.size, len(data) - self._record_size + 1, self._record_size):
+            body = data[offset:offset + self._record.size]
+            (crc,) = struct.unpack_from('<I', data, offset + self._record.size)
+            if zlib.crc32(body) != crc:
+                break       # record ที่เขียนค้าง (และทุกอย่างหลังจากนั้น) ใช้ไม่ได้
+            values = self._record.unpack(body)
+            timestamps.append(values[0])
+            rows.append(values[1:])
+        return timestamps, rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def recent(self, interval, now=None, max_gap_factor=MAX_GAP_FACTOR):
+        """
+        คืน (timestamps, rows) ช่วงต่อเนื่องล่าสุด (ไม่เกิน window_size แถว) ที่ไม่มีช่องว่างเกิน max_gap_factor x interval
+        ถ้าแถวล่าสุดเก่ากว่าเกณฑ์ (ระบบดับนานเกินไป) คืนว่าง -> ไม่เอาประวัติที่ไม่ต่อเนื่องกับปัจจุบันให้ AI
+        """
+        now = time.time() if now is None else now
+        max_gap = interval * max_gap_factor
+        if not self._timestamps or now - self._timestamps[-1] > max_gap:
+            return np.empty(0), np.empty((0, self.n_features))
+
+        start = len(self._timestamps) - 1
+        while start > 0 and len(self._timestamps) - start < self.window_size:
+            if self._timestamps[start] - self._timestamps[start - 1] > max_gap:
+                break
+            start -= 1
+        return np.array(self._timestamps[start:]), np.array(self._rows[start:], dtype=np.float64)
+
+    # ---------- เขียน ----------
+    def _open_for_append(self):
+        if self._file is None:
+            if not self._header_ok:
+                self._rewrite([], [])   # header เดิมใช้ไม่ได้ (เช่นจำนวน feature เปลี่ยน) -> เริ่มไฟล์ใหม่ด้วย header ปัจจุบัน
+                self._header_ok = True
+            self._file = open(self.path, 'r+b')
+            # ตัด record ที่เขียนค้างท้ายไฟล์ทิ้ง ก่อนต่อท้าย record ใหม่
+            self._file.truncate(_HEADER.size + len(self._rows) * self._record_size)
+            self._file.seek(0, os.SEEK_END)
+        return self._file
+
+    def _pack(self, timestamp, row):
+        body = self._record.pack(timestamp, *row)
+        return body + struct.pack('<I', zlib.crc32(body))
+
+    def _rewrite(self, timestamps, rows):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, self.n_features))
+            for ts, row in zip(timestamps, rows):
+                f.write(self._pack(ts, row))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def append(self, row, timestamp=None):
+        """ บันทึก feature ดิบ 1 tick (fsync ทุกครั้ง: 1 ครั้งต่อนาที ไม่แพง) """
+        timestamp = time.time() if timestamp is None else timestamp
+        row = [float(v) for v in row]
+        f = self._open_for_append()
+        f.write(self._pack(timestamp, row))
+        f.flush()
+        os.fsync(f.fileno())
+        self._timestamps.append(timestamp)
+        self._rows.append(tuple(row))
+        if len(self._rows) > self.compact_after:
+            self.compact()
+
+    def compact(self):
+        """ เหลือแค่ window_size แถวล่าสุด """
+        self.close()
+        self._timestamps = self._timestamps[-self.window_size:]
+        self._rows = self._rows[-self.window_size:]
+        self._rewrite(self._timestamps, self._rows)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
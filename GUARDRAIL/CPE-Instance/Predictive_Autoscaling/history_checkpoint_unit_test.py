@@ -0,0 +1,77 @@
+import os
+import tempfile
+
+from history_checkpoint import HistoryCheckpoint
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ History Checkpoint (Unit Testing)\n" + "="*50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'history.ckpt')
+        t0 = 1_700_000_000.0
+
+        print("▶️ TEST 1: restart แล้วได้ประวัติ 30 นาทีล่าสุดคืนทันที")
+        ckpt = HistoryCheckpoint(path, n_features=5, window_size=30)
+        for i in range(40):
+            ckpt.append([i, 8.0, 2.0, 15.5, 0], timestamp=t0 + 60 * i)
+        ckpt.close()
+        restored = HistoryCheckpoint(path, n_features=5, window_size=30)
+        ts, rows = restored.recent(interval=60, now=t0 + 60 * 40)
+        print(f"ผลลัพธ์ 🤖: ได้คืน {len(rows)} แถว (cpu_req {rows[0][0]:.0f} -> {rows[-1][0]:.0f})")
+        assert rows.shape == (30, 5) and rows[0][0] == 10 and rows[-1][0] == 39
+        print("ผลลัพธ์ ✅\n")
+
+        print("▶️ TEST 2: ไฟล์ถูกตัดกลาง record (เครื่องดับตอนเขียน) -> ข้าม record ที่ไม่ครบ แล้วเขียนต่อได้")
+        with open(path, 'ab') as f:
+            f.write(b'\x01\x02\x03')
+        restored = HistoryCheckpoint(path, n_features=5, window_size=30)
+        assert len(restored) == 40
+        restored.append([40, 8.0, 2.0, 15.5, 0], timestamp=t0 + 60 * 40)
+        restored.close()
+        assert len(HistoryCheckpoint(path, n_features=5, window_size=30)) == 41
+        print("ผลลัพธ์ ✅\n")
+
+        print("▶️ TEST 3: ช่องว่างของ timestamp -> ใช้เฉพาะช่วงต่อเนื่องล่าสุด, ดับนานเกิน -> ไม่ใช้เลย")
+        gap = HistoryCheckpoint(os.path.join(tmp, 'gap.ckpt'), n_features=1, window_size=30)
+        for i in range(20):
+            gap.append([i], timestamp=t0 + 60 * i)
+        for i in range(10):
+            gap.append([100 + i], timestamp=t0 + 3600 + 60 * i)       # หายไป ~40 นาที
+        _, rows = gap.recent(interval=60, now=t0 + 3600 + 60 * 10)
+        print(f"ผลลัพธ์ 🤖: ช่วงต่อเนื่องล่าสุด {len(rows)} แถว")
+        assert len(rows) == 10 and rows[0][0] == 100
+        _, rows = gap.recent(interval=60, now=t0 + 3600 + 60 * 30)
+        assert len(rows) == 0
+        print("ผลลัพธ์ ✅\n")
+
+        print("▶️ TEST 4: compaction คุมขนาดไฟล์ไว้")
+        size_before = os.path.getsize(path)
+        ckpt = HistoryCheckpoint(path, n_features=5, window_size=30)
+        for i in range(41, 200):
+            ckpt.append([i, 8.0, 2.0, 15.5, 0], timestamp=t0 + 60 * i)
+        ckpt.close()
+        restored = HistoryCheckpoint(path, n_features=5, window_size=30)
+        print(f"ผลลัพธ์ 🤖: {len(restored)} แถวในไฟล์ | {size_before} -> {os.path.getsize(path)} bytes")
+        assert len(restored) <= 4 * 30
+        _, rows = restored.recent(interval=60, now=t0 + 60 * 200)
+        assert rows[-1][0] == 199 and len(rows) == 30
+        print("ผลลัพธ์ ✅\n")
+
+        print("▶️ TEST 5: จำนวน feature เปลี่ยน (5 -> 7) -> เริ่มไฟล์ใหม่ restart ครั้งถัดไปได้ประวัติชุดใหม่คืน")
+        widened = HistoryCheckpoint(path, n_features=7, window_size=30)
+        assert len(widened) == 0
+        for i in range(200, 210):
+            widened.append([i, 8.0, 2.0, 15.5, 0, 1.0, 3.0], timestamp=t0 + 60 * i)
+        widened.close()
+        restarted = HistoryCheckpoint(path, n_features=7, window_size=30)
+        _, rows = restarted.recent(interval=60, now=t0 + 60 * 210)
+        print(f"ผลลัพธ์ 🤖: {len(restarted)} แถวในไฟล์ | {rows.shape}")
+        assert len(restarted) == 10 and rows.shape == (10, 7) and rows[-1][0] == 209
+        print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,67 @@
+import numpy as np
+
+
+class HistoryWindow:
+    """
+    หน้าต่างประวัติขนาดคงที่สำหรับป้อน LSTM (แทน list + pop(0) + np.array + scaler.transform ทุกรอบ)
+    - จองหน่วยความจำครั้งเดียว (float32)
+    - scale แต่ละแถวครั้งเดียวตอนใส่เข้า ไม่ต้อง transform ทั้ง window ซ้ำทุก tick
+    - แต่ละแถวเขียน 2 ตำแหน่ง (i และ i + window_size) ทำให้ input_view() คืน
+      array ขนาด (1, window_size, n_features) ที่ต่อกันเป็นชิ้นเดียวได้โดยไม่ต้อง copy
+    - ถ้า scaler เป็น AffineScaler (affine_scaler.py) จะ scale ลงช่องใน buffer โดยตรง (fused) ไม่ผ่าน sklearn
+    """
+
+    def __init__(self, window_size, n_features, scaler=None):
+        self.window_size = window_size
+        self.n_features = n_features
+        self.scaler = scaler
+        self._buf = np.zeros((2 * window_size, n_features), dtype=np.float32)
+        self._count = 0
+
+    def __len__(self):
+        return min(self._count, self.window_size)
+
+    def is_full(self):
+        return self._count >= self.window_size
+
+    def _scale(self, rows):
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, self.n_features)
+        if self.scaler is not None:
+            rows = self.scaler.transform(rows)
+        return rows
+
+    def append(self, row):
+        """ ใส่ข้อมูลดิบ 1 แถว (ยังไม่ scale) """
+        i = self._count % self.window_size
+        if hasattr(self.scaler, 'transform_into'):
+            self.scaler.transform_into(np.asarray(row, dtype=np.float64), self._buf[i])
+        else:
+            self._buf[i] = self._scale(row)[0]
+        self._buf[i + self.window_size] = self._buf[i]
+        self._count += 1
+
+    def extend(self, rows):
+        """ ใส่ข้อมูลดิบหลายแถว (เรียงจากเก่าไปใหม่) scale รวดเดียว """
+        if len(rows) == 0:
+            return
+        scaled = self._scale(rows)[-self.window_size:]
+        for r in scaled:
+            i = self._count % self.window_size
+            self._buf[i] = r
+            self._buf[i + self.window_size] = r
+            self._count += 1
+
+    def clear(self):
+        self._count = 0
+
+    def scaled_rows(self):
+        """ แถวที่ scale แล้ว (เก่าไปใหม่) เป็น view ขนาด (len, n_features) """
+        n = len(self)
+        start = (self._count - n) % self.window_size
+        return self._buf[start:start + n]
+
+    def input_view(self):
+        """ (1, window_size, n_features) float32 พร้อมส่งเข้าโมเดล - view ไม่ copy """
+        if not self.is_full():
+            raise ValueError(f"window not full yet ({len(self)}/{self.window_size})")
+        return self.scaled_rows()[np.newaxis]
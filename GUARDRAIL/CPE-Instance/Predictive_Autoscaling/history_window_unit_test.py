@@ -0,0 +1,53 @@
+import warnings
+import joblib
+import numpy as np
+
+from history_window import HistoryWindow
+
+warnings.filterwarnings("ignore")
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ HistoryWindow (Unit Testing)\n" + "="*50)
+
+    scaler = joblib.load('Multi_Feature_Resource/Multi-Var_Scaler_Inputs.pkl')
+    rows = [[1.0 + i, 8.0, 2.0 + 0.1 * i, 15.5, i % 3] for i in range(40)]
+
+    print("▶️ TEST 1: ผลลัพธ์ตรงกับ list + pop(0) + scaler.transform แบบเดิม")
+    window = HistoryWindow(30, 5, scaler=scaler)
+    old_buffer = []
+    for row in rows:
+        window.append(row)
+        old_buffer.append(row)
+        if len(old_buffer) > 30:
+            old_buffer.pop(0)
+    expected = scaler.transform(np.array(old_buffer)).reshape(1, 30, 5)
+    X_input = window.input_view()
+    print(f"ผลลัพธ์ 🤖: shape={X_input.shape} dtype={X_input.dtype}")
+    assert X_input.shape == (1, 30, 5) and X_input.dtype == np.float32
+    assert np.allclose(X_input, expected, atol=1e-6)
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: input_view เป็น view ต่อเนื่อง ไม่ copy")
+    assert X_input.flags['C_CONTIGUOUS'] and np.shares_memory(X_input, window._buf)
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: extend หลายแถว = append ทีละแถว, ยังไม่ครบ window -> ValueError")
+    bulk = HistoryWindow(30, 5, scaler=scaler)
+    bulk.extend(rows[:10])
+    bulk.extend([])
+    assert len(bulk) == 10 and not bulk.is_full()
+    try:
+        bulk.input_view()
+        assert False, "ควร raise ValueError"
+    except ValueError as e:
+        print(f"ผลลัพธ์ 🤖: {e}")
+    bulk.extend(rows[10:])
+    assert np.array_equal(bulk.input_view(), X_input)
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,32 @@
+import json
+import os
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+HORIZONS = (1, 2, 3, 5, 10, 15)     # นาทีข้างหน้าที่โมเดล multi-horizon ทำนายพร้อมกัน (1 output ต่อ horizon)
+HORIZONS_SUFFIX = '.horizons.json'  # Multi-Horizon_LSTM_Model.keras -> Multi-Horizon_LSTM_Model.horizons.json
+
+
+def horizons_path(model_path):
+    return os.path.splitext(model_path)[0] + HORIZONS_SUFFIX
+
+
+def save_horizons(model_path, horizons):
+    with open(horizons_path(model_path), 'w', encoding='utf-8') as f:
+        json.dump({'horizons': list(horizons)}, f)
+
+
+def load_horizons(model_path):
+    """ horizon (นาที) ของแต่ละ output ของโมเดล | None = โมเดลเดิมที่ทำนายค่าเดียว (FORECAST_HORIZON) """
+    path = horizons_path(model_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return tuple(json.load(f)['horizons'])
+
+
+def value_at(by_horizon, minutes):
+    """ ค่าทำนายที่ horizon แรกที่ไม่สั้นกว่า minutes (ถ้าเกินทุก horizon ใช้ horizon ไกลสุด) """
+    candidates = [h for h in sorted(by_horizon) if h >= minutes]
+    return by_horizon[candidates[0] if candidates else max(by_horizon)]
@@ -0,0 +1,80 @@
+import tempfile
+
+import numpy as np
+
+from DecisionEngineV2 import DecisionEngine
+from fallback_forecaster import DeadlineForecaster
+from horizons import HORIZONS, load_horizons, save_horizons, value_at
+from model_evaluation import multihorizon_data, multivariate_data
+
+
+class VectorRunner:
+    """ runner จำลองของโมเดล multi-horizon: คืน 1 ค่า (scaled) ต่อ horizon ใน forward pass เดียว """
+
+    def __init__(self, outputs):
+        self.outputs = np.asarray(outputs, dtype=np.float32).reshape(1, -1)
+        self.calls = 0
+
+    def predict(self, X):
+        self.calls += 1
+        return self.outputs
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Multi-Horizon (Unit Testing)\n" + "="*50)
+
+    print("▶️ TEST 1: label หลาย horizon ตรงกับ multivariate_data ของ notebook ที่ horizon เดียวกัน")
+    series = np.arange(100, dtype=np.float64).reshape(-1, 1)
+    X, y = multihorizon_data(series, series, 0, None, 30, HORIZONS)
+    X5, y5 = multivariate_data(series, series, 0, None, 30, 5)
+    print(f"ผลลัพธ์ 🤖: X {X.shape} -> y {y.shape} | แถวแรก {y[0].tolist()}")
+    assert y.shape == (100 - 30 - max(HORIZONS), len(HORIZONS))
+    assert y[0].tolist() == [30 + h for h in HORIZONS]
+    assert np.array_equal(y[:, HORIZONS.index(5)], y5[:len(y), 0]) and np.array_equal(X, X5[:len(X)])
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: horizons sidecar + value_at เลือก horizon แรกที่ไม่สั้นกว่าที่ต้องการ")
+    with tempfile.TemporaryDirectory() as tmp:
+        save_horizons(f"{tmp}/model.keras", HORIZONS)
+        assert load_horizons(f"{tmp}/model.keras") == HORIZONS
+        assert load_horizons(f"{tmp}/other.keras") is None
+    by_horizon = {1: 1.0, 2: 2.0, 3: 3.0, 5: 5.0, 10: 10.0, 15: 15.0}
+    assert (value_at(by_horizon, 3), value_at(by_horizon, 4), value_at(by_horizon, 60)) == (3.0, 5.0, 15.0)
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: ทุก horizon จาก inference ครั้งเดียว (fallback ก็คืนครบทุก horizon)")
+    runner = VectorRunner([0.1, 0.2, 0.3, 0.5, 1.0, 1.5])
+    forecaster = DeadlineForecaster(runner, lambda v: v * 10, horizons=HORIZONS)
+    forecast = forecaster.forecast(np.zeros((1, 30, 5), dtype=np.float32), np.full(30, 2.0))
+    print(f"ผลลัพธ์ 🤖: cores(+5m)={forecast.cores:.2f} | {forecast.by_horizon}")
+    assert runner.calls == 1 and np.isclose(forecast.cores, 5.0)
+    assert list(forecast.by_horizon) == list(HORIZONS) and np.isclose(forecast.by_horizon[15], 15.0)
+    fallback = forecaster._fallback(np.full(30, 2.0), 0.0, "test")
+    assert list(fallback.by_horizon) == list(HORIZONS) and all(np.isclose(v, 2.0) for v in fallback.by_horizon.values())
+    forecaster.close()
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: DecisionEngine ดู demand ที่ lead time / cooldown ไม่ใช่แค่ +5 นาที")
+    # 1 worker = 4 Cores -> scale-out limit 3.2 | +5m ยังต่ำ แต่ +3m (ตอนเครื่องใหม่พร้อม) พุ่ง
+    spike = {1: 2.0, 2: 2.5, 3: 3.6, 5: 3.0, 10: 2.0, 15: 2.0}
+    action, reason = DecisionEngine().decide(predicted_cores=3.0, current_workers=1, pending_pods=0, current_cpu_usage=50.0,
+                                             current_cpu_req=2.0, predicted_by_horizon=spike)
+    print(f"ผลลัพธ์ 🤖: {action} | {reason}")
+    assert action == "SCALE_OUT" and "Horizon" in reason
+
+    # 2 workers: scale-in limit = 4 * 0.75 = 3.0 | +5m ต่ำ แต่ +2m ยังสูง -> ยังไม่ลดเครื่อง
+    dip_later = {1: 2.0, 2: 3.5, 3: 2.5, 5: 1.0, 10: 1.0, 15: 1.0}
+    action, reason = DecisionEngine().decide(predicted_cores=1.0, current_workers=2, pending_pods=0, current_cpu_usage=20.0,
+                                             current_cpu_req=1.0, predicted_by_horizon=dip_later)
+    print(f"ผลลัพธ์ 🤖: {action} | {reason}")
+    assert action == "DO_NOTHING"
+    action, _ = DecisionEngine().decide(predicted_cores=1.0, current_workers=2, pending_pods=0, current_cpu_usage=20.0,
+                                        current_cpu_req=1.0)
+    assert action == "SCALE_IN"               # ไม่มี multi-horizon = พฤติกรรมเดิม
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
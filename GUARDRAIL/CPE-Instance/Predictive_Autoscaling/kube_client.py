@@ -0,0 +1,228 @@
+import atexit
+import base64
+import json
+import os
+import tempfile
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+DEFAULT_KUBECONFIG = os.path.expanduser('~/.kube/config')
+SERVICE_ACCOUNT_DIR = '/var/run/secrets/kubernetes.io/serviceaccount'
+REQUEST_TIMEOUT = 5.0      # วินาที ต่อ 1 request (list/get)
+POOL_SIZE = 10             # จำนวน connection keep-alive สูงสุดต่อ API Server
+
+
+# ==========================================
+# 🚨 TYPED ERRORS (แทนการคืน "" เงียบๆ ของ run_cmd)
+# ==========================================
+class KubeError(Exception):
+    """ Error ทุกชนิดจาก Kubernetes API client """
+
+
+class KubeConfigError(KubeError):
+    """ อ่าน kubeconfig / service account ไม่ได้ หรือใช้ auth แบบที่ไม่รองรับ """
+
+
+class KubeConnectionError(KubeError):
+    """ ต่อ API Server ไม่ได้ (timeout, connection refused, TLS ผิด) """
+
+
+class KubeApiError(KubeError):
+    """ API Server ตอบกลับด้วย HTTP status ที่ไม่ใช่ 2xx """
+
+    def __init__(self, status, reason, message):
+        super().__init__(f"HTTP {status} {reason}: {message}")
+        self.status = status
+        self.reason = reason
+        self.message = message
+
+
+class KubeNotFound(KubeApiError):
+    """ HTTP 404 """
+
+
+# ==========================================
+# 🔌 CLIENT
+# ==========================================
+def _write_temp(data):
+    fd, path = tempfile.mkstemp(prefix='kube-', suffix='.pem')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    return path
+
+
+class KubeClient:
+    """
+    Client ของ Kubernetes API ที่เก็บ HTTPS connection แบบ keep-alive ไว้ใน pool
+    (ไม่ต้อง fork kubectl + อ่าน kubeconfig + TLS handshake ใหม่ทุกคำสั่ง) และคืนค่าเป็น dict ที่ parse แล้ว
+    """
+
+    def __init__(self, server, token=None, ca_cert=None, client_cert=None, verify=True,
+                 timeout=REQUEST_TIMEOUT, pool_size=POOL_SIZE, temp_files=()):
+        self.server = server.rstrip('/')
+        self.timeout = timeout
+        # ไฟล์ .pem ชั่วคราวจาก *-data ใน kubeconfig (มี private key) -> ลบตอน close() / ตอน process จบ
+        self._temp_files = list(temp_files)
+        if self._temp_files:
+            atexit.register(self._remove_temp_files)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['Accept'] = 'application/json'
+        if token:
+            self.session.headers['Authorization'] = f"Bearer {token}"
+        self.session.verify = ca_cert if (verify and ca_cert) else verify
+        if client_cert:
+            self.session.cert = client_cert
+
+    @classmethod
+    def in_cluster(cls, **kwargs):
+        """ ใช้ service account ของ Pod (ตอนรัน autoscaler เป็น Pod ใน Cluster) """
+        host = os.environ.get('KUBERNETES_SERVICE_HOST')
+        port = os.environ.get('KUBERNETES_SERVICE_PORT', '443')
+        if not host:
+            raise KubeConfigError("KUBERNETES_SERVICE_HOST not set (not running in a Pod)")
+        try:
+            with open(os.path.join(SERVICE_ACCOUNT_DIR, 'token')) as f:
+                token = f.read().strip()
+        except OSError as e:
+            raise KubeConfigError(f"cannot read service account token: {e}")
+        if ':' in host:
+            host = f"[{host}]"
+        return cls(f"https://{host}:{port}", token=token,
+                   ca_cert=os.path.join(SERVICE_ACCOUNT_DIR, 'ca.crt'), **kwargs)
+
+    @classmethod
+    def from_kubeconfig(cls, path=None, context=None, **kwargs):
+        """ อ่าน kubeconfig แบบเดียวกับ kubectl (KUBECONFIG หรือ ~/.kube/config) """
+        import yaml
+
+        path = path or os.environ.get('KUBECONFIG', '').split(os.pathsep)[0] or DEFAULT_KUBECONFIG
+        try:
+            with open(path) as f:
+                config = yaml.safe_load(f)
+        except (OSError, yaml.YAMLError) as e:
+            raise KubeConfigError(f"cannot read kubeconfig {path}: {e}")
+
+        def find(section, name):
+            for item in config.get(section) or []:
+                if item.get('name') == name:
+                    return item.get(section[:-1]) or {}
+            raise KubeConfigError(f"{section[:-1]} '{name}' not found in {path}")
+
+        ctx = find('contexts', context or config.get('current-context'))
+        cluster = find('clusters', ctx.get('cluster'))
+        user = find('users', ctx.get('user'))
+        base_dir = os.path.dirname(os.path.abspath(path))
+        temp_files = []
+
+        def file_or_data(file_key, data_key, section):
+            if section.get(data_key):
+                temp_files.append(_write_temp(base64.b64decode(section[data_key])))
+                return temp_files[-1]
+            if section.get(file_key):
+                return os.path.join(base_dir, os.path.expanduser(section[file_key]))
+            return None
+
+        if 'exec' in user or 'auth-provider' in user:
+            raise KubeConfigError("exec/auth-provider credentials are not supported; use a token or client certificate")
+        ca_cert = file_or_data('certificate-authority', 'certificate-authority-data', cluster)
+
+        token = user.get('token')
+        if not token and user.get('tokenFile'):
+            with open(user['tokenFile']) as f:
+                token = f.read().strip()
+        cert = file_or_data('client-certificate', 'client-certificate-data', user)
+        key = file_or_data('client-key', 'client-key-data', user)
+
+        return cls(cluster['server'], token=token, ca_cert=ca_cert,
+                   client_cert=(cert, key) if cert and key else None,
+                   verify=not cluster.get('insecure-skip-tls-verify', False), temp_files=temp_files, **kwargs)
+
+    @classmethod
+    def auto(cls, **kwargs):
+        if os.environ.get('KUBERNETES_SERVICE_HOST'):
+            return cls.in_cluster(**kwargs)
+        return cls.from_kubeconfig(**kwargs)
+
+    # ---------- HTTP ----------
+    def _request(self, path, params=None, timeout=None, stream=False):
+        try:
+            resp = self.session.get(self.server + path, params=params,
+                                    timeout=timeout or self.timeout, stream=stream)
+        except requests.RequestException as e:
+            raise KubeConnectionError(f"GET {path}: {e}") from e
+        if resp.status_code >= 400:
+            try:
+                message = resp.json().get('message', resp.text)
+            except ValueError:
+                message = resp.text
+            resp.close()
+            error_cls = KubeNotFound if resp.status_code == 404 else KubeApiError
+            raise error_cls(resp.status_code, resp.reason, message)
+        return resp
+
+    def get(self, path, params=None, timeout=None):
+        resp = self._request(path, params, timeout)
+        try:
+            return resp.json()
+        except ValueError as e:
+            raise KubeApiError(resp.status_code, resp.reason, f"invalid JSON: {e}") from e
+
+    def watch(self, path, resource_version=None, timeout_seconds=240, params=None):
+        """ เปิด watch stream แล้ว yield event (dict) ทีละตัวจนกว่า API Server จะปิด stream """
+        params = dict(params or {}, watch='1', allowWatchBookmarks='true', timeoutSeconds=str(timeout_seconds))
+        if resource_version:
+            params['resourceVersion'] = resource_version
+        resp = self._request(path, params, timeout=(self.timeout, timeout_seconds + self.timeout), stream=True)
+        try:
+            for line in resp.iter_lines():
+                if line:
+                    yield json.loads(line)
+        except requests.RequestException as e:
+            raise KubeConnectionError(f"watch {path}: {e}") from e
+        finally:
+            resp.close()
+
+    # ---------- shortcuts ----------
+    def list_nodes(self):
+        return self.get('/api/v1/nodes')
+
+    def list_pods(self, namespace=None, field_selector=None):
+        path = f"/api/v1/namespaces/{namespace}/pods" if namespace else '/api/v1/pods'
+        params = {'fieldSelector': field_selector} if field_selector else None
+        return self.get(path, params)
+
+    def node_metrics(self):
+        return self.get('/apis/metrics.k8s.io/v1beta1/nodes')
+
+    def _remove_temp_files(self):
+        while self._temp_files:
+            try:
+                os.remove(self._temp_files.pop())
+            except OSError:
+                pass
+
+    def close(self):
+        self.session.close()
+        self._remove_temp_files()
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_client():
+    """ Client ตัวเดียวที่ใช้ร่วมกันทั้ง process (สร้างครั้งแรกที่เรียก เรียกพร้อมกันจากหลาย thread ได้) """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = KubeClient.auto()
+        return _shared_client
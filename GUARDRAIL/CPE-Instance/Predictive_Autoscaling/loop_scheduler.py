@@ -0,0 +1,115 @@
+import math
+import time
+from collections import namedtuple
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+LATE_FRACTION = 0.1                                       # tick ที่เริ่มช้ากว่า deadline เกิน 10% ของ interval = late
+JITTER_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)  # ขอบบนของแต่ละช่องใน histogram (ms)
+
+Tick = namedtuple('Tick', ['index', 'deadline', 'lateness', 'late', 'skipped', 'woken'], defaults=(0,))
+Tick.__doc__ = """1 รอบของ control loop: deadline (monotonic), lateness = เริ่มช้ากว่า deadline กี่วินาที, skipped = จำนวน tick ที่ข้ามไปเพราะรอบก่อนทำงานเกิน
+woken = ค่าจาก wake() เมื่อถูกปลุกก่อน deadline (ไม่ใช่ tick ตาม grid -> ไม่นับ index / jitter และ deadline เดิมยังรออยู่)"""
+
+
+class FixedRateScheduler:
+    """
+    ตัวจังหวะ control loop แบบ fixed-rate บน monotonic clock (แทน time.sleep(LOOP_INTERVAL) หลังทำงานเสร็จ)
+    - deadline ของ tick ที่ n = start + n * interval เสมอ -> เวลาทำงานแต่ละรอบไม่ทำให้คาบยืด (ไม่ drift ออกจาก grid 1 นาที)
+    - รอบที่ทำงานเกินจน deadline ถัดไปผ่านไปแล้ว: ข้าม tick ที่พลาด (นับใน skipped) แล้วกลับเข้า grid เดิม ไม่รันรวดติดกัน
+    - เก็บ histogram ของ jitter (เริ่มช้ากว่า deadline) ไว้รายงาน
+    """
+
+    def __init__(self, interval, late_fraction=LATE_FRACTION, clock=time.monotonic, sleep=time.sleep):
+        self.interval = interval
+        self.late_fraction = late_fraction
+        self.clock = clock
+        self.sleep = sleep
+        self._start = None
+        self._next = None
+        self._last = None          # deadline ของ tick ล่าสุด
+        self.ticks = 0
+        self.late_ticks = 0
+        self.skipped_ticks = 0
+        self.max_lateness = 0.0
+        self._histogram = [0] * (len(JITTER_BUCKETS_MS) + 1)
+
+    def wait(self, wake=None):
+        """
+        รอจนถึง deadline ถัดไปแล้วคืน Tick (tick แรกเริ่มทันที)
+        wake(timeout): ใช้รอแทน sleep ถ้าคืนค่า truthy ก่อนถึง deadline -> คืน Tick ที่ woken ทันที (เช่น PendingTrigger.wait)
+        """
+        now = self.clock()
+        if self._next is None:
+            self._next = now
+            if self._start is None:
+                self._start = now
+        while now < self._next:
+            if wake is None:
+                self.sleep(self._next - now)
+            else:
+                woken = wake(self._next - now)
+                if woken:
+                    return Tick(self.ticks, self._next, 0.0, False, 0, woken)
+            now = self.clock()
+
+        skipped = int((now - self._next) // self.interval)
+        if skipped:
+            self._next += skipped * self.interval      # ทิ้ง tick ที่พลาด อยู่บน grid เดิม
+            self.skipped_ticks += skipped
+        lateness = max(0.0, now - self._next)
+        late = lateness > self.interval * self.late_fraction
+        self._record(lateness, late)
+
+        tick = Tick(self.ticks, self._next, lateness, late, skipped)
+        self.ticks += 1
+        self._last = self._next
+        self._next = self._grid_after(self._next, self.interval)
+        return tick
+
+    def _grid_after(self, t, interval):
+        """ deadline ตัวแรกบน grid (start + k * interval) ที่อยู่หลัง t """
+        return self._start + (math.floor((t - self._start) / interval + 1e-6) + 1) * interval
+
+    def align(self, wall_time, wall_clock=time.time):
+        """
+        เลื่อน grid ให้ deadline ตรงกับเวลา wall clock wall_time (+/- k * interval) เช่นจุด grid ถัดจากแถวสุดท้ายที่กู้ / backfill มา
+        tick แรกยังเริ่มทันที tick ถัดจากนั้นลง grid ใหม่
+        """
+        self._start = self.clock() + (wall_time - wall_clock()) % self.interval
+        if self._next is not None:
+            self._next = self._start
+
+    def set_interval(self, interval):
+        """
+        เปลี่ยนคาบ (adaptive sampling): deadline ถัดไป = start + k * คาบใหม่ ตัวแรกหลัง tick ล่าสุด
+        คาบที่หาร interval เดิมลงตัว (เช่น 10/20/30 กับ 60) -> ทุกจุด grid 1 นาทีจาก start ยังเป็น deadline เสมอ
+        """
+        if self._last is not None:
+            self._next = self._grid_after(self._last, interval)
+        self.interval = interval
+
+    def __iter__(self):
+        while True:
+            yield self.wait()
+
+    def _record(self, lateness, late):
+        self.late_ticks += late
+        self.max_lateness = max(self.max_lateness, lateness)
+        lateness_ms = lateness * 1000
+        for i, bound in enumerate(JITTER_BUCKETS_MS):
+            if lateness_ms <= bound:
+                self._histogram[i] += 1
+                return
+        self._histogram[-1] += 1
+
+    def histogram(self):
+        """ [(ช่วง, จำนวน tick), ...] ของ jitter """
+        labels = [f"<={b}ms" for b in JITTER_BUCKETS_MS] + [f">{JITTER_BUCKETS_MS[-1]}ms"]
+        return list(zip(labels, self._histogram))
+
+    def report(self):
+        bars = " | ".join(f"{label} {count}" for label, count in self.histogram() if count)
+        return (f"ticks {self.ticks} | late {self.late_ticks} | skipped {self.skipped_ticks} | "
+                f"max jitter {self.max_lateness * 1000:.1f} ms | {bars}")
@@ -0,0 +1,80 @@
+from loop_scheduler import FixedRateScheduler
+
+
+class FakeClock:
+    """ นาฬิกา monotonic จำลอง: sleep() เดินเวลาไปตรงๆ, work() = เวลาที่ใช้ทำงานในรอบนั้น """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.oversleep = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds + self.oversleep
+
+    def work(self, seconds):
+        self.now += seconds
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Fixed-Rate Loop Scheduler (Unit Testing)\n" + "="*50)
+
+    print("▶️ TEST 1: เวลาทำงานแต่ละรอบไม่ทำให้คาบยืด (deadline = start + n * 60)")
+    clock = FakeClock()
+    scheduler = FixedRateScheduler(60, clock=clock, sleep=clock.sleep)
+    starts = []
+    for work in [12.0, 25.0, 3.0, 40.0, 0.5]:
+        tick = scheduler.wait()
+        starts.append(clock.now - 1000.0)
+        clock.work(work)
+    print(f"ผลลัพธ์ 🤖: เริ่มรอบที่ {starts}")
+    assert starts == [0.0, 60.0, 120.0, 180.0, 240.0]
+    assert scheduler.late_ticks == 0 and scheduler.skipped_ticks == 0 and tick.index == 4
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: รอบที่ทำงานเกิน -> ข้าม tick ที่พลาด แล้วกลับเข้า grid เดิม")
+    clock.work(150.0)                       # tick 4 ใช้เวลา 150.5 s -> เลย deadline 300 และ 360 ไปแล้ว
+    tick = scheduler.wait()
+    print(f"ผลลัพธ์ 🤖: {tick}")
+    assert tick.skipped == 1 and tick.deadline == 1000.0 + 360.0     # ทิ้ง 300 รันแทน 360 (ไม่รันรวด 2 รอบ)
+    assert tick.late and abs(tick.lateness - 30.5) < 1e-9
+    clock.work(1.0)
+    tick = scheduler.wait()
+    assert clock.now == 1000.0 + 420.0 and tick.skipped == 0
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: ตื่นช้ากว่า deadline (เครื่องช้า / GC) -> mark late + jitter histogram")
+    clock = FakeClock()
+    scheduler = FixedRateScheduler(60, clock=clock, sleep=clock.sleep)
+    scheduler.wait()
+    clock.oversleep = 0.003
+    scheduler.wait()                        # ช้า 3 ms -> on time
+    clock.oversleep = 8.0
+    tick = scheduler.wait()                 # ช้า 8 s (> 10% ของ 60 s) -> late
+    print(f"ผลลัพธ์ 🤖: {scheduler.report()}")
+    assert tick.late and abs(tick.lateness - 8.0) < 1e-6 and scheduler.late_ticks == 1
+    counts = dict(scheduler.histogram())
+    assert counts["<=1ms"] == 1 and counts["<=5ms"] == 1 and counts[">5000ms"] == 1
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: align กับจุด grid ของประวัติที่กู้มา -> tick แรกทันที tick ถัดไปลงจุด grid (wall clock) นั้น")
+    clock = FakeClock()
+    wall_clock = lambda: clock.now + 4000.0                      # wall = monotonic + 4000
+    scheduler = FixedRateScheduler(60, clock=clock, sleep=clock.sleep)
+    scheduler.align(4990.0 + 60, wall_clock)                      # แถวสุดท้ายที่กู้มา 4990 -> grid ถัดไป 5050
+    walls = []
+    for interval in (60, 60, 60, 10):
+        scheduler.set_interval(interval)
+        scheduler.wait()
+        walls.append(wall_clock())
+    print(f"ผลลัพธ์ 🤖: {walls}")
+    assert walls == [5000.0, 5050.0, 5110.0, 5120.0] and scheduler.skipped_ticks == 0
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,28 @@
+from collections import namedtuple
+
+import numpy as np
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+MC_SAMPLES = 32          # จำนวน forward pass แบบสุ่ม (รันเป็น batch เดียว K x window x features)
+UPPER_QUANTILE = 0.9     # ขอบบนของช่วงความไม่แน่นอนที่ใช้ตัดสินใจ scale-out
+
+Uncertainty = namedtuple('Uncertainty', ['mean', 'upper', 'std', 'samples'])
+Uncertainty.__doc__ = """ผล MC-dropout (หน่วย scaled) ต่อ output (1 ต่อ horizon): ค่าเฉลี่ย, quantile บน, ส่วนเบี่ยงเบนมาตรฐาน (shape (outputs,)), ค่าดิบทุก sample (samples, outputs)"""
+
+
+def supports_mc(runner):
+    """ backend ที่ยังมี Dropout อยู่ในกราฟ (keras / numpy) เท่านั้นที่ทำ MC-dropout ได้ """
+    return hasattr(runner, 'predict_mc')
+
+
+def mc_predict(runner, X_input, samples=MC_SAMPLES, quantile=UPPER_QUANTILE):
+    """
+    รันโมเดลแบบเปิด Dropout K ครั้งในการเรียกเดียว (batch เดียว ไม่ใช่ predict K รอบ)
+    คืน Uncertainty ของค่า scaled (แปลงกลับเป็น Cores ด้วย scaler_target เอง)
+    """
+    if not supports_mc(runner):
+        raise ValueError(f"{type(runner).__name__} has no dropout at inference (use MODEL_BACKEND 'keras' or 'numpy')")
+    draws = np.asarray(runner.predict_mc(X_input, samples), dtype=np.float64).reshape(samples, -1)
+    return Uncertainty(draws.mean(axis=0), np.quantile(draws, quantile, axis=0), draws.std(axis=0), draws)
@@ -0,0 +1,81 @@
+import time
+
+import numpy as np
+
+from DecisionEngineV2 import DecisionEngine
+from affine_scaler import load_scaler
+from fallback_forecaster import DeadlineForecaster
+from mc_dropout import mc_predict
+from numpy_lstm import DropoutLayer, NumpyLSTMModel
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ MC-Dropout (Unit Testing)\n" + "="*50)
+    model = NumpyLSTMModel.load('best_single_var_model.keras')      # LSTM -> Dropout(0.2) -> LSTM -> Dropout(0.2) -> Dense
+    scaler = load_scaler('scaler.pkl')
+    X = scaler.transform(np.linspace(3.0, 6.0, 30).reshape(30, 1))[np.newaxis].astype(np.float32)
+
+    print("▶️ TEST 1: Dropout ปิด unit ตามอัตรา และคูณชดเชย 1/(1-rate) แบบ Keras")
+    layer = DropoutLayer(0.2)
+    out = layer.sample(np.ones((200, 30, 16), dtype=np.float32), np.random.default_rng(0))
+    print(f"ผลลัพธ์ 🤖: ปิดไป {np.mean(out == 0):.3f} | ค่าเฉลี่ย {out.mean():.3f}")
+    assert abs(np.mean(out == 0) - 0.2) < 0.01 and abs(out.mean() - 1.0) < 0.02
+    assert np.array_equal(layer(X), X)        # predict ปกติไม่มี dropout
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: K sample ในการเรียกเดียว -> mean / upper / std")
+    result = mc_predict(model, X, samples=64, quantile=0.9)
+    point = model.predict(X)[0, 0]
+    mean, upper, std = result.mean[0], result.upper[0], result.std[0]
+    print(f"ผลลัพธ์ 🤖: point {point:.4f} | mean {mean:.4f} | q90 {upper:.4f} | std {std:.4f}")
+    assert result.samples.shape == (64, 1) and std > 0
+    assert upper >= mean and abs(mean - point) < 3 * std + 1e-3
+    assert np.array_equal(model.predict(X), model.predict(X))     # โหมดปกติยังเป็น deterministic
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: batch เดียวเร็วกว่าการ predict ทีละ sample K รอบ")
+    rng = np.random.default_rng(1)
+    started = time.perf_counter()
+    for _ in range(20):
+        model.predict_mc(X, 32, rng)
+    batched = (time.perf_counter() - started) / 20
+    started = time.perf_counter()
+    for _ in range(20):
+        single = model.predict(X)
+    single = (time.perf_counter() - started) / 20
+    print(f"ผลลัพธ์ 🤖: 1 inference {single * 1000:.2f} ms | MC 32 samples (batch) {batched * 1000:.2f} ms | ทีละรอบ ~{32 * single * 1000:.2f} ms")
+    assert batched < 32 * single / 2
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: DeadlineForecaster คืน upper_cores (Cores) + DecisionEngine scale-out ด้วยขอบบน")
+    forecaster = DeadlineForecaster(model, lambda v: scaler.inverse_column(v, 0), mc_samples=32, quantile=0.9)
+    forecast = forecaster.forecast(X, np.linspace(3.0, 6.0, 30))
+    forecaster.close()
+    print(f"ผลลัพธ์ 🤖: {forecast.cores:.2f} Cores (upper {forecast.upper_cores:.2f})")
+    assert forecast.source == 'lstm' and forecast.upper_cores >= forecast.cores
+
+    engine = DecisionEngine(cores_per_node=4.0, max_workers=2, min_workers=1)
+    action, reason = engine.decide(predicted_cores=3.0, current_workers=1, pending_pods=0, current_cpu_usage=50.0,
+                                   current_cpu_req=2.5, predicted_upper_cores=3.5)
+    print(f"ผลลัพธ์ 🤖: {action} | {reason}")
+    assert action == "SCALE_OUT" and "Upper" in reason
+    action, _ = DecisionEngine().decide(predicted_cores=3.0, current_workers=1, pending_pods=0,
+                                        current_cpu_usage=50.0, current_cpu_req=2.5)
+    assert action == "DO_NOTHING"           # ไม่มีขอบบน = พฤติกรรมเดิม
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 5: backend ที่ไม่มี Dropout ในกราฟ (onnx / tflite) -> ValueError")
+    class PointRunner:
+        def predict(self, X):
+            return np.zeros((1, 1))
+    try:
+        DeadlineForecaster(PointRunner(), lambda v: v, mc_samples=32)
+        assert False, "should raise"
+    except ValueError as e:
+        print(f"ผลลัพธ์ 🤖: {e}\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,128 @@
+import json
+import math
+import os
+
+import numpy as np
+
+from adaptive_sampler import CLOCK_SLACK
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+SUB_MINUTE_INTERVAL = 10     # วินาที: คาบเก็บ sample ในโหมด aggregate (หาร 60 ลงตัว = ตรงกับ subquery [1m:10s] ตอนเทรน)
+MINUTE_STEP = 60             # วินาที: 1 แถวของ window = 1 นาที (เหมือนเดิม)
+MINUTE_TOLERANCE = 6         # วินาที: sample ที่ช้ากว่าจุดปลายนาทีไม่เกินนี้ยังนับเป็นของนาทีนั้น (tick ช้า)
+BASE_FEATURES = ('cluster_cpu_req', 'cluster_cpu_cap', 'cluster_mem_req', 'cluster_mem_cap', 'cluster_pods_pending')
+AGGREGATE_FEATURES = ('cluster_cpu_req', 'cluster_pods_pending')   # feature ที่ burst สั้นๆ ในนาทีเดียวแล้วหายได้
+STATS = ('min', 'mean', 'max')
+FEATURES_SUFFIX = '.features.json'   # Aggregate_LSTM_Model.keras -> Aggregate_LSTM_Model.features.json (ลำดับคอลัมน์ input)
+
+
+def aggregate_columns(base=BASE_FEATURES, aggregated=AGGREGATE_FEATURES, stats=STATS):
+    """ ลำดับคอลัมน์ของโมเดลแบบ aggregate: feature เดิม 5 ตัว (ค่า ณ ปลายนาที) + {feature}_{stat} """
+    return list(base) + [f"{name}_{stat}" for name in aggregated for stat in stats]
+
+
+def split_column(column):
+    """ 'cluster_cpu_req_max' -> ('cluster_cpu_req', 'max') | 'cluster_cpu_req' -> ('cluster_cpu_req', None) """
+    for stat in STATS:
+        if column.endswith(f"_{stat}"):
+            return column[:-len(stat) - 1], stat
+    return column, None
+
+
+def features_path(model_path):
+    return os.path.splitext(model_path)[0] + FEATURES_SUFFIX
+
+
+def save_feature_columns(model_path, columns):
+    with open(features_path(model_path), 'w', encoding='utf-8') as f:
+        json.dump({'features': list(columns)}, f)
+
+
+def load_feature_columns(model_path):
+    """ ลำดับคอลัมน์ input ของโมเดล | None = โมเดลเดิม (BASE_FEATURES 5 ตัว) """
+    path = features_path(model_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return list(json.load(f)['features'])
+
+
+def is_aggregate(columns):
+    return any(split_column(c)[1] for c in columns)
+
+
+class MinuteAggregator:
+    """
+    รวม sample ถี่ๆ (ทุก SUB_MINUTE_INTERVAL วิ) เป็น 1 แถวต่อนาทีแบบ streaming
+    - นาทีที่ k ครอบคลุม (ปลายนาทีก่อน, ปลายนาที k] เหมือน subquery [1m:10s] ของ Prometheus ที่ปลายนาที
+    - เก็บแค่ count / sum / min / max / ค่าล่าสุด ต่อคอลัมน์ของนาทีปัจจุบัน = หน่วยความจำคงที่ ไม่เก็บ sample
+    - ค่า feature เดิม = sample ล่าสุดของนาที (ค่า ณ ปลายนาที เหมือน instant query) -> คอลัมน์เดิมไม่เปลี่ยนความหมาย
+    start: ปลายนาทีแรก (แถวสุดท้ายที่กู้ / backfill มา + step) -> แถวสดต่อจากประวัติเดิมห่าง 1 นาทีพอดี
+           (นาทีรอยต่อมี sample เท่าที่เก็บได้หลัง start) | None = ปลายนาทีแรกคือ sample แรก + step (ครบ 1 นาทีเต็มก่อนปล่อย)
+    """
+
+    def __init__(self, columns, base=BASE_FEATURES, step=MINUTE_STEP, tolerance=MINUTE_TOLERANCE, start=None):
+        self.columns = list(columns)
+        self.base = list(base)
+        self.step = step
+        self.tolerance = tolerance
+        # คอลัมน์ output -> (index ใน sample, stat)
+        self._plan = []
+        for column in self.columns:
+            name, stat = split_column(column)
+            if name not in self.base:
+                raise ValueError(f"unknown feature {name!r} in column {column!r} (expected one of {self.base})")
+            self._plan.append((self.base.index(name), stat))
+        self._origin = start         # ปลายนาทีที่ 0
+        self._minute = 0             # index ของนาทีที่กำลังสะสม
+        self._reset()
+        self._last = None            # sample ล่าสุด (hold ให้นาทีที่ไม่มี sample)
+
+    def _reset(self):
+        n = len(self.base)
+        self._count = 0
+        self._sum = np.zeros(n)
+        self._min = np.full(n, np.inf)
+        self._max = np.full(n, -np.inf)
+
+    def _minute_of(self, t):
+        """ นาทีที่ sample นี้อยู่: ช้ากว่าปลายนาทีไม่เกิน tolerance = ยังเป็นนาทีนั้น """
+        return math.ceil((t - self._origin - self.tolerance) / self.step)
+
+    def _emit(self):
+        if self._count:
+            mean = self._sum / self._count
+            stats = {'min': self._min, 'mean': mean, 'max': self._max}
+        else:
+            stats = {'min': self._last, 'mean': self._last, 'max': self._last}
+        row = [self._last[i] if stat is None else stats[stat][i] for i, stat in self._plan]
+        grid_time = self._origin + self._minute * self.step
+        self._minute += 1
+        self._reset()
+        return grid_time, row
+
+    def add(self, t, sample):
+        """
+        ใส่ sample (t = epoch วินาที, ค่าเรียงตาม base) คืน [(ปลายนาที, แถวตาม columns), ...] ของนาทีที่ปิดแล้ว
+        นาทีปิดทันทีเมื่อ sample ถึงปลายนาที (ไม่ต้องรอ sample ถัดไป) หรือเมื่อ sample ข้ามไปนาทีถัดไป
+        """
+        sample = np.asarray(sample, dtype=np.float64)
+        if self._origin is None:
+            self._origin = t + self.step   # นาทีแรก = [sample แรก, sample แรก + step] ไม่ปล่อยแถวจาก sample เดียว
+        if self._last is None:
+            self._last = sample            # start อยู่ในอดีต (ประวัติขาดช่วง) -> นาทีที่ขาด hold ค่า sample แรก
+        out = []
+        minute = self._minute_of(t)
+        while self._minute < minute:  # นาทีที่จบไปแล้ว (ไม่มี sample ปลายนาที / ข้อมูลขาด -> hold ค่าล่าสุด)
+            out.append(self._emit())
+
+        self._count += 1
+        self._sum += sample
+        np.minimum(self._min, sample, out=self._min)
+        np.maximum(self._max, sample, out=self._max)
+        self._last = sample
+        if t >= self._origin + self._minute * self.step - CLOCK_SLACK:
+            out.append(self._emit())
+        return out
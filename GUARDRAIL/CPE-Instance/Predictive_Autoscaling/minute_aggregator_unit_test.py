@@ -0,0 +1,87 @@
+import os
+import tempfile
+
+from minute_aggregator import (MinuteAggregator, aggregate_columns, is_aggregate, load_feature_columns,
+                               save_feature_columns, split_column)
+from prometheus_source import AGGREGATE_QUERIES, FEATURE_QUERIES, aggregate_query
+
+
+def sample(cpu_req, pending):
+    return [cpu_req, 8.0, 4.0, 16.0, pending]
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Sub-minute Aggregation (Unit Testing)\n" + "="*50)
+    columns = aggregate_columns()
+
+    print("▶️ TEST 1: Pending พุ่งแค่ 20 วิกลางนาที -> ค่าปลายนาที = 0 แต่ _max จับได้ | แถวแรกรอครบ 1 นาทีเต็ม")
+    aggregator = MinuteAggregator(columns)
+    rows = []
+    for k, pending in enumerate([0, 0, 3, 5, 0, 0, 0]):
+        rows += aggregator.add(1000 + 10 * k, sample(2.0 + k, pending))
+    (t, row), = rows
+    named = dict(zip(columns, row))
+    print(f"ผลลัพธ์ 🤖: {t} {({c: float(v) for c, v in named.items()})}")
+    assert t == 1060
+    assert named['cluster_pods_pending'] == 0 and named['cluster_pods_pending_max'] == 5
+    assert named['cluster_pods_pending_mean'] == 8 / 7 and named['cluster_pods_pending_min'] == 0
+    assert named['cluster_cpu_req'] == 8.0 and named['cluster_cpu_req_min'] == 2.0 and named['cluster_cpu_req_mean'] == 5.0
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: 1 แถวต่อนาที ปล่อยทันทีที่ sample ถึงปลายนาที (tick ช้า/เร็วนิดหน่อย) | state ไม่โตตาม sample")
+    aggregator = MinuteAggregator(columns)
+    emitted = []
+    for i in range(6 * 60 + 1):                                          # 60 นาที ทุก 10 วิ
+        jitter = 0.3 if i and i % 6 == 0 else -0.2 if i % 6 == 5 else 0.0
+        for grid_time, _ in aggregator.add(5000 + 10 * i + jitter, sample(1.0, 0)):
+            emitted.append((i, grid_time))
+    print(f"ผลลัพธ์ 🤖: {len(emitted)} แถว | แถวสุดท้าย {emitted[-1]} | state {aggregator._sum.shape}")
+    assert [t for _, t in emitted] == [5060 + 60 * k for k in range(60)]
+    assert all(i % 6 == 0 for i, _ in emitted) and aggregator._sum.shape == (5,)
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: ข้อมูลขาด 2 นาที -> hold ค่าล่าสุด (min = mean = max) ไม่มีช่องว่างใน window")
+    aggregator = MinuteAggregator(columns)
+    rows = aggregator.add(0, sample(2.0, 1)) + aggregator.add(30, sample(4.0, 0)) + aggregator.add(200, sample(6.0, 2))
+    print(f"ผลลัพธ์ 🤖: {[(t, r[0], r[columns.index('cluster_cpu_req_max')]) for t, r in rows]}")
+    assert [t for t, _ in rows] == [60, 120, 180]
+    assert rows[0][1][columns.index('cluster_cpu_req_min')] == 2.0 and rows[0][1][columns.index('cluster_cpu_req_max')] == 4.0
+    assert rows[1][1][columns.index('cluster_cpu_req_min')] == rows[2][1][columns.index('cluster_cpu_req_max')] == 4.0
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: ลำดับคอลัมน์ -> sidecar .features.json / query ตอนเทรนตรงกับ serving")
+    assert split_column('cluster_pods_pending_max') == ('cluster_pods_pending', 'max')
+    assert is_aggregate(columns) and not is_aggregate(list(FEATURE_QUERIES))
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, 'Aggregate_LSTM_Model.keras')
+        assert load_feature_columns(model_path) is None
+        save_feature_columns(model_path, columns)
+        assert load_feature_columns(model_path) == columns
+    query = aggregate_query('sum(x)', 'max')
+    print(f"ผลลัพธ์ 🤖: {len(columns)} คอลัมน์ | {query}")
+    assert query == 'max_over_time((sum(x))[60s:10s])'
+    assert all(c in FEATURE_QUERIES or c in AGGREGATE_QUERIES for c in columns)
+    try:
+        MinuteAggregator(['cluster_cpu_usage_max'])
+        assert False, "ควร error"
+    except ValueError:
+        pass
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 5: start = แถวสุดท้ายที่กู้ / backfill มา + 60 -> แถวสดต่อ grid เดิม ไม่มีรอยต่อ")
+    aggregator = MinuteAggregator(columns, start=3060)                  # แถวสุดท้ายของประวัติ = 3000
+    rows = []
+    for t in (3030, 3040, 3050, 3060, 3070, 3120):
+        rows += aggregator.add(t, sample(t / 1000, 0))
+    print(f"ผลลัพธ์ 🤖: {[(t, float(r[0])) for t, r in rows]}")
+    assert [t for t, _ in rows] == [3060, 3120]
+    assert rows[0][1][columns.index('cluster_cpu_req_min')] == 3.03 and rows[0][1][0] == 3.06
+    gap = MinuteAggregator(columns, start=3060).add(3200, sample(5.0, 1))   # ประวัติขาดช่วง -> hold sample แรก
+    assert [t for t, _ in gap] == [3060, 3120, 3180] and all(r[0] == 5.0 for _, r in gap)
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,111 @@
+import json
+import os
+
+import numpy as np
+
+from affine_scaler import AffineScaler
+from numpy_lstm import NumpyLSTMModel
+
+# ==========================================
+# 📦 BUNDLE FORMAT
+# ==========================================
+# <name>.bundle/
+#   metadata.json      window_size, features, horizon (int หรือ list ของโมเดล multi-horizon), config ของโมเดล, scaler (min_/scale_), ไฟล์ weight ต่อ layer
+#   w<layer>_<i>.npy   weight float32 แต่ละก้อน (np.load แบบ mmap ไม่ต้องอ่านทั้งไฟล์ตอนเริ่ม)
+METADATA_FILE = 'metadata.json'
+BUNDLE_VERSION = 1
+
+
+class ModelBundle:
+    """ โมเดล + scaler + metadata ที่โหลดจาก bundle เดียว """
+
+    def __init__(self, path, metadata, model, scaler_inputs, scaler_target):
+        self.path = path
+        self.metadata = metadata
+        self.model = model
+        self.scaler_inputs = scaler_inputs
+        self.scaler_target = scaler_target
+        self.window_size = metadata['window_size']
+        self.features = metadata['features']
+        self.horizon = metadata['horizon']
+        self.horizons = tuple(self.horizon) if isinstance(self.horizon, list) else None    # None = output เดียว
+
+
+def export_bundle(model_path, scaler_inputs_path, scaler_target_path, out_dir,
+                  features, horizon, window_size=None):
+    """ แปลงโมเดล (.keras/.h5) + scaler (.pkl) เป็น bundle (ใช้ตอน build เท่านั้น: ต้องมี h5py + sklearn) """
+    import joblib
+    from numpy_lstm import read_weights
+
+    model_config, layer_weights = read_weights(model_path)
+    model = NumpyLSTMModel.from_config(model_config, layer_weights)
+    _, model_window, n_features = model.input_shape
+    if n_features != len(features):
+        raise ValueError(f"model expects {n_features} features, got {len(features)}")
+
+    os.makedirs(out_dir, exist_ok=True)
+    weight_files = []
+    for layer_idx, weights in enumerate(layer_weights):
+        names = []
+        for i, w in enumerate(weights):
+            name = f"w{layer_idx}_{i}.npy"
+            np.save(os.path.join(out_dir, name), np.ascontiguousarray(w, dtype=np.float32))
+            names.append(name)
+        weight_files.append(names)
+
+    metadata = {
+        'version': BUNDLE_VERSION,
+        'source_model': os.path.abspath(model_path),
+        'window_size': window_size or model_window,
+        'features': list(features),
+        'horizon': list(horizon) if isinstance(horizon, (list, tuple)) else horizon,
+        'model_config': model_config,
+        'weights': weight_files,
+        'scaler_inputs': AffineScaler.from_sklearn(joblib.load(scaler_inputs_path)).to_dict(),
+        'scaler_target': AffineScaler.from_sklearn(joblib.load(scaler_target_path)).to_dict(),
+    }
+    tmp_path = os.path.join(out_dir, f"{METADATA_FILE}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f)
+    os.replace(tmp_path, os.path.join(out_dir, METADATA_FILE))     # metadata เขียนทีหลังสุด = bundle ครบแล้ว
+    return out_dir
+
+
+def load_bundle(path, backend='numpy'):
+    """
+    โหลด bundle: backend 'numpy' ใช้ weight แบบ mmap ใน bundle โดยตรง (ไม่ import TensorFlow / sklearn)
+    backend อื่น ('keras', 'onnx', 'tflite', ...) โหลดผ่าน load_runner จากโมเดลต้นฉบับที่ bundle ชี้ไว้
+    """
+    with open(os.path.join(path, METADATA_FILE), encoding='utf-8') as f:
+        metadata = json.load(f)
+    if metadata.get('version') != BUNDLE_VERSION:
+        raise ValueError(f"{path}: unsupported bundle version {metadata.get('version')}")
+
+    if backend == 'numpy':
+        weights = [[np.load(os.path.join(path, name), mmap_mode='r') for name in names]
+                   for names in metadata['weights']]
+        model = NumpyLSTMModel.from_config(metadata['model_config'], weights)
+    else:
+        from model_runner import load_runner
+        model = load_runner(metadata['source_model'], backend)
+
+    return ModelBundle(path, metadata, model,
+                       AffineScaler.from_dict(metadata['scaler_inputs']),
+                       AffineScaler.from_dict(metadata['scaler_target']))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export a model + scalers into a fast-start bundle")
+    parser.add_argument('--model', required=True)
+    parser.add_argument('--scaler-inputs', required=True)
+    parser.add_argument('--scaler-target', required=True)
+    parser.add_argument('--features', nargs='+', required=True)
+    parser.add_argument('--horizon', type=int, nargs='+', default=[5], help="หลายค่า = โมเดล multi-horizon (train_multi_horizon.py)")
+    parser.add_argument('--out', required=True)
+    args = parser.parse_args()
+
+    export_bundle(args.model, args.scaler_inputs, args.scaler_target, args.out, args.features,
+                  args.horizon if len(args.horizon) > 1 else args.horizon[0])
+    print(f"✅ สร้าง bundle: {args.out}")
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+import tempfile
+import warnings
+
+import joblib
+import numpy as np
+
+from model_bundle import export_bundle, load_bundle
+from numpy_lstm import NumpyLSTMModel
+
+warnings.filterwarnings("ignore")
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Model Bundle (Unit Testing)\n" + "="*50)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundle_path = f"{tmp}/single_var.bundle"
+        export_bundle('best_single_var_model.keras', 'scaler.pkl', 'scaler.pkl', bundle_path,
+                      features=['cluster_cpu_req'], horizon=5)
+
+        print("▶️ TEST 1: metadata ครบ (window, feature order, horizon)")
+        bundle = load_bundle(bundle_path)
+        print(f"ผลลัพธ์ 🤖: window={bundle.window_size} features={bundle.features} horizon={bundle.horizon}")
+        assert (bundle.window_size, bundle.features, bundle.horizon) == (30, ['cluster_cpu_req'], 5)
+        print("ผลลัพธ์ ✅\n")
+
+        print("▶️ TEST 2: ผลทำนาย + scaler ตรงกับโมเดล/pickle ต้นฉบับ")
+        scaler = joblib.load('scaler.pkl')
+        raw = np.linspace(2.0, 9.0, 30).reshape(30, 1)
+        assert np.allclose(bundle.scaler_inputs.transform(raw), scaler.transform(raw))
+        expected = scaler.inverse_transform(NumpyLSTMModel.load('best_single_var_model.keras').predict(scaler.transform(raw)[None]))
+        got = bundle.scaler_target.inverse_transform(bundle.model.predict(bundle.scaler_inputs.transform(raw)[None]))
+        print(f"ผลลัพธ์ 🤖: ต้นฉบับ {expected[0][0]:.4f} | bundle {got[0][0]:.4f} Cores")
+        assert np.allclose(got, expected, atol=1e-5)
+        print("ผลลัพธ์ ✅\n")
+
+        print("▶️ TEST 3: โหลด bundle โดยไม่ import sklearn / TensorFlow / h5py")
+        code = ("import sys; from model_bundle import load_bundle; load_bundle(sys.argv[1]); "
+                "print(','.join(m for m in ('sklearn', 'tensorflow', 'h5py', 'joblib') if m in sys.modules))")
+        loaded = subprocess.run([sys.executable, '-c', code, bundle_path], capture_output=True, text=True, check=True).stdout.strip()
+        print(f"ผลลัพธ์ 🤖: heavy modules ที่ถูก import = [{loaded}]")
+        assert loaded == ""
+        print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,103 @@
+import time
+import warnings
+
+import joblib
+import numpy as np
+
+warnings.filterwarnings("ignore", category=UserWarning, module='sklearn')
+
+# ==========================================
+# ⚙️ CONFIGURATION (ตรงกับ Multi_Variable_Old_UnC.ipynb)
+# ==========================================
+DATASET_PATH = '../../../LSTM/PromQL/training_data_prometheus.csv'
+FEATURE_COLUMNS = ['cluster_cpu_req', 'cluster_cpu_cap', 'cluster_mem_req', 'cluster_mem_cap', 'cluster_pods_pending']
+TARGET_COLUMN = 'cluster_cpu_req'
+WINDOW_SIZE = 30
+FORECAST_HORIZON = 5
+TRAIN_SPLIT, VAL_SPLIT = 0.7, 0.85      # chronological 70/15/15
+THRESHOLD_MARGIN = 0.10                 # "Threshold Accuracy" = ทำนายคลาดไม่เกิน 10% ของค่าจริง
+
+
+def load_dataset(path=DATASET_PATH, columns=FEATURE_COLUMNS):
+    data = np.genfromtxt(path, delimiter=',', names=True, usecols=columns)
+    return np.column_stack([data[c] for c in columns])
+
+
+def multivariate_data(dataset, target, start_index, end_index, history_size, target_size):
+    """ sliding window แบบเดียวกับใน notebook (label = target[i + target_size]) """
+    data, labels = [], []
+    start_index = start_index + history_size
+    if end_index is None:
+        end_index = len(dataset) - target_size
+    for i in range(start_index, end_index):
+        data.append(dataset[i - history_size:i])
+        labels.append(target[i + target_size])
+    return np.array(data, dtype=np.float32), np.array(labels, dtype=np.float32)
+
+
+def multihorizon_data(dataset, target, start_index, end_index, history_size, horizons):
+    """ เหมือน multivariate_data แต่ label เป็น vector: target[i + h] ของทุก h ใน horizons -> y shape (n, len(horizons)) """
+    data, labels = [], []
+    start_index = start_index + history_size
+    if end_index is None:
+        end_index = len(dataset) - max(horizons)
+    for i in range(start_index, end_index):
+        data.append(dataset[i - history_size:i])
+        labels.append([target[i + h, 0] for h in horizons])
+    return np.array(data, dtype=np.float32), np.array(labels, dtype=np.float32)
+
+
+def split_windows(scaler_inputs_path, scaler_target_path, path=DATASET_PATH,
+                  columns=FEATURE_COLUMNS, target_column=TARGET_COLUMN,
+                  window_size=WINDOW_SIZE, horizon=FORECAST_HORIZON, horizons=None):
+    """
+    คืน {'train' | 'val' | 'test': (X, y)} ที่ scale แล้วด้วย scaler ชุดเดียวกับที่ serving ใช้
+    horizons (เช่น (1, 2, 3, 5, 10, 15)) = label หลาย horizon ต่อ window แทน horizon เดียว
+    """
+    rows = load_dataset(path, columns)
+    target = rows[:, [columns.index(target_column)]]
+    scaler_inputs = joblib.load(scaler_inputs_path)
+    scaler_target = joblib.load(scaler_target_path)
+    X_scaled, y_scaled = scaler_inputs.transform(rows), scaler_target.transform(target)
+
+    n = len(rows)
+    bounds = {'train': (0, int(n * TRAIN_SPLIT)), 'val': (int(n * TRAIN_SPLIT), int(n * VAL_SPLIT)), 'test': (int(n * VAL_SPLIT), n)}
+    if horizons:
+        return {name: multihorizon_data(X_scaled[a:b], y_scaled[a:b], 0, None, window_size, horizons)
+                for name, (a, b) in bounds.items()}
+    return {name: multivariate_data(X_scaled[a:b], y_scaled[a:b], 0, None, window_size, horizon)
+            for name, (a, b) in bounds.items()}
+
+
+def predict_windows(runner, X):
+    """ ทำนายทีละ window ผ่าน runner (ทุก backend รับ (1, window, features)) -> (n, จำนวน output) """
+    return np.concatenate([np.asarray(runner.predict(x[np.newaxis])).reshape(1, -1) for x in X])
+
+
+def median_latency_ms(runner, X, runs=200):
+    """ latency p50 ของการทำนายทีละ 1 window (วนใช้ window จริงจาก X) """
+    samples = []
+    for i in range(runs):
+        x = X[i % len(X)][np.newaxis]
+        start = time.perf_counter()
+        runner.predict(x)
+        samples.append((time.perf_counter() - start) * 1000)
+    return float(np.median(samples))
+
+
+def regression_metrics(y_true_scaled, y_pred_scaled, scaler_target):
+    """ MAE / RMSE (vCores) + Threshold Accuracy (%) แบบเดียวกับ notebook """
+    actual = scaler_target.inverse_transform(np.asarray(y_true_scaled).reshape(-1, 1))
+    predicted = scaler_target.inverse_transform(np.asarray(y_pred_scaled).reshape(-1, 1))
+    errors = np.abs(actual - predicted)
+    return {
+        'mae': float(np.mean(errors)),
+        'rmse': float(np.sqrt(np.mean(errors ** 2))),
+        'threshold_acc': float(np.mean(errors <= actual * THRESHOLD_MARGIN) * 100),
+    }
+
+
+def horizon_metrics(y_true_scaled, y_pred_scaled, scaler_target, horizons):
+    """ regression_metrics แยกต่อ horizon -> {horizon: {'mae', 'rmse', 'threshold_acc'}} """
+    return {h: regression_metrics(y_true_scaled[:, i], y_pred_scaled[:, i], scaler_target)
+            for i, h in enumerate(horizons)}
@@ -0,0 +1,150 @@
+import os
+
+import numpy as np
+
+WARMUP_CALLS = 3
+BACKENDS = ('keras', 'numpy', 'onnx', 'tflite', 'tflite-dynamic', 'tflite-int8')
+# ไฟล์ที่ convert_model.py / quantize_model.py สร้างไว้ข้างโมเดลต้นฉบับ
+ARTIFACT_SUFFIX = {
+    'onnx': '.onnx',
+    'tflite': '.tflite',
+    'tflite-dynamic': '.dynamic.tflite',    # weight int8, คำนวณ float
+    'tflite-int8': '.int8.tflite',          # int8 ทั้งโมเดล (รวม input/output)
+}
+
+
+def warmup_runner(runner, calls=WARMUP_CALLS):
+    """ เรียก predict ด้วย window ศูนย์ตอนโหลด ให้ tick แรกไม่ต้องจ่ายค่า trace / จอง memory """
+    dummy = np.zeros(runner.input_shape, dtype=np.float32)
+    for _ in range(calls):
+        runner.predict(dummy)
+
+
+class KerasRunner:
+    """
+    ตัวเรียกโมเดล Keras สำหรับทำนายทีละ 1 window (แทน model.predict ทุก tick)
+    model.predict สร้าง data adapter + callbacks + step loop ใหม่ทุกครั้ง (หลาย ms) ทั้งที่คำนวณจริงไม่กี่ร้อย µs
+    ตัวนี้ trace forward pass เป็น tf.function ที่ input shape คงที่ (1, window, features) ครั้งเดียว
+    แล้ว warm-up ตอนโหลด -> tick แรกไม่ต้องจ่ายค่า trace/จอง memory
+    """
+
+    def __init__(self, model, warmup=WARMUP_CALLS):
+        import tensorflow as tf
+
+        self.model = model
+        _, window_size, n_features = model.input_shape
+        self.input_shape = (1, window_size, n_features)
+        self._tf = tf
+        self._to_tensor = tf.convert_to_tensor
+        self._mc_forward = {}       # samples -> tf.function ที่เปิด dropout (training=True)
+        self._forward = tf.function(
+            lambda x: model(x, training=False),
+            input_signature=[tf.TensorSpec(self.input_shape, tf.float32)],
+        )
+        warmup_runner(self, warmup)
+
+    @classmethod
+    def load(cls, path, warmup=WARMUP_CALLS):
+        from tensorflow.keras.models import load_model
+        return cls(load_model(path, compile=False), warmup=warmup)
+
+    def predict(self, X_input):
+        """ X_input: (1, window, features) -> ndarray (1, 1) เหมือน model.predict """
+        x = np.asarray(X_input, dtype=np.float32).reshape(self.input_shape)
+        return self._forward(self._to_tensor(x)).numpy()
+
+    def predict_mc(self, X_input, samples):
+        """ MC-dropout: window เดียวทำซ้ำเป็น batch (samples, window, features) รันครั้งเดียวแบบ training=True -> (samples, 1) """
+        tf = self._tf
+        if samples not in self._mc_forward:
+            self._mc_forward[samples] = tf.function(
+                lambda x: self.model(x, training=True),
+                input_signature=[tf.TensorSpec((samples,) + self.input_shape[1:], tf.float32)],
+            )
+        x = np.asarray(X_input, dtype=np.float32).reshape(self.input_shape)
+        return self._mc_forward[samples](self._to_tensor(np.repeat(x, samples, axis=0))).numpy()
+
+
+class OnnxRunner:
+    """ รันไฟล์ .onnx ด้วย onnxruntime (CPU, 1 thread: ทำนายทีละ 1 window ไม่คุ้มแตก thread) """
+
+    def __init__(self, path, warmup=WARMUP_CALLS):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.input_shape = tuple(d if isinstance(d, int) else 1 for d in model_input.shape)
+        warmup_runner(self, warmup)
+
+    def predict(self, X_input):
+        x = np.asarray(X_input, dtype=np.float32).reshape(self.input_shape)
+        return self.session.run(None, {self.input_name: x})[0]
+
+
+class TFLiteRunner:
+    """
+    รันไฟล์ .tflite ด้วย tflite_runtime (ถ้ามี) หรือ tf.lite โดยจอง tensor ครั้งเดียวตอนโหลด
+    ถ้า input/output เป็น int8 (full-int8) จะ quantize/dequantize ให้ -> ภายนอกยังรับ/คืน float เหมือนเดิม
+    """
+
+    def __init__(self, path, warmup=WARMUP_CALLS):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter
+
+        self.interpreter = Interpreter(model_path=path, num_threads=1)
+        self.interpreter.allocate_tensors()
+        model_input = self.interpreter.get_input_details()[0]
+        model_output = self.interpreter.get_output_details()[0]
+        self._input_index, self._output_index = model_input['index'], model_output['index']
+        self._input_dtype, self._output_dtype = model_input['dtype'], model_output['dtype']
+        self._input_quant, self._output_quant = model_input['quantization'], model_output['quantization']
+        self.input_shape = tuple(int(d) for d in model_input['shape'])
+        warmup_runner(self, warmup)
+
+    def predict(self, X_input):
+        x = np.asarray(X_input, dtype=np.float32).reshape(self.input_shape)
+        if self._input_dtype != np.float32:
+            scale, zero_point = self._input_quant
+            info = np.iinfo(self._input_dtype)
+            x = np.clip(np.round(x / scale + zero_point), info.min, info.max).astype(self._input_dtype)
+        self.interpreter.set_tensor(self._input_index, x)
+        self.interpreter.invoke()
+        out = self.interpreter.get_tensor(self._output_index)
+        if self._output_dtype != np.float32:
+            scale, zero_point = self._output_quant
+            return (out.astype(np.float32) - zero_point) * scale
+        return out.copy()
+
+
+def artifact_path(path, backend):
+    """ path ของไฟล์ที่ backend นั้นใช้ (onnx/tflite = ไฟล์ที่ convert แล้ว ชื่อเดียวกันต่างนามสกุล) """
+    suffix = ARTIFACT_SUFFIX.get(backend)
+    return path if suffix is None else os.path.splitext(path)[0] + suffix
+
+
+def load_runner(path, backend='keras'):
+    """
+    โหลดโมเดลตาม backend (ทุกตัวมี .input_shape และ .predict(X_input) -> (1, 1))
+    'keras' = TensorFlow (KerasRunner) | 'numpy' = NumPy ล้วน | 'onnx' / 'tflite' = ไฟล์จาก convert_model.py
+    'tflite-dynamic' / 'tflite-int8' = ไฟล์ quantized ที่ผ่าน gate ของ quantize_model.py
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown model backend '{backend}' (expected one of {BACKENDS})")
+    path = artifact_path(path, backend)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{path} not found" + (" (run convert_model.py / quantize_model.py first)" if backend in ARTIFACT_SUFFIX else ""))
+    if backend == 'keras':
+        return KerasRunner.load(path)
+    if backend == 'numpy':
+        from numpy_lstm import NumpyLSTMModel
+        return NumpyLSTMModel.load(path)
+    if backend == 'onnx':
+        return OnnxRunner(path)
+    return TFLiteRunner(path)       # tflite / tflite-dynamic / tflite-int8
@@ -0,0 +1,281 @@
+import io
+import json
+import re
+import zipfile
+
+import numpy as np
+
+
+def _sigmoid(x):
+    return 1.0 / (1.0 + np.exp(-x))
+
+
+def _hard_sigmoid(x):
+    return np.clip(x / 6.0 + 0.5, 0.0, 1.0)
+
+
+ACTIVATIONS = {
+    'tanh': np.tanh,
+    'sigmoid': _sigmoid,
+    'hard_sigmoid': _hard_sigmoid,
+    'relu': lambda x: np.maximum(x, 0.0),
+    'linear': lambda x: x,
+}
+
+
+# ==========================================
+# 🧱 LAYERS (forward pass ตอน inference เท่านั้น)
+# ==========================================
+class LSTMLayer:
+    """ LSTM ของ Keras (gate เรียง i, f, c, o) """
+
+    def __init__(self, kernel, recurrent_kernel, bias, return_sequences,
+                 activation='tanh', recurrent_activation='sigmoid'):
+        self.kernel = np.ascontiguousarray(kernel, dtype=np.float32)
+        self.recurrent_kernel = np.ascontiguousarray(recurrent_kernel, dtype=np.float32)
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.units = self.recurrent_kernel.shape[0]
+        self.return_sequences = return_sequences
+        self.activation = ACTIVATIONS[activation]
+        self.recurrent_activation = ACTIVATIONS[recurrent_activation]
+
+    def __call__(self, x):
+        batch, steps, _ = x.shape
+        u = self.units
+        # x @ W ของทุก timestep ทำทีเดียว เหลือแค่ h @ U ในลูป
+        x_proj = (x @ self.kernel) + self.bias
+        h = np.zeros((batch, u), dtype=np.float32)
+        c = np.zeros((batch, u), dtype=np.float32)
+        outputs = np.empty((batch, steps, u), dtype=np.float32) if self.return_sequences else None
+        for t in range(steps):
+            z = x_proj[:, t] + h @ self.recurrent_kernel
+            i = self.recurrent_activation(z[:, :u])
+            f = self.recurrent_activation(z[:, u:2 * u])
+            g = self.activation(z[:, 2 * u:3 * u])
+            o = self.recurrent_activation(z[:, 3 * u:])
+            c = f * c + i * g
+            h = o * self.activation(c)
+            if outputs is not None:
+                outputs[:, t] = h
+        return outputs if outputs is not None else h
+
+
+class GRULayer:
+    """ GRU ของ Keras (gate เรียง z, r, h; reset_after=True -> bias มี 2 แถว: input / recurrent) """
+
+    def __init__(self, kernel, recurrent_kernel, bias, return_sequences,
+                 activation='tanh', recurrent_activation='sigmoid', reset_after=True):
+        self.kernel = np.ascontiguousarray(kernel, dtype=np.float32)
+        self.recurrent_kernel = np.ascontiguousarray(recurrent_kernel, dtype=np.float32)
+        bias = np.asarray(bias, dtype=np.float32).reshape(-1, self.kernel.shape[1])
+        self.input_bias = bias[0]
+        self.recurrent_bias = bias[1] if reset_after else np.zeros_like(bias[0])
+        self.reset_after = reset_after
+        self.units = self.recurrent_kernel.shape[0]
+        self.return_sequences = return_sequences
+        self.activation = ACTIVATIONS[activation]
+        self.recurrent_activation = ACTIVATIONS[recurrent_activation]
+
+    def __call__(self, x):
+        batch, steps, _ = x.shape
+        u = self.units
+        x_proj = (x @ self.kernel) + self.input_bias
+        h = np.zeros((batch, u), dtype=np.float32)
+        outputs = np.empty((batch, steps, u), dtype=np.float32) if self.return_sequences else None
+        for t in range(steps):
+            xz, xr, xh = x_proj[:, t, :u], x_proj[:, t, u:2 * u], x_proj[:, t, 2 * u:]
+            if self.reset_after:
+                h_proj = h @ self.recurrent_kernel + self.recurrent_bias
+                z = self.recurrent_activation(xz + h_proj[:, :u])
+                r = self.recurrent_activation(xr + h_proj[:, u:2 * u])
+                hh = self.activation(xh + r * h_proj[:, 2 * u:])
+            else:
+                z = self.recurrent_activation(xz + h @ self.recurrent_kernel[:, :u])
+                r = self.recurrent_activation(xr + h @ self.recurrent_kernel[:, u:2 * u])
+                hh = self.activation(xh + (r * h) @ self.recurrent_kernel[:, 2 * u:])
+            h = z * h + (1 - z) * hh
+            if outputs is not None:
+                outputs[:, t] = h
+        return outputs if outputs is not None else h
+
+
+class Conv1DLayer:
+    """ Conv1D (strides / dilation = 1) รองรับ padding valid / same / causal """
+
+    def __init__(self, kernel, bias=None, padding='valid', activation='linear'):
+        self.kernel = np.asarray(kernel, dtype=np.float32)      # (kernel_size, in, filters)
+        self.bias = None if bias is None else np.asarray(bias, dtype=np.float32)
+        self.padding = padding
+        self.activation = ACTIVATIONS[activation]
+
+    def __call__(self, x):
+        k = self.kernel.shape[0]
+        if self.padding == 'causal':
+            x = np.pad(x, ((0, 0), (k - 1, 0), (0, 0)))
+        elif self.padding == 'same':
+            x = np.pad(x, ((0, 0), ((k - 1) // 2, k // 2), (0, 0)))
+        steps = x.shape[1] - k + 1
+        out = sum(x[:, j:j + steps] @ self.kernel[j] for j in range(k))
+        if self.bias is not None:
+            out = out + self.bias
+        return self.activation(out)
+
+
+class DenseLayer:
+    def __init__(self, kernel, bias, activation='linear'):
+        self.kernel = np.asarray(kernel, dtype=np.float32)
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.activation = ACTIVATIONS[activation]
+
+    def __call__(self, x):
+        return self.activation(x @ self.kernel + self.bias)
+
+
+class DropoutLayer:
+    """ ปกติไม่ทำอะไร (inference) | sample() สุ่มปิด unit แบบเดียวกับ Keras ตอน training=True (ใช้กับ MC-dropout) """
+
+    def __init__(self, rate):
+        self.rate = rate
+
+    def __call__(self, x):
+        return x
+
+    def sample(self, x, rng):
+        keep = rng.random(x.shape, dtype=np.float32) >= self.rate
+        return np.where(keep, x / (1.0 - self.rate), 0.0).astype(np.float32)
+
+
+# ==========================================
+# 📦 LOADERS (.keras ของ Keras 3 / .h5 แบบ legacy)
+# ==========================================
+def _snake_case(class_name):
+    """ แปลงชื่อ class แบบเดียวกับ Keras ตอนตั้งชื่อ group ใน model.weights.h5 (LSTM -> lstm) """
+    name = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", class_name)
+    return re.sub(r"([a-z])([A-Z])", r"\1_\2", name).lower()
+
+
+def _layer_configs(model_config):
+    if model_config['class_name'] != 'Sequential':
+        raise ValueError(f"only Sequential models are supported, got {model_config['class_name']}")
+    return [l for l in model_config['config']['layers'] if l['class_name'] != 'InputLayer']
+
+
+def _input_shape(model_config):
+    for layer in model_config['config']['layers']:
+        cfg = layer['config']
+        shape = cfg.get('batch_shape') or cfg.get('batch_input_shape')
+        if shape:
+            return tuple(shape[1:])
+    return None
+
+
+def _build_layer(layer, weights):
+    cls, cfg = layer['class_name'], layer['config']
+    if cls == 'LSTM':
+        return LSTMLayer(*weights, return_sequences=cfg['return_sequences'],
+                         activation=cfg['activation'], recurrent_activation=cfg['recurrent_activation'])
+    if cls == 'GRU':
+        return GRULayer(*weights, return_sequences=cfg['return_sequences'],
+                        activation=cfg['activation'], recurrent_activation=cfg['recurrent_activation'],
+                        reset_after=cfg.get('reset_after', True))
+    if cls == 'Conv1D':
+        if cfg.get('strides', [1])[0] != 1 or cfg.get('dilation_rate', [1])[0] != 1:
+            raise ValueError("Conv1D with strides/dilation != 1 is not supported")
+        return Conv1DLayer(*weights, padding=cfg['padding'], activation=cfg['activation'])
+    if cls == 'Dense':
+        return DenseLayer(*weights, activation=cfg['activation'])
+    if cls == 'GlobalAveragePooling1D':
+        return lambda x: x.mean(axis=1)
+    if cls == 'Flatten':
+        return lambda x: x.reshape(x.shape[0], -1)
+    if cls == 'Dropout':
+        return DropoutLayer(cfg['rate'])
+    raise ValueError(f"unsupported layer: {cls}")
+
+
+def _read_keras_v3(path, h5py):
+    """ .keras = zip ของ config.json + model.weights.h5 (layers/<ชื่อ class>_<ลำดับ>/...) """
+    with zipfile.ZipFile(path) as archive:
+        model_config = json.loads(archive.read('config.json'))
+        weights_file = h5py.File(io.BytesIO(archive.read('model.weights.h5')), 'r')
+
+    layers, seen = [], {}
+    with weights_file:
+        for layer in _layer_configs(model_config):
+            base = _snake_case(layer['class_name'])
+            key = base if base not in seen else f"{base}_{seen[base]}"
+            seen[base] = seen.get(base, 0) + 1
+            group = weights_file['layers'].get(key, {})
+            if 'cell' in group:
+                group = group['cell']
+            n_vars = len(group['vars']) if 'vars' in group else 0
+            layers.append([group['vars'][str(i)][()] for i in range(n_vars)])
+    return model_config, layers
+
+
+_WEIGHT_ORDER = ('kernel', 'recurrent_kernel', 'bias')     # ลำดับเดียวกับ vars/0, 1, 2 ของ Keras 3
+
+
+def _read_legacy_h5(path, h5py):
+    """ .h5 แบบ legacy (model_weights/<ชื่อ layer>/.../kernel, recurrent_kernel, bias) """
+    with h5py.File(path, 'r') as f:
+        attr = f.attrs['model_config']
+        model_config = json.loads(attr.decode() if isinstance(attr, bytes) else attr)
+        layers = []
+        for layer in _layer_configs(model_config):
+            found, name = {}, layer['config']['name']
+            if name in f['model_weights']:
+                f['model_weights'][name].visititems(
+                    lambda key, obj: found.__setitem__(key.rsplit('/', 1)[-1].split(':')[0], obj[()])
+                    if isinstance(obj, h5py.Dataset) else None)
+            layers.append([found[w] for w in _WEIGHT_ORDER if w in found])
+    return model_config, layers
+
+
+def read_weights(path):
+    """ คืน (model_config, weight ต่อ layer) จากไฟล์ .keras / .h5 """
+    import h5py
+    reader = _read_keras_v3 if zipfile.is_zipfile(path) else _read_legacy_h5
+    return reader(path, h5py)
+
+
+class NumpyLSTMModel:
+    """
+    รันโมเดล Sequential (LSTM / Dropout / Dense) ที่เทรนใน Multi_Variable_Old_UnC.ipynb ด้วย NumPy ล้วน
+    รวมถึง student จาก distill_model.py (GRU / Conv1D / GlobalAveragePooling1D / Flatten)
+    อ่าน weight จากไฟล์ .keras / .h5 โดยตรง (ใช้แค่ h5py) ไม่ต้อง import TensorFlow ตอน serving
+    predict() รับ/คืน shape เดียวกับ KerasRunner.predict
+    """
+
+    def __init__(self, layers, input_shape=None):
+        self.layers = [l for l in layers if l is not None]
+        self._deterministic = [l for l in self.layers if not isinstance(l, DropoutLayer)]     # inference ข้าม dropout ไปเลย
+        self.input_shape = (1,) + tuple(input_shape) if input_shape else None
+
+    @classmethod
+    def from_config(cls, model_config, layer_weights):
+        """ model_config = config ของ Keras Sequential, layer_weights = list ของ weight ต่อ layer (ไม่นับ InputLayer) """
+        layers = [_build_layer(layer, weights) for layer, weights in zip(_layer_configs(model_config), layer_weights)]
+        return cls(layers, _input_shape(model_config))
+
+    @classmethod
+    def load(cls, path):
+        return cls.from_config(*read_weights(path))
+
+    def predict(self, X_input):
+        """ X_input: (batch, window, features) -> ndarray (batch, 1) """
+        x = np.asarray(X_input, dtype=np.float32)
+        if x.ndim == 2:
+            x = x[np.newaxis]
+        for layer in self._deterministic:
+            x = layer(x)
+        return x
+
+    def predict_mc(self, X_input, samples, rng=None):
+        """ MC-dropout: ทำซ้ำ window เป็น batch (samples, window, features) แล้วรันรอบเดียวโดยเปิด dropout -> (samples, 1) """
+        rng = rng or np.random.default_rng()
+        x = np.asarray(X_input, dtype=np.float32).reshape((1,) + np.shape(X_input)[-2:])
+        x = np.repeat(x, samples, axis=0)
+        for layer in self.layers:
+            x = layer.sample(x, rng) if isinstance(layer, DropoutLayer) else layer(x)
+        return x
@@ -0,0 +1,178 @@
+import io
+import json
+import os
+import tempfile
+import zipfile
+
+import h5py
+import numpy as np
+
+from numpy_lstm import NumpyLSTMModel
+
+
+def lstm_layer(units, return_sequences, name):
+    return {'class_name': 'LSTM', 'config': {
+        'name': name, 'units': units, 'return_sequences': return_sequences,
+        'activation': 'tanh', 'recurrent_activation': 'sigmoid'}}
+
+
+def sequential_config(window, features):
+    """ โครงเดียวกับ Multi_Variable_Old_UnC.ipynb: LSTM -> Dropout -> LSTM -> Dropout -> Dense(1) """
+    return {'class_name': 'Sequential', 'config': {'name': 'sequential', 'layers': [
+        {'class_name': 'InputLayer', 'config': {'batch_shape': [None, window, features], 'name': 'input_layer'}},
+        lstm_layer(8, True, 'lstm'),
+        {'class_name': 'Dropout', 'config': {'name': 'dropout', 'rate': 0.2}},
+        lstm_layer(4, False, 'lstm_1'),
+        {'class_name': 'Dropout', 'config': {'name': 'dropout_1', 'rate': 0.2}},
+        {'class_name': 'Dense', 'config': {'name': 'dense', 'units': 1, 'activation': 'linear'}},
+    ]}}
+
+
+def random_weights(features, seed=0):
+    rng = np.random.default_rng(seed)
+    w = lambda *shape: rng.normal(0, 0.5, shape).astype(np.float32)
+    return {
+        'lstm': [w(features, 32), w(8, 32), w(32)],
+        'lstm_1': [w(8, 16), w(4, 16), w(16)],
+        'dense': [w(4, 1), w(1)],
+    }
+
+
+def write_keras_v3(path, config, weights):
+    """ จำลองไฟล์ .keras ของ Keras 3 (zip: config.json + model.weights.h5) """
+    buf = io.BytesIO()
+    with h5py.File(buf, 'w') as f:
+        for layer, values in weights.items():
+            group = f.create_group(f"layers/{layer}/cell/vars" if layer.startswith('lstm') else f"layers/{layer}/vars")
+            for i, v in enumerate(values):
+                group[str(i)] = v
+        f.create_group("layers/dropout/vars")
+        f.create_group("layers/dropout_1/vars")
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('config.json', json.dumps(config))
+        archive.writestr('model.weights.h5', buf.getvalue())
+
+
+def write_legacy_h5(path, config, weights):
+    """ จำลองไฟล์ .h5 แบบ legacy (model_weights/<layer>/<layer>/lstm_cell/kernel:0) """
+    names = ('kernel:0', 'recurrent_kernel:0', 'bias:0')
+    with h5py.File(path, 'w') as f:
+        f.attrs['model_config'] = json.dumps(config)
+        for layer, values in weights.items():
+            prefix = f"model_weights/{layer}/{layer}" + ("/lstm_cell" if layer.startswith('lstm') else "")
+            for name, v in zip(names if len(values) == 3 else ('kernel:0', 'bias:0'), values):
+                f[f"{prefix}/{name}"] = v
+
+
+def reference_forward(x, weights):
+    """ สมการ LSTM ของ Keras แบบตรงตัว (ทีละ sample ทีละ timestep) ไว้เทียบผล """
+    sigmoid = lambda v: 1 / (1 + np.exp(-v))
+
+    def lstm(seq, kernel, recurrent, bias, return_sequences):
+        u = recurrent.shape[0]
+        h, c, outs = np.zeros(u), np.zeros(u), []
+        for x_t in seq:
+            z = x_t @ kernel + h @ recurrent + bias
+            i, f, g, o = sigmoid(z[:u]), sigmoid(z[u:2*u]), np.tanh(z[2*u:3*u]), sigmoid(z[3*u:])
+            c = f * c + i * g
+            h = o * np.tanh(c)
+            outs.append(h)
+        return np.array(outs) if return_sequences else h
+
+    out = []
+    for sample in x.astype(np.float64):
+        seq = lstm(sample, *weights['lstm'], True)
+        h = lstm(seq, *weights['lstm_1'], False)
+        out.append(h @ weights['dense'][0] + weights['dense'][1])
+    return np.array(out)
+
+
+def student_config(window, features):
+    """ student แบบ distill_model.py: Conv1D(causal) -> GRU -> Dense(1) """
+    return {'class_name': 'Sequential', 'config': {'name': 'student', 'layers': [
+        {'class_name': 'InputLayer', 'config': {'batch_shape': [None, window, features], 'name': 'input_layer'}},
+        {'class_name': 'Conv1D', 'config': {'name': 'conv1d', 'filters': 4, 'kernel_size': [3], 'strides': [1],
+                                            'dilation_rate': [1], 'padding': 'causal', 'activation': 'relu'}},
+        {'class_name': 'GRU', 'config': {'name': 'gru', 'units': 3, 'return_sequences': False, 'reset_after': True,
+                                         'activation': 'tanh', 'recurrent_activation': 'sigmoid'}},
+        {'class_name': 'Dense', 'config': {'name': 'dense', 'units': 1, 'activation': 'linear'}},
+    ]}}
+
+
+def student_reference(x, conv, gru, dense):
+    """ Conv1D causal + GRU (reset_after) แบบตรงตัว """
+    sigmoid = lambda v: 1 / (1 + np.exp(-v))
+    kernel, bias = conv
+    W, U, b = gru
+    out = []
+    for sample in x.astype(np.float64):
+        padded = np.vstack([np.zeros((2, sample.shape[1])), sample])
+        feats = np.maximum([sum(padded[t + j] @ kernel[j] for j in range(3)) + bias for t in range(len(sample))], 0)
+        h = np.zeros(3)
+        for x_t in feats:
+            xp, hp = x_t @ W + b[0], h @ U + b[1]
+            z, r = sigmoid(xp[:3] + hp[:3]), sigmoid(xp[3:6] + hp[3:6])
+            h = z * h + (1 - z) * np.tanh(xp[6:] + r * hp[6:])
+        out.append(h @ dense[0] + dense[1])
+    return np.array(out)
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ NumpyLSTMModel (Unit Testing)\n" + "="*50)
+
+    config, weights = sequential_config(30, 5), random_weights(5)
+    x = np.random.default_rng(1).random((3, 30, 5)).astype(np.float32)
+    expected = reference_forward(x, weights)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print("▶️ TEST 1: โหลด .keras (Keras 3) แล้วผลตรงกับสมการ LSTM")
+        path = os.path.join(tmp, 'model.keras')
+        write_keras_v3(path, config, weights)
+        model = NumpyLSTMModel.load(path)
+        pred = model.predict(x)
+        print(f"ผลลัพธ์ 🤖: input={model.input_shape} max|diff|={np.max(np.abs(pred - expected)):.2e}")
+        assert model.input_shape == (1, 30, 5) and pred.shape == (3, 1)
+        assert np.allclose(pred, expected, atol=1e-5)
+        print("ผลลัพธ์ ✅\n")
+
+        print("▶️ TEST 2: โหลด .h5 แบบ legacy ได้ผลเดียวกัน")
+        path = os.path.join(tmp, 'model.h5')
+        write_legacy_h5(path, config, weights)
+        pred_h5 = NumpyLSTMModel.load(path).predict(x[:1])
+        assert np.allclose(pred_h5, expected[:1], atol=1e-5)
+        print("ผลลัพธ์ ✅\n")
+
+        print("▶️ TEST 3: student (Conv1D causal + GRU) จาก distill_model.py")
+        rng = np.random.default_rng(2)
+        conv = [rng.normal(0, 0.5, (3, 5, 4)).astype(np.float32), rng.normal(0, 0.5, 4).astype(np.float32)]
+        gru = [rng.normal(0, 0.5, (4, 9)).astype(np.float32), rng.normal(0, 0.5, (3, 9)).astype(np.float32),
+               rng.normal(0, 0.5, (2, 9)).astype(np.float32)]
+        dense = [rng.normal(0, 0.5, (3, 1)).astype(np.float32), rng.normal(0, 0.5, 1).astype(np.float32)]
+        buf = io.BytesIO()
+        with h5py.File(buf, 'w') as f:
+            for i, v in enumerate(conv):
+                f[f"layers/conv1d/vars/{i}"] = v
+            for i, v in enumerate(gru):
+                f[f"layers/gru/cell/vars/{i}"] = v
+            for i, v in enumerate(dense):
+                f[f"layers/dense/vars/{i}"] = v
+        path = os.path.join(tmp, 'student.keras')
+        with zipfile.ZipFile(path, 'w') as archive:
+            archive.writestr('config.json', json.dumps(student_config(30, 5)))
+            archive.writestr('model.weights.h5', buf.getvalue())
+        pred = NumpyLSTMModel.load(path).predict(x)
+        assert np.allclose(pred, student_reference(x, conv, gru, dense), atol=1e-5)
+        print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: โมเดลจริงใน repo โหลดได้ครบทุก layer")
+    model = NumpyLSTMModel.load('best_single_var_model.keras')
+    pred = model.predict(np.zeros(model.input_shape, dtype=np.float32))
+    print(f"ผลลัพธ์ 🤖: {[type(l).__name__ for l in model.layers]} -> {pred.shape}")
+    assert model.input_shape == (1, 30, 1) and pred.shape == (1, 1) and np.isfinite(pred).all()
+    print()
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
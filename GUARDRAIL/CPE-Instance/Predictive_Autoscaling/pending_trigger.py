@@ -0,0 +1,49 @@
+import threading
+import time
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+PENDING_DEBOUNCE = 0.5   # วินาที: หลัง Pod แรกติด Unschedulable รออีกนิดให้ทั้ง burst (Deployment scale ทีละหลาย replica) เข้ามาก่อนค่อยปลุก
+
+
+class PendingTrigger:
+    """
+    ตัวปลุก control loop เมื่อมี Pod ใหม่ติด Unschedulable (ต่อกับ ClusterInformer(on_unschedulable=trigger.notify))
+    ไม่ต้องรอ tick 60 วิถัดไปถึงจะเข้า Guardrail 2 (Reactive Emergency)
+    - notify() เรียกจาก watch thread, wait() เรียกจาก main loop (ส่งเป็น wake ของ FixedRateScheduler.wait)
+    - debounce: event ที่ตามมาภายใน PENDING_DEBOUNCE ถูกรวมเป็นการปลุกครั้งเดียว
+    """
+
+    def __init__(self, debounce=PENDING_DEBOUNCE, clock=time.monotonic, sleep=time.sleep):
+        self.debounce = debounce
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._count = 0
+        self._first = None
+        self.wakeups = 0
+
+    def notify(self, count=1):
+        with self._lock:
+            self._count += count
+            if self._first is None:
+                self._first = self.clock()
+            self._event.set()
+
+    def wait(self, timeout):
+        """ รอไม่เกิน timeout วินาที คืนจำนวน Pod ที่เพิ่งติด Unschedulable ใน burst นี้ (0 = ไม่มี / หมดเวลา) """
+        started = self.clock()
+        if not self._event.wait(timeout):
+            return 0
+        with self._lock:
+            first = self._first
+        remaining = min(first + self.debounce, started + timeout) - self.clock()
+        if remaining > 0:
+            self.sleep(remaining)
+        with self._lock:
+            count, self._count, self._first = self._count, 0, None
+            self._event.clear()
+        self.wakeups += bool(count)
+        return count
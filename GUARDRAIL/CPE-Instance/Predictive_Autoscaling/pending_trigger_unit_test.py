@@ -0,0 +1,80 @@
+import threading
+import time
+
+from DecisionEngineV2 import DecisionEngine
+from cluster_informer import ClusterInformer
+from cluster_informer_unit_test import FakeWatchSource, event
+from cluster_snapshot_unit_test import make_node, make_pod
+from loop_scheduler import FixedRateScheduler
+from pending_trigger import PendingTrigger
+
+
+def unschedulable_pod(name):
+    pod = make_pod(name, None, phase='Pending', containers=[{'cpu': '2'}])
+    pod['status']['conditions'] = [{'type': 'PodScheduled', 'status': 'False', 'reason': 'Unschedulable'}]
+    return pod
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ Pending Pod Fast Path (Unit Testing)\n" + "="*50)
+
+    print("▶️ TEST 1: Informer แจ้งเฉพาะ Pod ที่เพิ่งติด Unschedulable (ไม่ใช่ Pending ชั่วครู่ / event ซ้ำ)")
+    notified = []
+    source = FakeWatchSource([make_node('w1')], [])
+    informer = ClusterInformer(source, namespace='default', on_unschedulable=notified.append)
+    informer.sync_once('nodes')
+    source.streams['pods'].append([
+        event('ADDED', make_pod('fresh', None, phase='Pending'), '101'),     # ยังไม่ถูก schedule -> ปกติ
+        event('MODIFIED', unschedulable_pod('a'), '102'),
+        event('MODIFIED', unschedulable_pod('a'), '103'),                     # scheduler retry -> ตัวเดิม
+        event('ADDED', unschedulable_pod('b'), '104'),
+    ])
+    informer.sync_once('pods')
+    print(f"ผลลัพธ์ 🤖: notify {notified} | pending {informer.snapshot().pending}")
+    assert notified == [1, 1] and informer.snapshot().pending == 3
+    source.streams['pods'].append([event('DELETED', unschedulable_pod('a'), '105'), event('ADDED', unschedulable_pod('a'), '106')])
+    informer.sync_once('pods')
+    assert notified == [1, 1, 1]                                               # ลบแล้วกลับมาใหม่ = ตัวใหม่
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: burst หลาย Pod ภายใน debounce -> ปลุกครั้งเดียว")
+    trigger = PendingTrigger(debounce=0.1)
+    assert trigger.wait(0.05) == 0
+    for i in range(5):
+        threading.Timer(0.01 * i, trigger.notify).start()
+    started = time.monotonic()
+    count = trigger.wait(5.0)
+    elapsed = time.monotonic() - started
+    print(f"ผลลัพธ์ 🤖: ปลุก 1 ครั้ง รวม {count} Pod หลัง {elapsed * 1000:.0f} ms")
+    assert count == 5 and 0.08 < elapsed < 0.5 and trigger.wait(0.05) == 0
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: ปลุก FixedRateScheduler ก่อน deadline โดย grid 1 นาทีไม่เลื่อน")
+    scheduler = FixedRateScheduler(0.5)
+    first = scheduler.wait(wake=trigger.wait)
+    threading.Timer(0.05, trigger.notify, args=(2,)).start()
+    woken = scheduler.wait(wake=trigger.wait)
+    woken_at = time.monotonic() - first.deadline
+    regular = scheduler.wait(wake=trigger.wait)
+    regular_at = time.monotonic() - first.deadline
+    print(f"ผลลัพธ์ 🤖: woken {woken.woken} Pod ที่ {woken_at * 1000:.0f} ms | tick ปกติ #{regular.index} ที่ {regular_at * 1000:.0f} ms")
+    assert woken.woken == 2 and woken_at < 0.3 and woken.deadline == regular.deadline
+    assert regular.index == 1 and regular.woken == 0 and 0.5 <= regular_at < 0.6 and scheduler.ticks == 2
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: decide_reactive ผ่านด่าน cooldown / in-flight เดียวกับ decide()")
+    engine = DecisionEngine(cores_per_node=4.0, max_workers=2, min_workers=1)
+    action, reason = engine.decide_reactive(current_workers=1, pending_pods=3)
+    print(f"ผลลัพธ์ 🤖: {action} | {reason}")
+    assert action == "SCALE_OUT" and "Fast Path" in reason
+    action, reason = engine.decide(predicted_cores=1.0, current_workers=1, pending_pods=3, current_cpu_usage=50.0, current_cpu_req=3.5)
+    assert action == "DO_NOTHING" and "Cooldown" in reason              # tick ปกติถัดมาไม่สั่งซ้ำ
+    assert engine.decide_reactive(current_workers=1, pending_pods=3, in_flight_workers=1)[0] == "DO_NOTHING"
+    assert engine.decide_reactive(current_workers=1, pending_pods=0)[0] == "DO_NOTHING"
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,68 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+CACHE_TOLERANCE = 1e-4     # หน่วย scaled (0-1): window ที่ต่างกันไม่เกินนี้ถือว่าเป็น window เดียวกัน
+CACHE_MAX_ENTRIES = 256    # LRU: เกินนี้ทิ้ง window ที่ไม่ได้ใช้นานที่สุด
+
+
+class PredictionCache:
+    """
+    ห่อ runner (model_runner.py / NumpyLSTMModel) ด้วย cache ผลทำนาย ใช้ interface .predict(X) เดิม
+    - key = digest ของ window ที่ปัดเป็นจำนวนเต็มตาม tolerance (ช่วงนิ่ง เช่น COOLDOWN HOLD / กลางคืน จะได้ key เดิม)
+    - tolerance = 0 คือ window ต้องเหมือนกันทุก byte
+    - นับ hits / misses ไว้ให้ดูว่าช่วงนิ่งประหยัดการรันโมเดลไปกี่ครั้ง
+    """
+
+    def __init__(self, runner, tolerance=CACHE_TOLERANCE, max_entries=CACHE_MAX_ENTRIES):
+        self.runner = runner
+        self.tolerance = tolerance
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def digest(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        if self.tolerance > 0:
+            X = np.rint(X / self.tolerance).astype(np.int64)
+        return hashlib.blake2b(repr(X.shape).encode() + X.tobytes(), digest_size=16).digest()
+
+    def predict(self, X):
+        key = self.digest(X)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached.copy()
+
+        self.misses += 1
+        result = np.asarray(self.runner.predict(X))
+        self._entries[key] = result.copy()
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'hit_rate': self.hit_rate}
+
+    def __getattr__(self, name):
+        # ส่งต่อ attribute อื่น (.model / .input_shape ฯลฯ) ไปที่ runner จริง
+        if name == 'runner':
+            raise AttributeError(name)
+        return getattr(self.runner, name)
@@ -0,0 +1,67 @@
+import numpy as np
+
+from prediction_cache import PredictionCache
+
+
+class CountingRunner:
+    """ runner จำลอง: ค่าทำนาย = ค่าเฉลี่ยของ window และนับจำนวนครั้งที่ถูกเรียกจริง """
+
+    def __init__(self):
+        self.calls = 0
+        self.input_shape = (None, 30, 5)
+
+    def predict(self, X):
+        self.calls += 1
+        return np.array([[float(np.mean(X))]], dtype=np.float32)
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ PredictionCache (Unit Testing)\n" + "="*50)
+    rng = np.random.default_rng(0)
+    flat = np.full((1, 30, 5), 0.5, dtype=np.float32)
+
+    print("▶️ TEST 1: window นิ่ง (COOLDOWN HOLD) -> รันโมเดลครั้งเดียว ผลลัพธ์เท่าเดิมทุก tick")
+    runner = CountingRunner()
+    cache = PredictionCache(runner)
+    results = [cache.predict(flat.copy()) for _ in range(15)]
+    print(f"ผลลัพธ์ 🤖: {cache.stats()} | โมเดลถูกเรียก {runner.calls} ครั้ง")
+    assert runner.calls == 1 and cache.hits == 14 and cache.misses == 1
+    assert all(np.array_equal(r, results[0]) for r in results)
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 2: ต่างกันน้อยกว่า tolerance = hit, มากกว่า = miss")
+    jitter = flat + rng.uniform(-1e-6, 1e-6, size=flat.shape).astype(np.float32)
+    cache.predict(jitter)
+    assert runner.calls == 1
+    moved = flat.copy()
+    moved[0, -1, 0] += 0.01           # pod ใหม่ขอ CPU เพิ่ม -> ต้องทำนายใหม่
+    cache.predict(moved)
+    print(f"ผลลัพธ์ 🤖: {cache.stats()}")
+    assert runner.calls == 2
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 3: LRU จำกัดขนาด และ tolerance=0 ต้องเหมือนกันทุก byte")
+    runner = CountingRunner()
+    cache = PredictionCache(runner, tolerance=0, max_entries=3)
+    windows = [rng.uniform(size=(1, 30, 5)).astype(np.float32) for _ in range(4)]
+    for w in windows:
+        cache.predict(w)
+    cache.predict(windows[0])          # ถูกทิ้งไปแล้ว -> miss
+    cache.predict(windows[3])          # ยังอยู่ -> hit
+    cache.predict(jitter)
+    print(f"ผลลัพธ์ 🤖: {cache.stats()}")
+    assert len(cache) == 3 and runner.calls == 6 and cache.hits == 1
+    print("ผลลัพธ์ ✅\n")
+
+    print("▶️ TEST 4: แก้ค่าที่คืนไปแล้วไม่กระทบ cache + attribute อื่นส่งต่อไป runner")
+    out = cache.predict(windows[3])
+    out[0, 0] = -1
+    assert cache.predict(windows[3])[0, 0] != -1
+    assert cache.input_shape == (None, 30, 5)
+    print("ผลลัพธ์ ✅\n")
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
@@ -0,0 +1,162 @@
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+from async_collector import CollectedSample
+from cluster_snapshot import POD_NAMESPACE, ClusterSnapshot
+from minute_aggregator import AGGREGATE_FEATURES, MINUTE_STEP, STATS, SUB_MINUTE_INTERVAL
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+PROMETHEUS_URL = "http://10.35.29.108:31102"
+WORKER_NODE_REGEX = "aj-aung-k8s-worker1|aj-aung-k8s-worker2"
+QUERY_TIMEOUT = 3.0
+BACKFILL_STEP = 60      # วินาที: ตรงกับ step="60s" ของ NewPromQL.py (1 แถว = 1 นาที)
+
+# PromQL ชุดเดียวกับ NewPromQL.py ที่ใช้สร้าง training_data_prometheus.csv (เรียงตามลำดับ feature ของโมเดล)
+FEATURE_QUERIES = {
+    "cluster_cpu_req": f'sum(kube_pod_container_resource_requests{{node=~"{WORKER_NODE_REGEX}", resource="cpu"}})',
+    "cluster_cpu_cap": f'sum(kube_node_status_capacity{{node=~"{WORKER_NODE_REGEX}", resource="cpu"}})',
+    "cluster_mem_req": f'sum(kube_pod_container_resource_requests{{node=~"{WORKER_NODE_REGEX}", resource="memory"}}) / (1024*1024*1024)',
+    "cluster_mem_cap": f'sum(kube_node_status_capacity{{node=~"{WORKER_NODE_REGEX}", resource="memory"}}) / (1024*1024*1024)',
+    "cluster_pods_pending": f'sum(kube_pod_status_phase{{namespace="{POD_NAMESPACE}", phase="Pending"}}) or vector(0)',
+}
+
+# min / mean / max ภายใน 1 นาที (subquery ทุก SUB_MINUTE_INTERVAL วิ) = สิ่งที่ MinuteAggregator คำนวณตอน serving
+STAT_FUNCTIONS = {'min': 'min_over_time', 'mean': 'avg_over_time', 'max': 'max_over_time'}
+
+
+def aggregate_query(query, stat, window=MINUTE_STEP, resolution=SUB_MINUTE_INTERVAL):
+    return f'{STAT_FUNCTIONS[stat]}(({query})[{window}s:{resolution}s])'
+
+
+AGGREGATE_QUERIES = {f"{name}_{stat}": aggregate_query(FEATURE_QUERIES[name], stat)
+                     for name in AGGREGATE_FEATURES for stat in STATS}
+
+# ค่าที่ DecisionEngine ใช้ (ไม่ได้เข้าโมเดล)
+STATUS_QUERIES = {
+    "active_workers": f'sum(kube_node_status_condition{{node=~"{WORKER_NODE_REGEX}", condition="Ready", status="true"}})',
+    "cpu_usage_cores": f'sum(rate(container_cpu_usage_seconds_total{{node=~"{WORKER_NODE_REGEX}", container!="", image!=""}}[2m]))',
+    "running_pods": f'sum(kube_pod_status_phase{{namespace="{POD_NAMESPACE}", phase="Running"}}) or vector(0)',
+}
+
+SNAPSHOT_FIELDS = {
+    'cluster_cpu_req': 'cpu_req', 'cluster_cpu_cap': 'cpu_cap',
+    'cluster_mem_req': 'mem_req', 'cluster_mem_cap': 'mem_cap',
+    'cluster_pods_pending': 'pending', 'active_workers': 'active_workers',
+    'running_pods': 'running',
+}
+
+
+def combined_query(queries):
+    """ รวมหลาย PromQL เป็น instant query เดียว โดยติด label `feature` ให้แต่ละผลลัพธ์ """
+    parts = [f'label_replace(({q}), "feature", "{name}", "", "")' for name, q in queries.items()]
+    return " or ".join(parts)
+
+
+class PrometheusFeatureSource:
+    """
+    ดึง feature 5 ตัว (+ สถานะสำหรับ DecisionEngine) จาก Prometheus ด้วย instant query เดียวต่อรอบ
+    ผ่าน HTTP session แบบ keep-alive -> ค่าที่ serving เห็นตรงกับตอนเทรน (PromQL ชุดเดียวกัน)
+    คืนค่าเป็น CollectedSample แบบเดียวกับ AsyncCollector (field ที่ไม่มีผลลัพธ์ = ค่าเก่า + stale)
+    """
+
+    def __init__(self, url=PROMETHEUS_URL, timeout=QUERY_TIMEOUT, session=None):
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+        if session is None:
+            # pool พอสำหรับ query_range ของทุก feature พร้อมกันตอน backfill (session ที่ส่งมาเอง = ใช้ pool / retry ของผู้เรียก)
+            session = requests.Session()
+            pool_size = len(FEATURE_QUERIES) + len(AGGREGATE_QUERIES)
+            session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+        self.session = session
+        self.query = combined_query(dict(FEATURE_QUERIES, **STATUS_QUERIES))
+        self._last = {}     # feature -> ค่าล่าสุดที่ได้
+
+    def query_instant(self, at=None):
+        """ คืน {feature: float} จาก Prometheus 1 request (ไม่มี key = series นั้นไม่มีข้อมูล) """
+        params = {'query': self.query}
+        if at is not None:
+            params['time'] = at
+        resp = self.session.get(f"{self.url}/api/v1/query", params=params, timeout=self.timeout)
+        resp.raise_for_status()
+        body = resp.json()
+        if body.get('status') != 'success':
+            raise RuntimeError(f"Prometheus query failed: {body.get('error')}")
+        return {r['metric']['feature']: float(r['value'][1]) for r in body['data']['result']}
+
+    def query_range(self, query, start, end, step=BACKFILL_STEP):
+        """ คืน [(timestamp, float), ...] ของ series แรก (แบบเดียวกับ NewPromQL.py) ว่าง = ไม่มีข้อมูล """
+        params = {'query': query, 'start': start, 'end': end, 'step': step}
+        resp = self.session.get(f"{self.url}/api/v1/query_range", params=params, timeout=self.timeout)
+        resp.raise_for_status()
+        body = resp.json()
+        if body.get('status') != 'success':
+            raise RuntimeError(f"Prometheus query_range failed: {body.get('error')}")
+        result = body['data']['result']
+        return [(float(ts), float(v)) for ts, v in result[0]['values']] if result else []
+
+    def backfill(self, window_size, features=tuple(FEATURE_QUERIES), step=BACKFILL_STEP, now=None):
+        """
+        ดึงประวัติย้อนหลัง window_size นาทีของ feature ที่ระบุ (query_range พร้อมกันทุกตัว) แล้ววางลง grid ทุก step วินาที
+        features รับได้ทั้ง FEATURE_QUERIES และ AGGREGATE_QUERIES (เช่น 'cluster_pods_pending_max')
+        คืน (timestamps, rows) โดย rows มี shape (window_size, len(features)) เป็นค่าดิบ (ยังไม่ scale)
+        ช่องที่ไม่มี sample ใช้ค่าก่อนหน้า (ต้นช่วงใช้ค่าแรกที่มี) ถ้ามี feature ไหนไม่มีข้อมูลเลย คืนว่าง
+        """
+        now = time.time() if now is None else now
+        end = (now // step) * step
+        start = end - (window_size - 1) * step
+        timestamps = start + step * np.arange(window_size, dtype=np.float64)
+
+        with ThreadPoolExecutor(max_workers=len(features)) as pool:
+            queries = dict(FEATURE_QUERIES, **AGGREGATE_QUERIES)
+            series = list(pool.map(lambda name: self.query_range(queries[name], start, end, step), features))
+
+        rows = np.full((window_size, len(features)), np.nan)
+        for col, points in enumerate(series):
+            for ts, value in points:
+                idx = int(round((ts - start) / step))
+                if 0 <= idx < window_size:
+                    rows[idx, col] = value
+            observed = np.flatnonzero(~np.isnan(rows[:, col]))
+            if len(observed) == 0:
+                return np.empty(0), np.empty((0, len(features)))
+            # forward-fill: ช่องว่างใช้ค่าล่าสุดก่อนหน้า (ก่อน sample แรกใช้ sample แรก)
+            last_seen = np.maximum.accumulate(np.where(np.isnan(rows[:, col]), -1, np.arange(window_size)))
+            rows[:, col] = rows[np.where(last_seen < 0, observed[0], last_seen), col]
+        return timestamps, rows
+
+    def collect_sync(self):
+        errors = {}
+        try:
+            values = self.query_instant()
+        except (requests.RequestException, ValueError, KeyError, RuntimeError) as e:
+            values = {}
+            errors['prometheus'] = str(e)
+
+        fields, stale = {}, {}
+        for name in list(FEATURE_QUERIES) + list(STATUS_QUERIES):
+            if name in values:
+                self._last[name] = values[name]
+            stale[name] = name not in values
+        for name, field in SNAPSHOT_FIELDS.items():
+            value = self._last.get(name)
+            if value is not None and field in ('pending', 'active_workers', 'running'):
+                value = int(value)
+            fields[field] = value
+
+        usage, cap = self._last.get('cpu_usage_cores'), fields['cpu_cap']
+        fields['cpu_usage_pct'] = (usage / cap) * 100 if usage is not None and cap else None
+
+        snapshot = ClusterSnapshot(**fields)
+        stale_flags = {field: stale[name] for name, field in SNAPSHOT_FIELDS.items()}
+        stale_flags['cpu_usage_pct'] = stale['cpu_usage_cores'] or stale['cluster_cpu_cap']
+        return CollectedSample(snapshot, stale_flags, errors)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,134 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from cluster_snapshot import POD_NAMESPACE, build_snapshot
+from cluster_snapshot_unit_test import make_node, make_pod
+from prometheus_source import FEATURE_QUERIES, STATUS_QUERIES, PrometheusFeatureSource
+
+
+class FakePrometheus(BaseHTTPRequestHandler):
+    """
+    Prometheus จำลอง: ตอบ /api/v1/query ด้วยค่าคงที่ตาม label `feature` ที่อยู่ใน query
+    และ /api/v1/query_range ด้วย sample ใน range_series (เฉพาะช่วง start..end)
+    """
+
+    protocol_version = 'HTTP/1.1'
+    values = {
+        'cluster_cpu_req': '3.5', 'cluster_cpu_cap': '8', 'cluster_mem_req': '2.25',
+        'cluster_mem_cap': '15.5', 'cluster_pods_pending': '2',
+        'active_workers': '2', 'cpu_usage_cores': '4', 'running_pods': '7',
+    }
+    requests_seen = []
+    client_ports = set()
+    range_series = {}       # feature -> [(timestamp, value), ...]
+    range_delay = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)['query'][0]
+        FakePrometheus.requests_seen.append(query)
+        FakePrometheus.client_ports.add(self.client_address[1])
+        if url.path == '/api/v1/query_range':
+            params = parse_qs(url.query)
+            start, end = float(params['start'][0]), float(params['end'][0])
+            name = next(n for n, q in FEATURE_QUERIES.items() if q == query)
+            points = [[ts, str(v)] for ts, v in self.range_series.get(name, []) if start <= ts <= end]
+            result = [{'metric': {}, 'values': points}] if points else []
+            time.sleep(self.range_delay)
+            payload = json.dumps({'status': 'success', 'data': {'resultType': 'matrix', 'result': result}}).encode()
+        else:
+            result = [{'metric': {'feature': name}, 'value': [1700000000, value]}
+                      for name, value in self.values.items() if f'"feature", "{name}"' in query]
+            payload = json.dumps({'status': 'success', 'data': {'resultType': 'vector', 'result': result}}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def run_tests():
+    print("🚀 เริ่มการทดสอบ PrometheusFeatureSource (Unit Testing)\n" + "="*50)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakePrometheus)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    source = PrometheusFeatureSource(f"http://127.0.0.1:{server.server_port}")
+
+    try:
+        print("▶️ TEST 1: feature 5 ตัวด้วย PromQL ชุดเดียวกับตอนเทรน ใน request เดียว")
+        sample = source.collect_sync()
+        print(f"ผลลัพธ์ 🤖: {sample.snapshot}")
+        assert sample.snapshot.ai_features() == (3.5, 8.0, 2.25, 15.5, 2)
+        assert sample.snapshot.cpu_usage_pct == 50.0 and sample.snapshot.running == 7
+        assert len(FakePrometheus.requests_seen) == 1
+        assert all(q in FakePrometheus.requests_seen[0] for q in FEATURE_QUERIES.values())
+        print("ผลลัพธ์ ✅\n")
+
+        print("▶️ TEST 2: series หาย -> ใช้ค่าเก่า + stale, และใช้ connection เดิม")
+        del FakePrometheus.values['cpu_usage_cores']
+        sample = source.collect_sync()
+        assert sample.stale_fields() == ['cpu_usage_pct'] and sample.snapshot.cpu_usage_pct == 50.0
+        assert len(FakePrometheus.client_ports) == 1
+        print(f"ผลลัพธ์ 🤖: stale={sample.stale_fields()}\n")
+
+        print("▶️ TEST 3: Prometheus ล่ม -> errors + ทุก field stale")
+        down = PrometheusFeatureSource("http://127.0.0.1:1", timeout=0.5)
+        sample = down.collect_sync()
+        assert 'prometheus' in sample.errors and not sample.has_ai_features()
+        print(f"ผลลัพธ์ 🤖: {list(sample.errors)}\n")
+
+        print("▶️ TEST 4: backfill ย้อนหลัง 30 นาที -> grid 60s, 5 query พร้อมกัน, ช่องว่างใช้ค่าก่อนหน้า")
+        now = 1700003630.0                      # ไม่ตรงนาที -> end ต้องปัดลงเป็น 1700003580
+        end = 1700003580.0
+        grid = [end - 60 * i for i in range(29, -1, -1)]
+        FakePrometheus.range_series = {name: [(ts, float(i)) for i, ts in enumerate(grid)] for name in FEATURE_QUERIES}
+        FakePrometheus.range_series['cluster_cpu_req'] = [(ts, float(i)) for i, ts in enumerate(grid) if i not in (0, 1, 10)]
+        FakePrometheus.range_delay = 0.3
+        started = time.perf_counter()
+        timestamps, rows = source.backfill(30, now=now)
+        elapsed = time.perf_counter() - started
+        print(f"ผลลัพธ์ 🤖: rows={rows.shape} ใน {elapsed:.2f}s, cpu_req[:3]={rows[:3, 0].tolist()}, cpu_req[10]={rows[10, 0]}")
+        assert rows.shape == (30, 5) and timestamps[0] == grid[0] and timestamps[-1] == end
+        assert rows[:3, 0].tolist() == [2.0, 2.0, 2.0] and rows[10, 0] == 9.0 and rows[-1, 0] == 29.0
+        assert rows[:, 4].tolist() == [float(i) for i in range(30)]
+        assert elapsed < 0.3 * len(FEATURE_QUERIES) / 2       # ขนานกัน ไม่ใช่ 5 x 0.3s
+        FakePrometheus.range_delay = 0.0
+        print("ผลลัพธ์ ✅\n")
+
+        print("▶️ TEST 5: feature ที่ไม่มีข้อมูลเลย -> คืนว่าง (ไม่เติมค่าหลอก)")
+        del FakePrometheus.range_series['cluster_mem_cap']
+        _, missing = source.backfill(30, now=now)
+        _, single = source.backfill(30, features=('cluster_cpu_req',), now=now)
+        print(f"ผลลัพธ์ 🤖: 5 features={missing.shape}, cpu_req อย่างเดียว={single.shape}\n")
+        assert len(missing) == 0 and single.shape == (30, 1)
+
+        print("▶️ TEST 6: session ที่ส่งมาเองใช้ pool/retry เดิม | Pending/Running นับ namespace เดียวกับ kubernetes source")
+        session = requests.Session()
+        adapter = HTTPAdapter(max_retries=3)
+        session.mount('http://', adapter)
+        PrometheusFeatureSource(f"http://127.0.0.1:{server.server_port}", session=session)
+        assert session.get_adapter('http://x') is adapter
+        pods = [make_pod('a', None, phase='Pending'), make_pod('b', None, phase='Pending', namespace='kube-system')]
+        snap = build_snapshot([make_node('w1')], pods, namespace=POD_NAMESPACE)
+        print(f"ผลลัพธ์ 🤖: pending={snap.pending} | {FEATURE_QUERIES['cluster_pods_pending']}\n")
+        assert snap.pending == 1
+        assert f'namespace="{POD_NAMESPACE}"' in FEATURE_QUERIES['cluster_pods_pending']
+        assert f'namespace="{POD_NAMESPACE}"' in STATUS_QUERIES['running_pods']
+    finally:
+        source.close()
+        server.shutdown()
+
+    print("="*50 + "\n✅ ทดสอบเสร็จสิ้นทุกเงื่อนไข!")
+
+
+if __name__ == "__main__":
+    run_tests()
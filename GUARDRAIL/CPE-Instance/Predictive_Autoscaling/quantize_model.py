@@ -0,0 +1,111 @@
+import argparse
+import os
+
+import joblib
+import numpy as np
+
+from convert_model import tflite_converter, to_tflite
+from model_evaluation import median_latency_ms, predict_windows, regression_metrics, split_windows
+from model_runner import KerasRunner, TFLiteRunner, artifact_path
+
+# ==========================================
+# ⚙️ CONFIGURATION
+# ==========================================
+MODEL_PATH = 'Multi_Feature_Resource_Turn_Parameter/Multi-Variable_LSTM_Model.keras'
+SCALER_INPUTS_PATH = 'Multi_Feature_Resource_Turn_Parameter/Multi-Var_Scaler_Inputs.pkl'
+SCALER_TARGET_PATH = 'Multi_Feature_Resource_Turn_Parameter/Multi-Var_Scaler_Target.pkl'
+
+MODES = ('dynamic', 'int8')
+REPRESENTATIVE_SAMPLES = 300      # window จากชุด train สำหรับ calibrate ช่วงค่าของ activation (full-int8)
+
+# Gate: ไม่ผ่าน = ไม่เขียนไฟล์ (predictor จะโหลด backend นั้นไม่ได้ แทนที่จะทำนายแย่ลงแบบเงียบ ๆ)
+MAX_MAE_INCREASE = 0.05           # vCores เทียบกับโมเดล float
+MAX_THRESHOLD_ACC_DROP = 1.0      # percentage point ของ "within 10%" accuracy
+
+
+def representative_dataset(X_train, n=REPRESENTATIVE_SAMPLES):
+    """ window กระจายทั่วชุด train ทีละ 1 (ตรงกับ input shape (1, window, features) ของ serving) """
+    picks = np.linspace(0, len(X_train) - 1, num=min(n, len(X_train))).astype(int)
+
+    def generator():
+        for i in picks:
+            yield [X_train[i:i + 1].astype(np.float32)]
+    return generator
+
+
+def quantized_converter(model, mode, X_train):
+    import tensorflow as tf
+
+    converter = tflite_converter(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if mode == 'int8':
+        converter.representative_dataset = representative_dataset(X_train)
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+    return converter
+
+
+def gate(baseline, metrics, max_mae_increase, max_acc_drop):
+    """ คืน list เหตุผลที่ไม่ผ่าน (ว่าง = ผ่าน) """
+    reasons = []
+    if metrics['mae'] - baseline['mae'] > max_mae_increase:
+        reasons.append(f"MAE +{metrics['mae'] - baseline['mae']:.3f} vCores > {max_mae_increase}")
+    if baseline['threshold_acc'] - metrics['threshold_acc'] > max_acc_drop:
+        reasons.append(f"within-10% accuracy -{baseline['threshold_acc'] - metrics['threshold_acc']:.2f} pt > {max_acc_drop}")
+    return reasons
+
+
+def print_row(name, metrics, size_kb, latency_ms):
+    print(f"    {name:<10} MAE {metrics['mae']:.3f} vCores | RMSE {metrics['rmse']:.3f} | "
+          f"within 10% {metrics['threshold_acc']:6.2f}% | {size_kb:8.0f} KB | p50 {latency_ms:.3f} ms")
+
+
+def quantize(path=MODEL_PATH, modes=MODES, max_mae_increase=MAX_MAE_INCREASE, max_acc_drop=MAX_THRESHOLD_ACC_DROP):
+    splits = split_windows(SCALER_INPUTS_PATH, SCALER_TARGET_PATH)
+    X_train, _ = splits['train']
+    X_test, y_test = splits['test']
+    scaler_target = joblib.load(SCALER_TARGET_PATH)
+
+    float_runner = KerasRunner.load(path)
+    baseline = regression_metrics(y_test, predict_windows(float_runner, X_test), scaler_target)
+    print(f"📦 {path} | test windows: {len(X_test)}")
+    print_row('float32', baseline, os.path.getsize(path) / 1024, median_latency_ms(float_runner, X_test))
+
+    accepted = []
+    for mode in modes:
+        out_path = artifact_path(path, f'tflite-{mode}')
+        candidate = f"{out_path}.candidate"
+        try:
+            to_tflite(float_runner.model, candidate, quantized_converter(float_runner.model, mode, X_train))
+            runner = TFLiteRunner(candidate)
+            metrics = regression_metrics(y_test, predict_windows(runner, X_test), scaler_target)
+        except Exception as e:
+            print(f"    ❌ {mode:<8} แปลงไม่สำเร็จ: {e}")
+            if os.path.exists(candidate):
+                os.remove(candidate)
+            continue
+
+        print_row(mode, metrics, os.path.getsize(candidate) / 1024, median_latency_ms(runner, X_test))
+        reasons = gate(baseline, metrics, max_mae_increase, max_acc_drop)
+        if reasons:
+            os.remove(candidate)
+            if os.path.exists(out_path):
+                os.remove(out_path)       # ไฟล์รุ่นก่อนก็ไม่ควรถูกโหลดต่อ
+            print(f"       ❌ REJECTED: {'; '.join(reasons)}")
+        else:
+            os.replace(candidate, out_path)
+            accepted.append(out_path)
+            print(f"       ✅ ACCEPTED -> {out_path} (MODEL_BACKEND = 'tflite-{mode}')")
+    return accepted
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Quantize the multi-variable LSTM to TFLite and gate on test MAE / within-10% accuracy")
+    parser.add_argument('--model', default=MODEL_PATH)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--max-mae-increase', type=float, default=MAX_MAE_INCREASE)
+    parser.add_argument('--max-acc-drop', type=float, default=MAX_THRESHOLD_ACC_DROP)
+    args = parser.parse_args()
+
+    quantize(args.model, args.modes, args.max_mae_increase, args.max_acc_drop)
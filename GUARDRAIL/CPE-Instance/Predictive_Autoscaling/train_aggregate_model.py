@@ -0,0 +1,115 @@
+import argparse
+import os
+import time
+
+import joblib
+import numpy as np
+
+from affine_scaler import compile_scaler
+from horizons import save_horizons
+from minute_aggregator import MINUTE_STEP, aggregate_columns, save_feature_columns
+from model_evaluation import (FORECAST_HORIZON, TARGET_COLUMN, TRAIN_SPLIT, horizon_metrics, load_dataset, predict_windows,
+                              regression_metrics, split_windows)
+from model_runner import KerasRunner
+from prometheus_source import PROMETHEUS_URL, PrometheusFeatureSource
+from train_multi_horizon import BATCH_SIZE, EPOCHS, PATIENCE, build_model
+
+# ==========================================
+# ⚙️ CONFIGURATION (5 feature เดิม + min/mean/max ต่อนาทีของ CPU Req / Pending จาก subquery [1m:10s])
+# ==========================================
+DATASET_PATH = 'Aggregate_Feature_Resource/training_data_aggregate.csv'
+MODEL_PATH = 'Aggregate_Feature_Resource/Aggregate_LSTM_Model.keras'
+SCALER_INPUTS_PATH = 'Aggregate_Feature_Resource/Aggregate_Scaler_Inputs.pkl'
+SCALER_TARGET_PATH = 'Aggregate_Feature_Resource/Aggregate_Scaler_Target.pkl'
+CHUNK_MINUTES = 10000   # Prometheus คืนได้ไม่เกิน 11,000 จุดต่อ query_range -> แบ่งช่วงยาวเป็นก้อน
+
+
+def export_dataset(start, end, out_path=DATASET_PATH, columns=None, url=PROMETHEUS_URL):
+    """
+    ดึง dataset ทุก MINUTE_STEP วินาทีจาก Prometheus (query ชุดเดียวกับ serving) เขียนเป็น CSV แบบ training_data_prometheus.csv
+    จุดที่ไม่มีค่า = ค่าก่อนหน้า (ต้นช่วง = 0 เหมือน fillna(0) ของ NewPromQL.py)
+    """
+    columns = columns or aggregate_columns()
+    source = PrometheusFeatureSource(url)
+    start, end = (start // MINUTE_STEP) * MINUTE_STEP, (end // MINUTE_STEP) * MINUTE_STEP
+    timestamps = np.arange(start, end + MINUTE_STEP, MINUTE_STEP, dtype=np.float64)
+    rows = np.full((len(timestamps), len(columns)), np.nan)
+
+    for chunk_start in range(int(start), int(end) + 1, CHUNK_MINUTES * MINUTE_STEP):
+        chunk_end = min(chunk_start + (CHUNK_MINUTES - 1) * MINUTE_STEP, end)
+        n = int((chunk_end - chunk_start) // MINUTE_STEP) + 1
+        _, chunk = source.backfill(n, features=tuple(columns), step=MINUTE_STEP, now=chunk_end)
+        if len(chunk):
+            offset = int((chunk_start - start) // MINUTE_STEP)
+            rows[offset:offset + n] = chunk
+        print(f"⏳ {time.strftime('%Y-%m-%d %H:%M', time.localtime(chunk_end))} ({len(chunk)}/{n} นาที)")
+
+    for col in range(len(columns)):
+        last = 0.0
+        for i in range(len(rows)):
+            last = rows[i, col] = last if np.isnan(rows[i, col]) else rows[i, col]
+
+    os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+    np.savetxt(out_path, np.column_stack([timestamps, rows]), delimiter=',', fmt='%.6f',
+               header=','.join(['Timestamp'] + list(columns)), comments='')
+    print(f"✅ บันทึก {out_path} ({len(rows)} นาที x {len(columns)} คอลัมน์)")
+    return out_path
+
+
+def fit_scalers(path=DATASET_PATH, columns=None, target_column=TARGET_COLUMN):
+    """ MinMaxScaler เฉพาะช่วง train (ไม่เห็น val/test) แล้ว compile เป็น .affine.json ให้ serving """
+    from sklearn.preprocessing import MinMaxScaler
+
+    columns = columns or aggregate_columns()
+    rows = load_dataset(path, columns)
+    train_rows = rows[:int(len(rows) * TRAIN_SPLIT)]
+    scaler_inputs = MinMaxScaler().fit(train_rows)
+    scaler_target = MinMaxScaler().fit(train_rows[:, [columns.index(target_column)]])
+    os.makedirs(os.path.dirname(SCALER_INPUTS_PATH) or '.', exist_ok=True)
+    for scaler, scaler_path in ((scaler_inputs, SCALER_INPUTS_PATH), (scaler_target, SCALER_TARGET_PATH)):
+        joblib.dump(scaler, scaler_path)
+        compile_scaler(scaler_path)
+    return scaler_inputs, scaler_target
+
+
+def train(path=DATASET_PATH, horizons=None, epochs=EPOCHS, out_path=MODEL_PATH):
+    from tensorflow.keras.callbacks import EarlyStopping
+
+    columns = aggregate_columns()
+    _, scaler_target = fit_scalers(path, columns)
+    splits = split_windows(SCALER_INPUTS_PATH, SCALER_TARGET_PATH, path=path, columns=columns, horizons=horizons)
+    (X_train, y_train), (X_val, y_val), (X_test, y_test) = splits['train'], splits['val'], splits['test']
+    print(f"📦 train {X_train.shape} -> {y_train.shape} | features {columns}")
+
+    model = build_model(X_train.shape[1], X_train.shape[2], len(horizons) if horizons else 1)
+    model.fit(X_train, y_train, validation_data=(X_val, y_val), epochs=epochs, batch_size=BATCH_SIZE, verbose=1,
+              callbacks=[EarlyStopping(patience=PATIENCE, restore_best_weights=True)])
+    model.save(out_path)
+    save_feature_columns(out_path, columns)
+    if horizons:
+        save_horizons(out_path, horizons)
+
+    y_pred = predict_windows(KerasRunner(model), X_test)
+    metrics = (horizon_metrics(y_test, y_pred, scaler_target, horizons) if horizons
+               else {FORECAST_HORIZON: regression_metrics(y_test, y_pred, scaler_target)})
+    print(f"\n{'horizon':>8}{'MAE vCores':>12}{'RMSE':>9}{'within 10%':>12}")
+    for h, m in metrics.items():
+        print(f"{f'+{h}m':>8}{m['mae']:>12.3f}{m['rmse']:>9.3f}{m['threshold_acc']:>11.2f}%")
+    print(f"\n✅ บันทึก {out_path} ใช้ใน PredictorMulti.py: MODEL_PATH = '{out_path}'"
+          f" + SCALER_INPUTS_PATH / SCALER_TARGET_PATH = '{SCALER_INPUTS_PATH}' / '{SCALER_TARGET_PATH}'")
+    return model
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export per-minute min/mean/max features from Prometheus and train the LSTM on them")
+    parser.add_argument('--export-days', type=float, default=0, help="ดึง dataset ย้อนหลังกี่วันก่อนเทรน (0 = ใช้ CSV เดิม)")
+    parser.add_argument('--dataset', default=DATASET_PATH)
+    parser.add_argument('--horizons', nargs='*', type=int, default=None)
+    parser.add_argument('--epochs', type=int, default=EPOCHS)
+    parser.add_argument('--out', default=MODEL_PATH)
+    args = parser.parse_args()
+
+    if args.export_days:
+        now = time.time()
+        export_dataset(now - args.export_days * 86400, now, args.dataset)
+    train(args.dataset, tuple(args.horizons) if args.horizons else None, args.epochs, args.out)
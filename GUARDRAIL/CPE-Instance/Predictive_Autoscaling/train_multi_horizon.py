@@ -0,0 +1,68 @@
+import argparse
+
+import joblib
+
+from horizons import HORIZONS, save_horizons
+from model_evaluation import horizon_metrics, predict_windows, split_windows
+from model_runner import KerasRunner
+
+# ==========================================
+# ⚙️ CONFIGURATION (สถาปัตยกรรมเดียวกับ Multi_Variable_Old_UnC.ipynb ต่างแค่ Dense(len(HORIZONS)))
+# ==========================================
+MODEL_PATH = 'Multi_Feature_Resource_Turn_Parameter/Multi-Horizon_LSTM_Model.keras'
+SCALER_INPUTS_PATH = 'Multi_Feature_Resource_Turn_Parameter/Multi-Var_Scaler_Inputs.pkl'
+SCALER_TARGET_PATH = 'Multi_Feature_Resource_Turn_Parameter/Multi-Var_Scaler_Target.pkl'
+
+UNITS = 256
+DROPOUT = 0.2
+EPOCHS = 100
+BATCH_SIZE = 32
+PATIENCE = 10
+
+
+def build_model(window_size, n_features, n_outputs, units=UNITS):
+    from tensorflow.keras import Sequential
+    from tensorflow.keras.layers import LSTM, Dense, Dropout, Input
+
+    model = Sequential([
+        Input((window_size, n_features)),
+        LSTM(units, return_sequences=True),
+        Dropout(DROPOUT),
+        LSTM(units),
+        Dropout(DROPOUT),
+        Dense(n_outputs),           # 1 output ต่อ horizon -> ทุก horizon ใน forward pass เดียว
+    ])
+    model.compile(loss='mae', optimizer='adam')
+    return model
+
+
+def train(horizons=HORIZONS, epochs=EPOCHS, out_path=MODEL_PATH):
+    from tensorflow.keras.callbacks import EarlyStopping
+
+    splits = split_windows(SCALER_INPUTS_PATH, SCALER_TARGET_PATH, horizons=horizons)
+    (X_train, y_train), (X_val, y_val), (X_test, y_test) = splits['train'], splits['val'], splits['test']
+    print(f"📦 train {X_train.shape} -> {y_train.shape} | horizons {list(horizons)} นาที")
+
+    model = build_model(X_train.shape[1], X_train.shape[2], len(horizons))
+    model.fit(X_train, y_train, validation_data=(X_val, y_val), epochs=epochs, batch_size=BATCH_SIZE, verbose=1,
+              callbacks=[EarlyStopping(patience=PATIENCE, restore_best_weights=True)])
+    model.save(out_path)
+    save_horizons(out_path, horizons)
+
+    scaler_target = joblib.load(SCALER_TARGET_PATH)
+    y_pred = predict_windows(KerasRunner(model), X_test)
+    print(f"\n{'horizon':>8}{'MAE vCores':>12}{'RMSE':>9}{'within 10%':>12}")
+    for h, m in horizon_metrics(y_test, y_pred, scaler_target, horizons).items():
+        print(f"{f'+{h}m':>8}{m['mae']:>12.3f}{m['rmse']:>9.3f}{m['threshold_acc']:>11.2f}%")
+    print(f"\n✅ บันทึก {out_path} (+ {len(horizons)} horizons) ใช้ใน PredictorMulti.py: MODEL_PATH = '{out_path}'")
+    return model
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the multi-variable LSTM with one output per forecast horizon")
+    parser.add_argument('--horizons', nargs='+', type=int, default=list(HORIZONS))
+    parser.add_argument('--epochs', type=int, default=EPOCHS)
+    parser.add_argument('--out', default=MODEL_PATH)
+    args = parser.parse_args()
+
+    train(tuple(args.horizons), args.epochs, args.out)
@@ -1,6 +1,10 @@
-import subprocess
-import json
-import time
+import os
+import sys
+
+# ใช้ module กลางร่วมกับ Predictive_Autoscaling (KubeClient / cluster_snapshot)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Predictive_Autoscaling'))
+from kube_client import KubeError, get_client
+from cluster_snapshot import fetch_node_metrics, per_node_resources
 
 # --- CONFIG ---
 # ชื่อ Node จริงใน Cluster (ต้องตรงกับ kubectl get nodes)
@@ -10,108 +14,47 @@ NODES = {
     'worker2': 'aj-aung-k8s-worker2'
 }
 
-# --- HELPER FUNCTIONS ---
-def parse_k8s_value(value_str):
-    """
-    แปลงค่าจาก K8s ให้เป็นหน่วยมาตรฐานเดียวกับ Prometheus
-    - CPU: Cores (e.g., 100m -> 0.1)
-    - Memory: Bytes (e.g., 512Mi -> 536870912)
-    """
-    if not value_str: return 0.0
-    value_str = str(value_str).strip()
-    
-    try:
-        # --- จัดการ CPU (ต้องการหน่วย Core) ---
-        if value_str.endswith('m'): # millicores
-            return float(value_str.replace('m', '')) / 1000.0
-        
-        # --- จัดการ Memory (ต้องการหน่วย Bytes) ---
-        if value_str.endswith('Ki'):
-            return float(value_str.replace('Ki', '')) * 1024
-        if value_str.endswith('Mi'):
-            return float(value_str.replace('Mi', '')) * 1024 * 1024
-        if value_str.endswith('Gi'):
-            return float(value_str.replace('Gi', '')) * 1024 * 1024 * 1024
-        if value_str.endswith('Ti'):
-            return float(value_str.replace('Ti', '')) * 1024 * 1024 * 1024 * 1024
-            
-        # กรณีเป็นตัวเลขโดดๆ (มักจะเป็น Bytes อยู่แล้ว หรือ Cores อยู่แล้ว)
-        return float(value_str)
-    except:
-        return 0.0
-
-def run_cmd(cmd):
-    """รันคำสั่ง Shell และคืนค่า Output"""
-    try:
-        # redirect stderr to stdout เพื่อดักจับ Error "No resources found"
-        result = subprocess.check_output(cmd, shell=True, stderr=subprocess.STDOUT).decode('utf-8')
-        return result.strip()
-    except subprocess.CalledProcessError as e:
-        # กรณี Error (เช่น No resources found)
-        return e.output.decode('utf-8').strip()
-
 # --- MAIN LOGIC ---
-print("🔍 เริ่มตรวจสอบการดึงข้อมูลจาก Kubernetes...")
+print("🔍 เริ่มตรวจสอบการดึงข้อมูลจาก Kubernetes API...")
 print("-" * 60)
 
 data = {}
-
-# 1. เช็ค USAGE (kubectl top)
-print("\n[1/3] Checking Usage (kubectl top nodes)...")
-output_top = run_cmd("kubectl top nodes --no-headers")
-print(f"   📋 Output:\n{output_top}")
-
-if "No resources found" in output_top or not output_top:
+try:
+    client = get_client()
+    nodes = client.list_nodes()['items']
+    pods = client.list_pods()['items']
+except KubeError as e:
+    print(f"❌ ต่อ Kubernetes API ไม่ได้: {e}")
+    raise SystemExit(1)
+
+# 1. เช็ค USAGE (metrics-server)
+print("\n[1/3] Checking Usage (metrics.k8s.io/v1beta1/nodes)...")
+node_metrics = fetch_node_metrics(client)
+for item in node_metrics:
+    print(f"   📋 {item['metadata']['name']}: cpu={item['usage'].get('cpu')} memory={item['usage'].get('memory')}")
+if not node_metrics:
     print("   ⚠️ WARNING: ดึง Usage ไม่ได้ (Metrics Server อาจมีปัญหา)")
-else:
-    for line in output_top.splitlines():
-        parts = line.split()
-        if len(parts) >= 4:
-            node_name = parts[0]
-            data[f"usage_{node_name}_cpu"] = parse_k8s_value(parts[1])
-            data[f"usage_{node_name}_mem"] = parse_k8s_value(parts[3])
-
-# 2. เช็ค CAPACITY & REQUEST (kubectl describe)
+
+# 2. เช็ค CAPACITY & REQUEST (คำนวณจาก nodes list + pods list)
 print("\n[2/3] Checking Capacity & Requests...")
+resources = per_node_resources(nodes, pods, node_metrics)
 for key, node_name in NODES.items():
     print(f"   Testing Node: {node_name}...")
-    
-    # Cap
-    cmd_cap = f"kubectl get node {node_name} -o jsonpath='{{.status.capacity.cpu}} {{.status.capacity.memory}}'"
-    out_cap = run_cmd(cmd_cap)
-    if "Error" not in out_cap:
-        parts = out_cap.split()
-        data[f"cap_{node_name}_cpu"] = parse_k8s_value(parts[0])
-        data[f"cap_{node_name}_mem"] = parse_k8s_value(parts[1])
-    
-    # Req (ดึงจาก describe)
-    cmd_req = f"kubectl describe node {node_name} | grep -A 5 'Allocated resources' | tail -n 2"
-    out_req = run_cmd(cmd_req)
-    # output ปกติ:
-    #   cpu    250m (6%)
-    #   memory 500Mi (10%)
-    lines = out_req.splitlines()
-    if len(lines) >= 2:
-        try:
-            req_cpu_str = lines[0].strip().split()[1]
-            req_mem_str = lines[1].strip().split()[1]
-            data[f"req_{node_name}_cpu"] = parse_k8s_value(req_cpu_str)
-            data[f"req_{node_name}_mem"] = parse_k8s_value(req_mem_str)
-        except:
-            print(f"      ❌ Parse Error: {lines}")
+    if node_name not in resources:
+        print(f"      ❌ ไม่พบ Node {node_name} ใน Cluster")
+        continue
+    for res, value in resources[node_name].items():
+        metric, kind = res.split('_')          # cpu_req -> ('cpu', 'req')
+        data[f"{kind}_{node_name}_{metric}"] = value
+    print(f"      {resources[node_name]}")
 
 # 3. เช็ค PENDING PODS
 print("\n[3/3] Checking Pending Pods...")
-cmd_pend = "kubectl get pods -A --field-selector=status.phase=Pending --no-headers 2>&1" 
-# 2>&1 เพื่อดัก Error message
-raw_output = run_cmd(cmd_pend)
+pending_count = sum(1 for p in pods if (p.get('status') or {}).get('phase') == 'Pending')
 
-if "No resources found" in raw_output:
+if pending_count == 0:
     print("   ✅ Status: ไม่มี Pod ค้างอยู่เลย (Count = 0)")
-    pending_count = 0
 else:
-    # ถ้ามี output ให้นับบรรทัด
-    pending_count = len(raw_output.splitlines())
     print(f"   ⚠️ Status: เจอ Pod Pending จำนวน {pending_count} ตัว")
 
 # --- สรุปผลลัพธ์ (Feature Vector) ---